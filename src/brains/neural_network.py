@@ -16,6 +16,20 @@ class NeuralNetwork:
         for i in range(len(neuron_count) - 1):
             self.layers.append(Layer(neuron_count[i], neuron_count[i + 1]))
 
+    def load(self, data: dict) -> None:
+        """A method that extracts information from data.
+
+        Args:
+            data (dict): The given data.
+        """
+        self.layers = []
+        for layer_data in data["layers"]:
+            layer = Layer(layer_data["inputs_count"], layer_data["outputs_count"])
+            layer.biases = layer_data["biases"]
+            layer.weights = layer_data["weights"]
+            self.layers.append(layer)
+        self.layers_count = len(self.layers)
+
     def feedforward(self, inputs: list) -> list:
         """Feed given inputs to the network and calculate outputs.
 
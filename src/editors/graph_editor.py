@@ -7,7 +7,8 @@ from src.primitives.point import Point
 from src.primitives.segment import Segment
 from src.primitives.circle import Circle
 from src.maths.graph import Graph
-from src.maths.utils import nearest_point
+from src.renderers.primitive_renderer import draw_graph, draw_circle, draw_segment
+from src.renderers.item_renderer import draw_intersection
 
 
 class GraphEditor:
@@ -66,12 +67,13 @@ class GraphEditor:
             viewport (Viewport): The viewport of the application.
         """
         self.mouse_position = viewport.get_mouse(position, True)
-        self.hovered = nearest_point(
-            self.mouse_position, self.world.graph.points, 10 * viewport.zoom
+        self.hovered = self.world.graph.nearest_point(
+            self.mouse_position, 10 * viewport.zoom
         )
         if self.dragging:
-            self.selected.x = self.mouse_position.x
-            self.selected.y = self.mouse_position.y
+            self.world.graph.move_point(
+                self.selected, self.mouse_position.x, self.mouse_position.y
+            )
             self.world.generate_roads(
                 self.number_of_left_lanes, self.number_of_right_lanes, self.is_oneway
             )
@@ -107,23 +109,31 @@ class GraphEditor:
             painter (QPainter): The painter is used for drawing.
             zoom (float): The amount of zoom.
         """
-        self.world.graph.draw(painter, zoom)
+        draw_graph(painter, self.world.graph, zoom)
         if self.hovered:
-            Circle(self.hovered.x, self.hovered.y, zoom * 10).draw(
-                painter, QColor(0, 0, 0), outline_thickness=3 * zoom, transparency=0.6
+            draw_circle(
+                painter,
+                Circle(self.hovered.x, self.hovered.y, zoom * 10),
+                QColor(0, 0, 0),
+                outline_thickness=3 * zoom,
+                transparency=0.6,
             )
         for intersection in self.world.intersections:
-            intersection.draw(painter)
+            draw_intersection(painter, intersection)
         if self.selected:
             if self.hovered:
                 intent_point = self.hovered
             else:
                 intent_point = self.mouse_position
-            Circle(self.selected.x, self.selected.y, 7 * zoom).draw(
+            draw_circle(
                 painter,
+                Circle(self.selected.x, self.selected.y, 7 * zoom),
                 outline_thickness=3 * zoom,
                 outline_color=QColor(255, 255, 0),
             )
-            Segment(self.selected, intent_point).draw(
-                painter, 3 * zoom, dash_style=[3 * zoom, 3 * zoom]
+            draw_segment(
+                painter,
+                Segment(self.selected, intent_point),
+                3 * zoom,
+                dash_style=[3 * zoom, 3 * zoom],
             )
@@ -5,15 +5,26 @@ from src.editors.graph_editor import GraphEditor
 from src.majors.viewport import Viewport
 from src.markings.marking import Marking
 from src.primitives.point import Point
-from src.maths.utils import nearest_segment
+from src.primitives.polygon import Polygon
+from src.maths.spatial_index import SpatialIndex
+from src.renderers.marking_renderer import draw_marking
 
 
 class MarkingEditor:
-    """MarkingEditor is an abstract class for different marking editors."""
+    """MarkingEditor is an abstract class for different marking editors.
+
+    The target segments are put in a spatial index when the editor is made, so the editor has to
+    be made again when they change.
+    """
+
+    cell_size = 200
 
     def __init__(self, graph_editor: GraphEditor, target_segments: list) -> None:
         self.graph_editor = graph_editor
         self.target_segments = target_segments
+        self.segment_index = SpatialIndex(self.cell_size)
+        for segment in target_segments:
+            self.segment_index.insert(segment, segment.bounding_box())
         self.intent = None
 
     def disable(self) -> None:
@@ -50,9 +61,14 @@ class MarkingEditor:
         It is called whenever the mouse's right button is pressed inside the marking editor window.
         """
         mouse_position = viewport.get_mouse(position)
-        for marking in self.graph_editor.world.markings:
-            if marking.polygon.contains_point(mouse_position):
-                self.graph_editor.world.markings.remove(marking)
+        markings = self.graph_editor.world.markings
+        clicked = Polygon.polygons_contain_points(
+            [marking.polygon for marking in markings], [mouse_position]
+        )[:, 0]
+        if clicked.any():
+            markings[:] = [
+                marking for marking, inside in zip(markings, clicked) if not inside
+            ]
 
     def mouse_move(self, position: Point, viewport: Viewport) -> None:
         """The mouse_move method is an event handler.
@@ -63,7 +79,9 @@ class MarkingEditor:
             viewport (Viewport): The viewport of the application.
         """
         mouse_position = viewport.get_mouse(position, True)
-        segment = nearest_segment(mouse_position, self.target_segments)
+        segment = self.segment_index.nearest(
+            mouse_position, lambda segment: segment.distance_to_point(mouse_position)
+        )
         if segment:
             project = segment.project_point(mouse_position)
             if 0 <= project["offset"] <= 1:
@@ -81,4 +99,4 @@ class MarkingEditor:
             _ (None, optional): An unused argument that no matter. Defaults to None.
         """
         if self.intent:
-            self.intent.draw(painter)
+            draw_marking(painter, self.intent)
@@ -1,8 +1,6 @@
 """This module contains the Building class."""
 
 from typing import Self
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPainter, QColor
 from src.primitives.point import Point
 from src.primitives.polygon import Polygon
 
@@ -25,8 +23,8 @@ class Building:
         """
         return Building(Polygon([]).load(data.base), data.height)
 
-    def _preparing_to_draw(self, view_point: Point) -> tuple:
-        """preparing to draw the building. this method calculates and generates the sides, ceiling,
+    def prepare_to_draw(self, view_point: Point) -> tuple:
+        """Prepare to draw the building. This method calculates and generates the sides, ceiling,
         and roof of the building.
 
         Args:
@@ -86,38 +84,3 @@ class Building:
             key=lambda roof_polygon: roof_polygon.distance_to_point(view_point),
         )
         return sides, ceiling, roof_polygons
-
-    def draw(self, painter: QPainter, view_point: Point) -> None:
-        """Draw the building using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-            view_point (Point): The center of the viewport.
-        """
-        sides, ceiling, roofs = self._preparing_to_draw(view_point)
-        self.base.draw(
-            painter,
-            color=QColor(255, 255, 255),
-            outline_color=QColor(0, 0, 0, 20),
-            outline_width=20,
-        )
-        for side in sides:
-            side.draw(
-                painter,
-                color=QColor(255, 255, 255),
-                outline_color=QColor(170, 170, 170),
-            )
-        ceiling.draw(
-            painter,
-            color=QColor(255, 255, 255),
-            outline_color=QColor(255, 255, 255),
-            outline_width=6,
-        )
-        for roof in roofs:
-            roof.draw(
-                painter,
-                color=QColor(210, 60, 60),
-                outline_color=QColor(190, 50, 50),
-                outline_width=8,
-                join_style=Qt.PenJoinStyle.RoundJoin,
-            )
@@ -1,20 +1,32 @@
 """This module contains the Car class."""
 
+from typing import NamedTuple
 from math import pi, sqrt, atan2, sin, cos, radians, degrees
-from pathlib2 import Path
-from PyQt6.QtCore import Qt, QRect
-from PyQt6.QtGui import QPainter, QPixmap, QRegion, QBitmap, QColor
+import numpy as np
 from src.items.sensor import Sensor
 from src.primitives.point import Point
 from src.primitives.polygon import Polygon
 from src.brains.neural_network import NeuralNetwork
 from src.maths.utils import change_range, lerp
+from src.maths import kernel
+
+
+class CarPose(NamedTuple):
+    """CarPose is an immutable copy of what is needed to draw a car."""
+
+    x: float
+    y: float
+    angle: float
+    width: float
+    height: float
+    damaged: bool
 
 
 class Car:
     """Car class represents a car."""
 
     max_speed = 5
+    decision_interval = 1
 
     def __init__(
         self,
@@ -23,7 +35,7 @@ class Car:
         control_type: str = "user",
         width: float = 30,
         height: float = 50,
-        color: QColor = QColor(255, 0, 0),
+        color: tuple = (255, 0, 0),
     ) -> None:
         self.position = position
         self.width = width
@@ -37,6 +49,9 @@ class Car:
         self.acceleration = 0.2
         self.damaged = False
         self.fitness = 0
+        self.travelled = 0
+        self.decision_phase = 0
+        self.outputs = None
         if control_type != "dummy":
             self.sensor_count = 15
             self.sensor_spread = 160
@@ -50,13 +65,6 @@ class Car:
         else:
             self.use_brain = False
         self.polygon = self.create_polygon()
-        image = QPixmap(
-            str(Path(Path(__file__).parent.parent.parent, "asset/images/car.png"))
-        )
-        self.image = image.scaledToWidth(
-            self.width, Qt.TransformationMode.SmoothTransformation
-        )
-        self.mask = self.image.toImage().createAlphaMask()
 
     def update(self, road_borders: list) -> None:
         """Calculate the situation of the car.
@@ -65,40 +73,137 @@ class Car:
             road_borders (list): The borders of roads where cars get damaged.
         """
         if not self.damaged:
-            self.age += 1
-            self.move()
-            self.fitness += self.speed + change_range(self.age, 0, 10000, 0, 1)
-            self.polygon = self.create_polygon()
-            self.damaged = self.assess_damage(road_borders)
-            if self.sensors:
-                offsets = []
-                for i in range(self.sensor_count):
-                    if self.sensor_count == 1:
-                        t = 0.5
-                    else:
-                        t = i / (self.sensor_count - 1)
-                    sensor_angle = (
-                        lerp(self.sensor_spread / 2, -self.sensor_spread / 2, t)
-                        + self.angle
-                    )
-                    self.sensors[i].update(road_borders, sensor_angle, self.position)
-                    if self.sensors[i].read():
-                        offsets.append(self.sensors[i].read())
-                    else:
-                        offsets.append(0)
-                offsets.append(
-                    change_range(self.speed, -self.max_speed / 2, self.max_speed, -1, 1)
+            self.drive()
+            deciding = self.is_deciding()
+            self.perceive(road_borders, deciding)
+            self.think(deciding)
+
+    def drive(self) -> None:
+        """Move the car one tick forward and update its fitness."""
+        self.age += 1
+        self.move()
+        self.fitness += self.speed + change_range(self.age, 0, 10000, 0, 1)
+        self.travelled += self.speed
+
+    def is_deciding(self) -> bool:
+        """Check if the car senses and runs its brain in the current tick.
+
+        The car decides every decision_interval ticks, shifted by its decision_phase, and keeps
+        the last decision in between.
+
+        Returns:
+            bool: True if the car decides in the current tick otherwise False.
+        """
+        return (self.age + self.decision_phase) % self.decision_interval == 0
+
+    def perceive(
+        self,
+        road_borders: list,
+        sensing: bool = True,
+        border_array: np.ndarray | None = None,
+    ) -> None:
+        """Calculate the polygon, the damage and the sensor readings of the car at its current
+        position.
+
+        Args:
+            road_borders (list): The borders of roads where cars get damaged.
+            sensing (bool, optional): Whether to update the sensors too. Defaults to True.
+            border_array (np.ndarray | None, optional): The road borders packed by
+                Sensor.pack_borders. Defaults to packing them again.
+        """
+        self.polygon = self.create_polygon()
+        self.damaged = self.assess_damage(road_borders)
+        if sensing and self.sensors:
+            if border_array is None:
+                border_array = Sensor.pack_borders(road_borders)
+            for i in range(self.sensor_count):
+                if self.sensor_count == 1:
+                    t = 0.5
+                else:
+                    t = i / (self.sensor_count - 1)
+                sensor_angle = (
+                    lerp(self.sensor_spread / 2, -self.sensor_spread / 2, t)
+                    + self.angle
                 )
-                outputs = self.brain.feedforward(offsets)
-                if self.use_brain:
-                    if outputs[0]:
-                        self.accelerate_forward()
-                    if outputs[1]:
-                        self.accelerate_backward()
-                    if outputs[2]:
-                        self.turn_steering_wheel(degrees(0.03))
-                    if outputs[3]:
-                        self.turn_steering_wheel(degrees(-0.03))
+                self.sensors[i].aim(sensor_angle, self.position)
+            offsets, points = kernel.intersect_rays(
+                [
+                    (sensor.start.x, sensor.start.y, sensor.end.x, sensor.end.y)
+                    for sensor in self.sensors
+                ],
+                border_array,
+            )
+            for sensor, offset, point in zip(self.sensors, offsets, points):
+                sensor.detect(offset, point)
+
+    def perception_key(self) -> tuple:
+        """Get the state that the perception of the car depends on.
+
+        Cars with equal keys get equal polygons, damages and sensor readings.
+
+        Returns:
+            tuple: The key of the perception.
+        """
+        return (
+            self.position.x,
+            self.position.y,
+            self.angle,
+            self.width,
+            self.height,
+            self.sensor_count,
+            self.sensor_spread,
+            self.sensor_length,
+        )
+
+    def copy_perception(self, other: "Car", sensing: bool = True) -> None:
+        """Take over the perception of a car with the same perception key instead of calculating
+        it again.
+
+        Args:
+            other (Car): The car that has already perceived at the same state.
+            sensing (bool, optional): Whether to take over the sensor readings too. Defaults to
+                True.
+        """
+        self.polygon = other.polygon
+        self.damaged = other.damaged
+        if self.damaged:
+            self.speed = 0
+        if not sensing:
+            return
+        for sensor, other_sensor in zip(self.sensors, other.sensors):
+            sensor.angle = other_sensor.angle
+            sensor.start = self.position
+            sensor.end = other_sensor.end
+            sensor.intersect = other_sensor.intersect
+            sensor.offset = other_sensor.offset
+
+    def think(self, deciding: bool = True) -> None:
+        """Feed the sensor readings to the brain and apply its decisions.
+
+        Args:
+            deciding (bool, optional): Whether to run the brain or to apply the last decision.
+                Defaults to True.
+        """
+        if deciding and self.sensors:
+            offsets = []
+            for sensor in self.sensors:
+                if sensor.read():
+                    offsets.append(sensor.read())
+                else:
+                    offsets.append(0)
+            offsets.append(
+                change_range(self.speed, -self.max_speed / 2, self.max_speed, -1, 1)
+            )
+            self.outputs = list(self.brain.feedforward(offsets))
+        if self.use_brain and self.outputs:
+            if self.outputs[0]:
+                self.accelerate_forward()
+            if self.outputs[1]:
+                self.accelerate_backward()
+            if self.outputs[2]:
+                self.turn_steering_wheel(degrees(0.03))
+            if self.outputs[3]:
+                self.turn_steering_wheel(degrees(-0.03))
 
     def create_polygon(self) -> Polygon:
         """Create a polygon that the car fits into it.
@@ -186,25 +291,17 @@ class Car:
             if self.speed < -self.max_speed / 2:
                 self.speed = -self.max_speed / 2
 
-    def draw(self, painter: QPainter, transparency: float = 1):
-        """Draw the car using the given painter.
+    def pose(self) -> CarPose:
+        """Take an immutable copy of the current pose of the car.
 
-        Args:
-            painter (QPainter): The painter is used for drawing.
-            transparency (float, optional): The percentage of transparency.
-            0 means invisible and 1 means fully solid. Defaults to 1.
+        Returns:
+            CarPose: The pose of the car.
         """
-        rect = QRect(-self.width // 2, -self.height // 2, self.width, self.height)
-        painter.save()
-        painter.translate(self.position.x, self.position.y)
-        painter.rotate(self.angle)
-        painter.setOpacity(transparency)
-        painter.drawPixmap(rect, self.image)
-        if not self.damaged:
-            painter.setOpacity(1)
-            painter.translate(-self.width / 2, -self.height / 2)
-            painter.setClipRegion(QRegion(QBitmap.fromImage(self.mask)))
-            painter.setCompositionMode(painter.CompositionMode.CompositionMode_Multiply)
-            painter.translate(self.width / 2, self.height / 2)
-            painter.fillRect(rect, QColor(255, 0, 0))
-        painter.restore()
+        return CarPose(
+            self.position.x,
+            self.position.y,
+            self.angle,
+            self.width,
+            self.height,
+            self.damaged,
+        )
@@ -1,6 +1,5 @@
 """This module contains the Road class."""
 
-from PyQt6.QtGui import QPainter, QColor
 from src.primitives.segment import Segment
 from src.primitives.polygon import Polygon
 from src.primitives.envelope import Envelope
@@ -31,6 +30,7 @@ class Road:
         self.lane_width = lane_width
         self.width = self.lane_width * self.number_of_lanes
         self.segment = segment
+        self.geometry = (segment.start.x, segment.start.y, segment.end.x, segment.end.y)
         road_roundness = self.width // 10
         self.envelope = Envelope(self.segment, self.width, road_roundness)
         self.polygon = self.envelope.polygon
@@ -73,26 +73,15 @@ class Road:
         if len(self.lane_guides) == 4:
             self.lane_guides = [self.lane_guides[1], self.lane_guides[3]]
 
-    def draw(self, painter: QPainter) -> None:
-        """Draw the intersection area using the given painter.
+    def is_outdated(self) -> bool:
+        """Check if the ends of the segment of the road were moved after the road was built.
 
-        Args:
-            painter (QPainter): The painter is used for drawing.
+        Returns:
+            bool: True if the road has to be built again otherwise False.
         """
-        # self.envelope.draw(
-        #     painter,
-        #     color=QColor(51, 51, 51),
-        #     outline_width=15,
-        #     outline_color=QColor(51, 51, 51),
-        # )
-        # for segment in self.polygon.segments:
-        #     segment.draw(painter, color=QColor(255, 255, 255), width=5)
-        if self.middle_line:
-            self.middle_line.draw(painter, color=QColor(255, 255, 255), width=5)
-        for segment in self.middle_dashed_lines:
-            segment.draw(
-                painter,
-                color=QColor(255, 255, 255),
-                width=5,
-                dash_style=[5, 5],
-            )
+        return self.geometry != (
+            self.segment.start.x,
+            self.segment.start.y,
+            self.segment.end.x,
+            self.segment.end.y,
+        )
@@ -1,10 +1,18 @@
 """This module contains the Sensor class."""
 
-from math import sin, cos, radians
-from PyQt6.QtCore import Qt, QLineF
-from PyQt6.QtGui import QPainter, QPen, QColor
+from typing import NamedTuple
+from math import sin, cos, radians, isnan
+import numpy as np
 from src.primitives.point import Point
-from src.maths.utils import find_intersect
+from src.maths import kernel
+
+
+class SensorRay(NamedTuple):
+    """SensorRay is an immutable copy of what is needed to draw a sensor."""
+
+    start: Point
+    intersect: Point
+    end: Point
 
 
 class Sensor:
@@ -35,40 +43,72 @@ class Sensor:
             angle (float): The angle of the sensor.
             start_position (Point): The starting point of the sensor.
         """
+        self.aim(angle, start_position)
+        offsets, points = kernel.intersect_rays(
+            [(self.start.x, self.start.y, self.end.x, self.end.y)],
+            Sensor.pack_borders(road_borders),
+        )
+        self.detect(offsets[0], points[0])
+
+    def aim(self, angle: float, start_position: Point) -> None:
+        """Point the sensor to the given angle from the given position.
+
+        Args:
+            angle (float): The angle of the sensor.
+            start_position (Point): The starting point of the sensor.
+        """
         self.angle = angle
         self.start = start_position
         self.end = Point(
             self.start.x + sin(radians(angle)) * self.length,
             self.start.y - cos(radians(angle)) * self.length,
         )
-        touches = []
-        for border in road_borders:
-            touch = find_intersect(
-                self.start, self.end, border.points[0], border.points[1]
-            )
-            if touch:
-                touches.append(touch)
-        if touches:
-            offsets = []
-            for touch in touches:
-                offsets.append(touch["offset"])
-            self.offset = min(offsets)
-            for touch in touches:
-                if touch["offset"] == self.offset:
-                    self.intersect = Point(touch["x"], touch["y"])
-        else:
+
+    def detect(self, offset: float, point: tuple) -> None:
+        """Update the value of the sensor with the nearest touch along its ray.
+
+        Args:
+            offset (float): The offset of the touch along the ray, NaN if nothing is touched.
+            point (tuple): The x and y of the touch.
+        """
+        if isnan(offset):
             self.intersect = self.end
             self.offset = None
+        else:
+            self.offset = float(offset)
+            self.intersect = Point(float(point[0]), float(point[1]))
 
-    def draw(self, painter: QPainter):
-        """Draw the sensor using the given painter.
+    @staticmethod
+    def pack_borders(road_borders: list) -> np.ndarray:
+        """Pack the road borders in an array to sense them with the geometry kernel.
 
         Args:
-            painter (QPainter): The painter is used for drawing.
+            road_borders (list): The borders of roads where cars get damaged.
+
+        Returns:
+            np.ndarray: An N×4 array of the start and the end of every border.
+        """
+        return np.array(
+            [
+                (
+                    border.points[0].x,
+                    border.points[0].y,
+                    border.points[1].x,
+                    border.points[1].y,
+                )
+                for border in road_borders
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+
+    def ray(self) -> SensorRay:
+        """Take an immutable copy of the current ray of the sensor.
+
+        Returns:
+            SensorRay: The ray of the sensor.
         """
-        painter.setPen(QPen(QColor(0, 0, 0), 2, Qt.PenStyle.SolidLine))
-        line = QLineF(self.intersect.x, self.intersect.y, self.end.x, self.end.y)
-        painter.drawLine(line)
-        painter.setPen(QPen(QColor(255, 255, 0), 2, Qt.PenStyle.SolidLine))
-        line = QLineF(self.start.x, self.start.y, self.intersect.x, self.intersect.y)
-        painter.drawLine(line)
+        return SensorRay(
+            Point(self.start.x, self.start.y),
+            Point(self.intersect.x, self.intersect.y),
+            Point(self.end.x, self.end.y),
+        )
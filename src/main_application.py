@@ -1,9 +1,8 @@
 """This module contains the MainApplication class."""
 
-from math import degrees, inf
 from random import choice
 from PyQt6.QtWidgets import QWidget, QSizePolicy
-from PyQt6.QtCore import Qt, QTimer, QRect
+from PyQt6.QtCore import Qt, QTimer, QRect, QThread
 from PyQt6.QtGui import (
     QPaintEvent,
     QShowEvent,
@@ -20,6 +19,10 @@ from src.primitives.polygon import Polygon
 from src.majors.world import World
 from src.majors.viewport import Viewport
 from src.majors.minimap import Minimap
+from src.majors.fleet import Fleet
+from src.majors.simulation import Simulation
+from src.majors.lane_graph import LaneGraph
+from src.majors.traffic import Traffic
 from src.editors.graph_editor import GraphEditor
 from src.editors.cross_editor import CrossEditor
 from src.editors.park_editor import ParkEditor
@@ -29,6 +32,9 @@ from src.editors.target_editor import TargetEditor
 from src.editors.traffic_light_editor import TrafficLightEditor
 from src.editors.yield_editor import YieldEditor
 from src.maths.graph import Graph
+from src.renderers.item_renderer import draw_car_pose, draw_sensor_ray, draw_road
+from src.renderers.marking_renderer import draw_marking
+from src.renderers.world_renderer import draw_world
 from data.backups.viewport_backup import VIEWPORT_BACKUP
 
 
@@ -36,11 +42,13 @@ class MainApplication(QWidget):
     """The main application that is Inherited from QWidget."""
 
     number_of_ai_cars = 1
+    number_of_traffic_cars = 0
     w_is_pressed = False
     a_is_pressed = False
     s_is_pressed = False
     d_is_pressed = False
     frames_show_per_second = 30
+    base_timer_interval = 10
 
     def __init__(
         self,
@@ -54,6 +62,7 @@ class MainApplication(QWidget):
         self.setStyleSheet("QWidget{font-size:20px;}")
         self.application_mode = "run"
         self.clock_counter_variable = 0
+        self.speed_multiplier = 1.0
         self.world = World()
         self.editors = {
             "graph": GraphEditor(self.world),
@@ -66,13 +75,20 @@ class MainApplication(QWidget):
         self.editors["traffic_light_editor"] = TrafficLightEditor(self.editors["graph"])
         self.editors["yield_editor"] = YieldEditor(self.editors["graph"])
         self.active_editor = None
+        self.graph_version = self.editors["graph"].world.graph.version
+        self.markings_version = self.editors["graph"].world.markings.version
         self.road_borders = []
         for segment in self.world.road_borders:
             self.road_borders.append(Polygon([segment.start, segment.end]))
         self.viewport = None
         self.minimap = None
-        self.cars = []
-        self.best_car = None
+        self.simulation = Simulation(Fleet([], self.road_borders))
+        self.simulation_thread = QThread(self)
+        self.simulation.moveToThread(self.simulation_thread)
+        self.simulation_thread.started.connect(self.simulation.start)
+        self.simulation_thread.finished.connect(
+            self.simulation.stop, Qt.ConnectionType.DirectConnection
+        )
         self.base_timer = QTimer(self)
         self.base_timer.timeout.connect(self.run)
         self.graphic_timer = QTimer(self)
@@ -84,12 +100,24 @@ class MainApplication(QWidget):
     def start_timers(self) -> None:
         """Start timers of the application."""
         self.clock.start(1000)
-        self.base_timer.start(10)
+        self.base_timer.start(self.base_timer_interval)
         self.graphic_timer.start(round((1 / self.frames_show_per_second) * 1000))
+        self.simulation_thread.start()
+
+    def stop_timers(self) -> None:
+        """Stop timers of the application and wait for the simulation thread to finish."""
+        self.clock.stop()
+        self.base_timer.stop()
+        self.graphic_timer.stop()
+        self.simulation_thread.quit()
+        self.simulation_thread.wait()
 
     def clock_counter(self) -> None:
-        """Count every second."""
+        """Count every second and measure how fast the simulation ran during that second."""
         self.clock_counter_variable += 1
+        self.speed_multiplier = (
+            self.simulation.take_tick_count() * self.simulation.tick_interval / 1000
+        )
 
     def save(self) -> None:
         """Save the state of the application"""
@@ -102,24 +130,18 @@ class MainApplication(QWidget):
     def run(self) -> None:
         """A method that runs on base timer timeout and runs the base logic of the application."""
         if self.application_mode == "run":
-            if self.best_car.control_type == "user":
-                if self.w_is_pressed:
-                    self.best_car.accelerate_forward()
-                if self.a_is_pressed:
-                    self.best_car.turn_steering_wheel(degrees(-0.03))
-                if self.s_is_pressed:
-                    self.best_car.accelerate_backward()
-                if self.d_is_pressed:
-                    self.best_car.turn_steering_wheel(degrees(0.03))
-            best_fitness = -inf
-            for car in self.cars:
-                car.update(self.road_borders)
-                if car.fitness > best_fitness:
-                    best_fitness = car.fitness
-                    self.best_car = car
-            self.minimap.update(self.best_car)
+            self.simulation.controls = {
+                "forward": self.w_is_pressed,
+                "backward": self.s_is_pressed,
+                "left": self.a_is_pressed,
+                "right": self.d_is_pressed,
+            }
+            snapshot = self.simulation.snapshot
+            if snapshot.best_car is not None:
+                pose = snapshot.car_poses[snapshot.best_car]
+                self.minimap.update(Point(pose.x, pose.y))
         elif self.application_mode == "edit":
-            if self.editors["graph"].world.graph != self.world.graph:
+            if self.editors["graph"].world.graph.version != self.graph_version:
                 self.editors["graph"].world.generate_roads(
                     self.editors["graph"].number_of_left_lanes,
                     self.editors["graph"].number_of_right_lanes,
@@ -130,11 +152,18 @@ class MainApplication(QWidget):
                     self.editors["graph"].world.graph.segments,
                 )
                 self.minimap = Minimap(
-                    self.world.graph, self.best_car, self.width(), self.height()
+                    self.world.graph,
+                    self.simulation.fleet.best_car,
+                    self.width(),
+                    self.height(),
                 )
                 self.world.roads = self.editors["graph"].world.roads
-            elif self.editors["graph"].world.markings != self.world.markings:
+                self.graph_version = self.editors["graph"].world.graph.version
+            elif (
+                self.editors["graph"].world.markings.version != self.markings_version
+            ):
                 self.world = self.editors["graph"].world
+                self.markings_version = self.editors["graph"].world.markings.version
             pos = QCursor.pos()
             pos = self.mapFromGlobal(pos)
             if pos != self._cursor:
@@ -154,16 +183,19 @@ class MainApplication(QWidget):
             if signal == "application_mode":
                 self.application_mode = value
                 if value == "run":
-                    self.set_to_start()
                     self.world.generate()
                     self.road_borders.clear()
                     for segment in self.world.road_borders:
                         self.road_borders.append(Polygon([segment.start, segment.end]))
+                    self.set_to_start()
+                    self.simulation.running = True
                 elif value == "edit":
+                    self.simulation.running = False
                     self.signals({"editor_mode": "graph"})
             elif signal == "editor_mode":
                 if value == "graph":
                     self.editors["graph"] = GraphEditor(self.world)
+                    self.graph_version = self.editors["graph"].world.graph.version
                     self.editors["graph"].world.generate_roads(
                         self.editors["graph"].number_of_left_lanes,
                         self.editors["graph"].number_of_right_lanes,
@@ -174,6 +206,7 @@ class MainApplication(QWidget):
                         self.editors["graph"].world.markings = self.editors[
                             self.active_editor
                         ].world.markings
+                    self.markings_version = self.editors["graph"].world.markings.version
                     self.active_editor = "graph"
                 elif value == "cross_editor":
                     self.editors["cross_editor"] = CrossEditor(self.editors["graph"])
@@ -204,6 +237,14 @@ class MainApplication(QWidget):
                 self.editors["graph"].number_of_right_lanes = value
             elif signal == "graph_editor_set_oneway_road":
                 self.editors["graph"].is_oneway = value
+            elif signal == "fast_forward":
+                self.simulation.fast_forward = value
+            elif signal == "tick_budget":
+                self.simulation.tick_budget = value
+            elif signal == "number_of_traffic_cars":
+                self.number_of_traffic_cars = value
+                if self.application_mode == "run":
+                    self.set_to_start()
 
     def disable_editors(self) -> None:
         """Disable the functionality of all editors."""
@@ -212,10 +253,18 @@ class MainApplication(QWidget):
 
     def set_to_start(self) -> None:
         """Setup the application parameter to start running."""
-        self.cars = self.generate_cars(self.number_of_ai_cars)
-        for car in self.cars:
+        cars = self.generate_cars(self.number_of_ai_cars)
+        for car in cars:
             car.update([])
-        self.best_car = self.cars[0]
+        traffic = None
+        if self.number_of_traffic_cars:
+            lane_graph = LaneGraph(self.world)
+            lane_graph.refresh()
+            traffic = Traffic(lane_graph)
+            traffic.keep_clear = [car.position for car in cars]
+            traffic.spawn(self.number_of_traffic_cars)
+        self.simulation.reset(Fleet(cars, self.road_borders, traffic=traffic))
+        self.simulation.running = self.application_mode == "run"
 
     def generate_cars(self, count: int) -> list:
         """Generate a list of cars as many as the given count.
@@ -235,11 +284,7 @@ class MainApplication(QWidget):
             start_point = Point(self.width() / 2 - 120, self.height() / 2)
             start_angle = 0
             if start_markings:
-                start_marking = choice(start_markings)
-                start_point = Point(
-                    start_marking.center_of_segment.x, start_marking.center_of_segment.y
-                )
-                start_angle = degrees(start_marking.direction_of_segment.angle()) - 90
+                start_point, start_angle = choice(start_markings).pose()
             cars.append(Car(start_point, start_angle, "ai"))
         return cars
 
@@ -321,7 +366,10 @@ class MainApplication(QWidget):
             self.viewport = Viewport(self.width() / 2, self.height() / 2)
         self.set_to_start()
         self.minimap = Minimap(
-            self.world.graph, self.best_car, self.width(), self.height()
+            self.world.graph,
+            self.simulation.fleet.best_car,
+            self.width(),
+            self.height(),
         )
         super().resizeEvent(event)
         self.start_timers()
@@ -339,17 +387,31 @@ class MainApplication(QWidget):
         view_point = self.viewport.get_offset().scale(-1)
         self.viewport.reset(painter_1, self.rect())
         if self.application_mode == "run":
-            self.world.draw(painter_1, view_point)
-            for sensor in self.best_car.sensors:
-                sensor.draw(painter_1)
-            for car in self.cars:
-                car.draw(painter_1, 0.15)
-            self.best_car.draw(painter_1)
+            top_left = self.viewport.get_mouse(Point(0, 0), True)
+            bottom_right = self.viewport.get_mouse(
+                Point(self.width(), self.height()), True
+            )
+            self.simulation.view_box = (
+                top_left.x,
+                top_left.y,
+                bottom_right.x,
+                bottom_right.y,
+            )
+            snapshot = self.simulation.snapshot
+            draw_world(painter_1, self.world, view_point)
+            for ray in snapshot.sensor_rays:
+                draw_sensor_ray(painter_1, ray)
+            for pose in snapshot.traffic_poses:
+                draw_car_pose(painter_1, pose)
+            for pose in snapshot.car_poses:
+                draw_car_pose(painter_1, pose, 0.15)
+            if snapshot.best_car is not None:
+                draw_car_pose(painter_1, snapshot.car_poses[snapshot.best_car])
         elif self.application_mode == "edit":
             for road in self.editors["graph"].world.roads:
-                road.draw(painter_1)
+                draw_road(painter_1, road)
             for marking in self.editors["graph"].world.markings:
-                marking.draw(painter_1)
+                draw_marking(painter_1, marking)
             self.editors[self.active_editor].draw(painter_1, self.viewport.zoom)
         painter_2 = QPainter(self)
         self.minimap.draw(painter_2, view_point)
@@ -359,4 +421,10 @@ class MainApplication(QWidget):
             Qt.AlignmentFlag.AlignLeft,
             f"{hours:02d} : {minutes:02d} : {seconds:02d}",
         )
+        if self.application_mode == "run":
+            painter_2.drawText(
+                QRect(40, 60, 400, 30),
+                Qt.AlignmentFlag.AlignLeft,
+                f"x{self.speed_multiplier:.1f}",
+            )
         super().paintEvent(event)
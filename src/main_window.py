@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QKeyEvent
+from PyQt6.QtGui import QIcon, QKeyEvent, QCloseEvent
 from src.main_application import MainApplication
 
 
@@ -65,6 +65,21 @@ class MainWindow(QWidget):
         self.application_mode_button.clicked.connect(self.change_application_mode)
         self.application_mode_button.setMaximumWidth(30)
         self.application_mode_layout.addWidget(self.application_mode_button)
+        self.fast_forward_button = QPushButton("⏩")
+        self.fast_forward_button.clicked.connect(self.toggle_fast_forward)
+        self.fast_forward_button.setMaximumWidth(30)
+        self.fast_forward_button.setToolTip("Fast forward")
+        self.application_mode_layout.addWidget(self.fast_forward_button)
+        self.number_of_traffic_cars = QDoubleSpinBox()
+        self.number_of_traffic_cars.setDecimals(0)
+        self.number_of_traffic_cars.setRange(0, 500)
+        self.number_of_traffic_cars.setSingleStep(10)
+        self.number_of_traffic_cars.setValue(0)
+        self.number_of_traffic_cars.setToolTip("Number of traffic cars")
+        self.number_of_traffic_cars.valueChanged.connect(
+            self.change_number_of_traffic_cars
+        )
+        self.application_mode_layout.addWidget(self.number_of_traffic_cars)
         self.application_mode_layout.setAlignment(
             Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
         )
@@ -229,6 +244,24 @@ class MainWindow(QWidget):
             }
         )
 
+    def change_number_of_traffic_cars(self) -> None:
+        """Restart the cars with the number of traffic cars in the number_of_traffic_cars
+        spin box."""
+        self.main_application.signals(
+            {"number_of_traffic_cars": int(self.number_of_traffic_cars.value())}
+        )
+
+    def toggle_fast_forward(self) -> None:
+        """Toggle the fast forward mode when the fast_forward_button is clicked."""
+        if self.main_application.simulation.fast_forward:
+            self.fast_forward_button.setStyleSheet("")
+            self.main_application.signals({"fast_forward": False})
+        else:
+            self.fast_forward_button.setStyleSheet(
+                "QPushButton{background-color:#555555;}"
+            )
+            self.main_application.signals({"fast_forward": True})
+
     def toggle_edit_mode(self) -> None:
         """toggle the graph editor mode when the edit_mode_button is clicked."""
         if self.edit_mode_button.text() == "⬆":
@@ -395,6 +428,16 @@ class MainWindow(QWidget):
         )
         self.main_application.signals({"editor_mode": "park_editor"})
 
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        """The closeEvent method is an event handler.
+        It activates when the window is closed.
+
+        Args:
+            event (QCloseEvent | None): An instance contains event information.
+        """
+        self.main_application.stop_timers()
+        super().closeEvent(event)
+
     def keyPressEvent(self, event: QKeyEvent | None) -> None:
         """The keyPressEvent method is an event handler.
         It activates when keys on the keyboard are pressed.
@@ -0,0 +1,253 @@
+"""This module contains the DistanceField class."""
+
+from heapq import heappush, heappop
+from math import floor, inf
+import numpy as np
+from src.primitives.point import Point
+from src.maths.graph import Graph
+from src.majors.world import World
+from src.majors.router import Router
+
+
+class DistanceField:
+    """DistanceField class keeps the distance along the roads from every cell of a grid over
+    the drivable area of a world to the nearest target marking, so the progress of a car is
+    found with one lookup instead of a route search.
+
+    The field is built again whenever the version of the graph or of the markings of the world
+    changes. A cell where roads overlap takes the distance of the road whose segment is nearest
+    to the middle of the cell, the same road a route from there would start on. Cells off the
+    roads, and cells from which no target can be reached, are inf.
+    """
+
+    cell_size = 10
+    reach_distance = 25
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        self.router = Router(world)
+        self.version = None
+        self.origin = (0, 0)
+        self.distances = np.full((0, 0), inf)
+        self.gaps = np.full((0, 0), inf)
+
+    def refresh(self) -> None:
+        """Build the field again if the graph or the markings of the world have changed since
+        the last call."""
+        self.router.refresh()
+        if self.router.version == self.version:
+            return
+        self.version = self.router.version
+        roads = self.world.roads
+        targets = [
+            self.router.anchor(marking.center_of_segment)
+            for marking in self.world.markings
+            if marking.type == "target"
+        ]
+        targets = [target for target in targets if target is not None]
+        if not roads or not targets:
+            self.origin = (0, 0)
+            self.distances = np.full((0, 0), inf)
+            self.gaps = np.full((0, 0), inf)
+            return
+        node_distances = self.find_node_distances(targets)
+        boxes = np.array(
+            [road.segment.bounding_box() for road in roads], dtype=np.float64
+        )
+        margin = max(road.width for road in roads) / 2
+        first_column = floor((boxes[:, 0].min() - margin) / self.cell_size)
+        first_row = floor((boxes[:, 1].min() - margin) / self.cell_size)
+        last_column = floor((boxes[:, 2].max() + margin) / self.cell_size)
+        last_row = floor((boxes[:, 3].max() + margin) / self.cell_size)
+        self.origin = (first_column, first_row)
+        self.distances = np.full(
+            (last_row - first_row + 1, last_column - first_column + 1), inf
+        )
+        self.gaps = np.full(self.distances.shape, inf)
+        for road in roads:
+            self.fill_road(road, node_distances, targets)
+
+    def find_node_distances(self, targets: list) -> dict:
+        """Find the distance along the roads from every point of the graph to the nearest
+        target with Dijkstra over the reversed roads.
+
+        Args:
+            targets (list): The anchors of the target markings on the roads.
+
+        Returns:
+            dict: The distances keyed by point keys. Points that cannot reach a target are left
+                out.
+        """
+        incoming = {}
+        for key, edges in self.router.edges.items():
+            for neighbor, length in edges:
+                incoming.setdefault(neighbor, []).append((key, length))
+        distances = {}
+        queue = []
+        for target in targets:
+            segment = target["road"].segment
+            length = segment.length()
+            heappush(queue, (length * target["offset"], Graph.point_key(segment.start)))
+            if not target["road"].is_oneway:
+                heappush(
+                    queue, (length * (1 - target["offset"]), Graph.point_key(segment.end))
+                )
+        while queue:
+            distance, key = heappop(queue)
+            if key in distances:
+                continue
+            distances[key] = distance
+            for neighbor, length in incoming.get(key, ()):
+                if neighbor not in distances:
+                    heappush(queue, (distance + length, neighbor))
+        return distances
+
+    def fill_road(self, road: object, node_distances: dict, targets: list) -> None:
+        """Write the distances of the cells on the given road into the field. A cell already
+        written by another road is taken over if its middle is nearer to the segment of this
+        road, and keeps the smaller distance if it is as near to both.
+
+        Args:
+            road (Road): The road to fill.
+            node_distances (dict): The distances of the points of the graph to the nearest target.
+            targets (list): The anchors of the target markings on the roads.
+        """
+        if road.segment.length() == 0:
+            return
+        window, xs, ys = self.cells_around(road.segment, road.width / 2)
+        along, gap = self.project(road.segment, xs, ys)
+        distances = self.road_distances(road, along, node_distances, targets)
+        gaps = self.gaps[window]
+        on_road = gap <= road.width / 2
+        nearer = on_road & (gap < gaps)
+        tied = on_road & (gap == gaps)
+        field = self.distances[window]
+        field[tied] = np.minimum(field[tied], distances[tied])
+        field[nearer] = distances[nearer]
+        gaps[nearer] = gap[nearer]
+
+    def cells_around(self, segment: object, radius: float) -> tuple:
+        """Find the cells of the field within the bounding box of the given segment grown by
+        the given radius.
+
+        Args:
+            segment (Segment): The segment to find the cells around.
+            radius (float): How far around the segment to look.
+
+        Returns:
+            tuple: The window of the field as a pair of slices, and the x and the y coordinates
+                of the middles of the cells in the window.
+        """
+        box = np.array(segment.bounding_box()) + (-radius, -radius, radius, radius)
+        first_column, first_row, last_column, last_row = (
+            np.floor(box / self.cell_size).astype(np.int64) - (*self.origin, *self.origin)
+        ).tolist()
+        columns = np.arange(first_column, last_column + 1) + self.origin[0]
+        rows = np.arange(first_row, last_row + 1) + self.origin[1]
+        xs, ys = np.meshgrid((columns + 0.5) * self.cell_size, (rows + 0.5) * self.cell_size)
+        window = (
+            slice(first_row, last_row + 1),
+            slice(first_column, last_column + 1),
+        )
+        return window, xs, ys
+
+    @staticmethod
+    def project(segment: object, xs: np.ndarray, ys: np.ndarray) -> tuple:
+        """Project the given points on the given segment.
+
+        Args:
+            segment (Segment): The segment to project on.
+            xs (np.ndarray): The x coordinates of the points.
+            ys (np.ndarray): The y coordinates of the points.
+
+        Returns:
+            tuple: The distances of the projections from the start of the segment, and the
+                distances of the points from the segment.
+        """
+        length = segment.length()
+        dx = (segment.end.x - segment.start.x) / length
+        dy = (segment.end.y - segment.start.y) / length
+        along = (xs - segment.start.x) * dx + (ys - segment.start.y) * dy
+        across = np.abs((ys - segment.start.y) * dx - (xs - segment.start.x) * dy)
+        clamped = np.clip(along, 0, length)
+        return clamped, np.hypot(along - clamped, across)
+
+    @staticmethod
+    def road_distances(
+        road: object, along: np.ndarray, node_distances: dict, targets: list
+    ) -> np.ndarray:
+        """Find the distances to the nearest target from the given places along a road.
+
+        Args:
+            road (Road): The road the places are on.
+            along (np.ndarray): The distances of the places from the start of the segment.
+            node_distances (dict): The distances of the points of the graph to the nearest target.
+            targets (list): The anchors of the target markings on the roads.
+
+        Returns:
+            np.ndarray: The distances, inf where no target can be reached.
+        """
+        segment = road.segment
+        length = segment.length()
+        end_distance = node_distances.get(Graph.point_key(segment.end), inf)
+        distances = length - along + end_distance
+        if not road.is_oneway:
+            start_distance = node_distances.get(Graph.point_key(segment.start), inf)
+            distances = np.minimum(distances, along + start_distance)
+        for target in targets:
+            if target["road"] is not road:
+                continue
+            remaining = target["offset"] * length - along
+            if road.is_oneway:
+                remaining = np.where(remaining >= 0, remaining, inf)
+            distances = np.minimum(distances, np.abs(remaining))
+        return distances
+
+    def has_targets(self) -> bool:
+        """Check if the field was built from at least one target marking on a road.
+
+        Returns:
+            bool: True if the field has any cells otherwise False.
+        """
+        return self.distances.size > 0
+
+    def reachable_starts(self) -> list:
+        """Find the start markings that have a route to at least one target marking, leaving in
+        the direction they face.
+
+        Returns:
+            list: The start markings in the order of the markings of the world.
+        """
+        starts = {}
+        for (start, _), route in self.router.route_table().items():
+            if route is not None:
+                starts.setdefault(id(start), start)
+        return list(starts.values())
+
+    def distance_at(self, point: Point) -> float:
+        """Get the distance along the roads from the given point to the nearest target.
+
+        Args:
+            point (Point): The point to look up.
+
+        Returns:
+            float: The distance, or inf if the point is off the roads or no target can be
+                reached from it.
+        """
+        column = floor(point.x / self.cell_size) - self.origin[0]
+        row = floor(point.y / self.cell_size) - self.origin[1]
+        rows, columns = self.distances.shape
+        if 0 <= row < rows and 0 <= column < columns:
+            return float(self.distances[row, column])
+        return inf
+
+    def has_reached(self, point: Point) -> bool:
+        """Check if the given point is within reach_distance of a target along the roads.
+
+        Args:
+            point (Point): The point to check.
+
+        Returns:
+            bool: True if a target is reached otherwise False.
+        """
+        return self.distance_at(point) <= self.reach_distance
@@ -0,0 +1,238 @@
+"""This module contains the Fleet class."""
+
+from math import hypot, inf
+import numpy as np
+from src.items.sensor import Sensor
+from src.primitives.polygon import Polygon
+from src.majors.distance_field import DistanceField
+from src.majors.traffic import Traffic
+
+
+class Fleet:
+    """Fleet class represents a group of cars that drive between the same road borders.
+
+    Only active cars are updated. A car retires from the active cars when it gets damaged or,
+    if it is driven by a brain, when it travels less than stall_distance during a window of
+    stall_window ticks. Retired cars keep their final state, so they can still be drawn and
+    compared for the best car.
+
+    Cars that share a perception key in a tick, like the cars that spawn together on a start
+    marking, perceive the road borders only once.
+
+    If traffic is given, it is stepped with the fleet, and the edges of the traffic cars within
+    sensor reach of a car are borders for that car too, so it gets damaged when it hits one and
+    its sensors see them.
+
+    If a distance field is given, the fitness of a car is only how much nearer to a target it
+    got along the roads since it started, and a car that reaches a target retires. Where the
+    field has no distance, a car keeps the progress of the last place that had one.
+    """
+
+    stall_window = 500
+    stall_distance = 20
+
+    def __init__(
+        self,
+        cars: list,
+        road_borders: list,
+        distance_field: DistanceField | None = None,
+        traffic: Traffic | None = None,
+    ) -> None:
+        self.cars = cars
+        self.road_borders = road_borders
+        self.border_array = Sensor.pack_borders(road_borders)
+        self.active_cars = list(cars)
+        self.best_car = None
+        if self.cars:
+            self.best_car = self.cars[0]
+        self.best_retired_car = None
+        self.marks = {}
+        for car in self.cars:
+            self.marks[id(car)] = car.travelled
+        self.distance_field = distance_field
+        self.start_distances = {}
+        self.progress = {}
+        if distance_field:
+            distance_field.refresh()
+            for car in self.cars:
+                self.start_distances[id(car)] = distance_field.distance_at(car.position)
+                self.progress[id(car)] = 0
+        self.traffic = traffic
+        self.age = 0
+
+    def schedule_decisions(self, interval: int, staggered: bool = False) -> None:
+        """Let the cars of the fleet sense and run their brains only every interval ticks.
+
+        Args:
+            interval (int): The number of ticks between two decisions of a car.
+            staggered (bool, optional): Whether to spread the decisions of the cars evenly over
+                the ticks of the interval instead of letting all cars decide in the same tick.
+                Defaults to False.
+
+        Raises:
+            ValueError: If the interval is less than 1.
+        """
+        if interval < 1:
+            raise ValueError(f"The decision interval must be at least 1, got {interval}.")
+        for i, car in enumerate(self.cars):
+            car.decision_interval = interval
+            if staggered:
+                car.decision_phase = i % interval
+            else:
+                car.decision_phase = 0
+
+    def is_finished(self) -> bool:
+        """Check if all cars of the fleet are retired.
+
+        Returns:
+            bool: True if no car is active anymore otherwise False.
+        """
+        return not self.active_cars
+
+    def update(self) -> None:
+        """Advance every active car of the fleet by one tick, retire damaged and stalled cars,
+        and find the best car."""
+        self.age += 1
+        if self.traffic:
+            self.traffic.step()
+        obstacles = self.find_obstacles()
+        check_stall = self.age % self.stall_window == 0
+        retired = False
+        best_car = self.best_retired_car
+        best_fitness = -inf
+        if best_car:
+            best_fitness = best_car.fitness
+        perceivers = {}
+        for car in self.active_cars:
+            car.drive()
+            deciding = car.is_deciding()
+            self.perceive(car, deciding, perceivers, obstacles)
+            car.think(deciding)
+            arrived = self.distance_field is not None and self.track_progress(car)
+            if car.fitness > best_fitness:
+                best_fitness = car.fitness
+                best_car = car
+            if arrived:
+                car.speed = 0
+                self.retire(car)
+                retired = True
+            elif check_stall and not car.damaged and car.use_brain:
+                if car.travelled - self.marks[id(car)] < self.stall_distance:
+                    car.speed = 0
+                    self.retire(car)
+                    retired = True
+                else:
+                    self.marks[id(car)] = car.travelled
+            elif car.damaged:
+                self.retire(car)
+                retired = True
+        if retired:
+            self.active_cars = [car for car in self.active_cars if id(car) in self.marks]
+        if best_car:
+            self.best_car = best_car
+
+    def perceive(self, car, deciding: bool, perceivers: dict, obstacles: tuple) -> None:
+        """Let the given car perceive its borders, or take over the perception of a car that
+        has already perceived at the same state in this tick.
+
+        Args:
+            car (Car): The car to perceive.
+            deciding (bool): Whether the car decides in this tick and needs its sensors.
+            perceivers (dict): The cars that have perceived in this tick keyed by their
+                perception keys.
+            obstacles (tuple): The edges of the traffic cars found by find_obstacles.
+        """
+        key = (car.perception_key(), deciding)
+        perceiver = perceivers.get(key)
+        if perceiver:
+            car.copy_perception(perceiver, deciding)
+        else:
+            borders, border_array = self.borders_near(car, obstacles)
+            car.perceive(borders, deciding, border_array)
+            perceivers[key] = car
+
+    def find_obstacles(self) -> tuple:
+        """Find the edges of the cars of the traffic around the active cars.
+
+        Returns:
+            tuple: The edges as polygons of two points, the edges packed by
+                Sensor.pack_borders, and the position of the traffic car of every edge.
+        """
+        if not self.traffic or not self.active_cars:
+            return [], np.zeros((0, 4)), np.zeros((0, 2))
+        reach = max(
+            car.sensor_length + hypot(car.width, car.height) for car in self.active_cars
+        )
+        xs = [car.position.x for car in self.active_cars]
+        ys = [car.position.y for car in self.active_cars]
+        edges = []
+        positions = []
+        for dummy in self.traffic.cars(
+            (min(xs) - reach, min(ys) - reach, max(xs) + reach, max(ys) + reach)
+        ):
+            points = dummy.create_polygon().points
+            for i, point in enumerate(points):
+                edges.append(Polygon([points[i - 1], point]))
+                positions.append((dummy.position.x, dummy.position.y))
+        return (
+            edges,
+            Sensor.pack_borders(edges),
+            np.array(positions, dtype=np.float64).reshape(-1, 2),
+        )
+
+    def borders_near(self, car, obstacles: tuple) -> tuple:
+        """Get the road borders together with the edges of the traffic cars within sensor
+        reach of the given car.
+
+        Args:
+            car (Car): The car to get the borders for.
+            obstacles (tuple): The edges of the traffic cars found by find_obstacles.
+
+        Returns:
+            tuple: The borders as polygons and packed by Sensor.pack_borders.
+        """
+        edges, edge_array, positions = obstacles
+        if not edges:
+            return self.road_borders, self.border_array
+        reach = (
+            car.sensor_length
+            + hypot(car.width, car.height) / 2
+            + hypot(self.traffic.car_width, self.traffic.car_length) / 2
+        )
+        near = np.flatnonzero(
+            np.hypot(positions[:, 0] - car.position.x, positions[:, 1] - car.position.y)
+            <= reach
+        )
+        if len(near) == 0:
+            return self.road_borders, self.border_array
+        return (
+            self.road_borders + [edges[i] for i in near.tolist()],
+            np.concatenate((self.border_array, edge_array[near])),
+        )
+
+    def track_progress(self, car) -> bool:
+        """Set the fitness of the given car to the distance it got nearer to a target along
+        the roads since it started, replacing the fitness added by driving.
+
+        Args:
+            car (Car): The car to track.
+
+        Returns:
+            bool: True if the car has reached a target otherwise False.
+        """
+        distance = self.distance_field.distance_at(car.position)
+        start_distance = self.start_distances[id(car)]
+        if distance < inf and start_distance < inf:
+            self.progress[id(car)] = start_distance - distance
+        car.fitness = self.progress[id(car)]
+        return self.distance_field.has_reached(car.position)
+
+    def retire(self, car) -> None:
+        """Retire the given car from the active cars.
+
+        Args:
+            car (Car): The car to retire.
+        """
+        del self.marks[id(car)]
+        if not self.best_retired_car or car.fitness > self.best_retired_car.fitness:
+            self.best_retired_car = car
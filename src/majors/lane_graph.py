@@ -0,0 +1,358 @@
+"""This module contains the LaneGraph class."""
+
+from math import hypot, inf
+import numpy as np
+from src.primitives.point import Point
+from src.maths.graph import Graph
+from src.maths.spatial_index import SpatialIndex
+from src.majors.world import World
+
+
+class LaneGraph:
+    """LaneGraph class represents the lanes of the roads of a world as a directed graph.
+
+    Every lane of a road is a straight line along the middle of the lane that stops at the edge
+    of the intersections at its ends. The lanes on the right side of a two-way road run from the
+    start to the end of its segment and the lanes on the left side run back, or the other way
+    around if the road has lefthand_rule. All lanes of a one-way road run from the start to the
+    end of its segment. Lanes are linked through every intersection by connector lanes
+    that go from a lane entering the intersection to a lane leaving it on another road. At a
+    dead end the lanes of a two-way road are linked back into the lanes of the other
+    direction.
+
+    The lanes are kept in arrays: the start and the end point, the length and the road of every
+    lane, where connector lanes have the road -1, and the successors of every lane, where the
+    successors of lane i are successors[successor_offsets[i]:successor_offsets[i + 1]].
+
+    The lanes of a road and the connector lanes of an intersection are kept for every road and
+    intersection, and only found again for the ones that changed since the last build. The
+    arrays and the spatial index of the lanes are still packed again from all of them on every
+    build.
+    """
+
+    cell_size = 200
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        self.version = None
+        self.road_lanes = {}
+        self.connections = {}
+        self.roads = []
+        self.starts = np.zeros((0, 2))
+        self.ends = np.zeros((0, 2))
+        self.lengths = np.zeros(0)
+        self.road_of = np.zeros(0, dtype=np.int32)
+        self.successor_offsets = np.zeros(1, dtype=np.int32)
+        self.successors = np.zeros(0, dtype=np.int32)
+        self.lane_index = SpatialIndex(self.cell_size)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def refresh(self) -> None:
+        """Build the lanes again if the graph of the world has changed since the last call. It
+        must be called after the roads and the intersections of the world are generated."""
+        if self.world.graph.version == self.version:
+            return
+        self.version = self.world.graph.version
+        self.build()
+
+    def build(self) -> None:
+        """Build the lanes and the links between them from the roads and the intersections of
+        the world."""
+        trims = {}
+        for intersection in self.world.intersections:
+            roads = intersection.connected_roads
+            if len(roads) < 2:
+                continue
+            widest = max(road.width for road in roads)
+            for road in roads:
+                trims[(id(road), Graph.point_key(intersection.location))] = widest / 2
+        road_lanes = {}
+        for road in self.world.roads:
+            key = (
+                road.geometry,
+                road.number_of_lanes_in_left_side,
+                road.number_of_lanes_in_right_side,
+                road.lane_width,
+                road.is_oneway,
+                road.lefthand_rule,
+                trims.get((id(road), Graph.point_key(road.segment.start)), 0),
+                trims.get((id(road), Graph.point_key(road.segment.end)), 0),
+            )
+            cached = self.road_lanes.get(id(road))
+            if cached and cached[0] is road and cached[1] == key:
+                road_lanes[id(road)] = cached
+            else:
+                lanes = self.find_lanes(road, key[-2], key[-1])
+                road_lanes[id(road)] = (road, key, lanes)
+        connections = {}
+        for intersection in self.world.intersections:
+            key = tuple(
+                road_lanes[id(road)][1]
+                for road in intersection.connected_roads
+                if id(road) in road_lanes
+            )
+            cached = self.connections.get(id(intersection))
+            if cached and cached[0] is intersection and cached[1] == key:
+                connections[id(intersection)] = cached
+            else:
+                connections[id(intersection)] = (
+                    intersection,
+                    key,
+                    self.find_connectors(intersection, road_lanes),
+                )
+        self.road_lanes = road_lanes
+        self.connections = connections
+        self.assemble()
+
+    @staticmethod
+    def find_lanes(road: object, start_trim: float, end_trim: float) -> list:
+        """Find the lanes of the given road.
+
+        Args:
+            road (Road): The road to find the lanes of.
+            start_trim (float): How far from the start of the segment the lanes stop.
+            end_trim (float): How far from the end of the segment the lanes stop.
+
+        Returns:
+            list: The lanes as dicts with the start and the end point, whether the lane runs
+                from the start to the end of the segment, and the rank of the lane counted
+                from the middle of the road.
+        """
+        segment = road.segment
+        length = segment.length()
+        if length == 0:
+            return []
+        dx = (segment.end.x - segment.start.x) / length
+        dy = (segment.end.y - segment.start.y) / length
+        start_trim = min(start_trim, length * 0.45)
+        end_trim = min(end_trim, length * 0.45)
+        right_count = road.number_of_lanes_in_right_side
+        lanes = []
+        for i in range(road.number_of_lanes):
+            offset = (i + 0.5 - road.number_of_lanes / 2) * road.lane_width
+            if road.is_oneway:
+                forward = True
+                rank = i
+            elif i < right_count:
+                forward = not road.lefthand_rule
+                rank = right_count - 1 - i
+            else:
+                forward = road.lefthand_rule
+                rank = i - right_count
+            first = (
+                segment.start.x + dx * start_trim - dy * offset,
+                segment.start.y + dy * start_trim + dx * offset,
+            )
+            last = (
+                segment.end.x - dx * end_trim - dy * offset,
+                segment.end.y - dy * end_trim + dx * offset,
+            )
+            lanes.append(
+                {
+                    "start": first if forward else last,
+                    "end": last if forward else first,
+                    "forward": forward,
+                    "rank": rank,
+                }
+            )
+        return lanes
+
+    @staticmethod
+    def find_connectors(intersection: object, road_lanes: dict) -> list:
+        """Find the connector lanes of the given intersection. A lane that enters the
+        intersection is linked to one lane of every other road that leaves it, keeping its
+        place counted from the middle of the road.
+
+        Args:
+            intersection (Intersection): The intersection to link the lanes through.
+            road_lanes (dict): The lanes of the roads keyed by the ids of the roads.
+
+        Returns:
+            list: The connectors as tuples of the id of the road and the position of the
+                entering lane, and the id of the road and the position of the leaving lane.
+        """
+        entering, leaving = LaneGraph.find_ends(intersection, road_lanes)
+        dead_end = len(entering) == 1
+        connectors = []
+        for i, road_entering in enumerate(entering):
+            for j, road_leaving in enumerate(leaving):
+                if (i == j) != dead_end or not road_leaving:
+                    continue
+                connectors.extend(LaneGraph.link(road_entering, road_leaving))
+        return connectors
+
+    @staticmethod
+    def find_ends(intersection: object, road_lanes: dict) -> tuple:
+        """Find the lanes that enter and the lanes that leave the given intersection.
+
+        Args:
+            intersection (Intersection): The intersection to find the lanes of.
+            road_lanes (dict): The lanes of the roads keyed by the ids of the roads.
+
+        Returns:
+            tuple: The entering and the leaving lanes, as a list for every road of the
+                intersection with the id of the road, the position and the rank of every lane.
+        """
+        location = Graph.point_key(intersection.location)
+        entering = []
+        leaving = []
+        for road in intersection.connected_roads:
+            if id(road) not in road_lanes:
+                continue
+            at_start = Graph.point_key(road.segment.start) == location
+            at_end = Graph.point_key(road.segment.end) == location
+            road_entering = []
+            road_leaving = []
+            for position, lane in enumerate(road_lanes[id(road)][2]):
+                if (lane["forward"] and at_end) or (not lane["forward"] and at_start):
+                    road_entering.append((id(road), position, lane["rank"]))
+                if (lane["forward"] and at_start) or (not lane["forward"] and at_end):
+                    road_leaving.append((id(road), position, lane["rank"]))
+            entering.append(road_entering)
+            leaving.append(road_leaving)
+        return entering, leaving
+
+    @staticmethod
+    def link(road_entering: list, road_leaving: list) -> list:
+        """Link every entering lane of a road to the leaving lane of another road at the same
+        place counted from the middle of the road.
+
+        Args:
+            road_entering (list): The id of the road, the position and the rank of every
+                entering lane.
+            road_leaving (list): The id of the road, the position and the rank of every leaving
+                lane.
+
+        Returns:
+            list: The connectors as tuples of the id of the road and the position of the
+                entering lane, and the id of the road and the position of the leaving lane.
+        """
+        by_rank = sorted(road_leaving, key=lambda lane: lane[2])
+        last_in = max(len(road_entering) - 1, 1)
+        connectors = []
+        for road_id, position, rank in road_entering:
+            target = by_rank[round(rank * (len(by_rank) - 1) / last_in)]
+            connectors.append(((road_id, position), (target[0], target[1])))
+        return connectors
+
+    def assemble(self) -> None:
+        """Pack the kept lanes and connectors of all roads and intersections into the arrays
+        of the graph and index the lanes again."""
+        self.roads = list(self.world.roads)
+        starts = []
+        ends = []
+        road_of = []
+        positions = {}
+        for road_number, road in enumerate(self.roads):
+            for position, lane in enumerate(self.road_lanes[id(road)][2]):
+                positions[(id(road), position)] = len(starts)
+                starts.append(lane["start"])
+                ends.append(lane["end"])
+                road_of.append(road_number)
+        successors = [[] for _ in starts]
+        for _, _, connectors in self.connections.values():
+            for source, target in connectors:
+                source = positions[source]
+                target = positions[target]
+                successors[source].append(len(starts))
+                successors.append([target])
+                starts.append(ends[source])
+                ends.append(starts[target])
+                road_of.append(-1)
+        self.starts = np.array(starts, dtype=np.float64).reshape(-1, 2)
+        self.ends = np.array(ends, dtype=np.float64).reshape(-1, 2)
+        self.lengths = np.hypot(*(self.ends - self.starts).T)
+        self.road_of = np.array(road_of, dtype=np.int32)
+        self.successor_offsets = np.zeros(len(successors) + 1, dtype=np.int32)
+        np.cumsum([len(lane) for lane in successors], out=self.successor_offsets[1:])
+        self.successors = np.array(
+            [target for lane in successors for target in lane], dtype=np.int32
+        )
+        self.index_lanes()
+
+    def index_lanes(self) -> None:
+        """Put the bounding boxes of the lanes of the roads into the spatial index."""
+        self.lane_index.clear()
+        boxes = np.hstack(
+            (np.minimum(self.starts, self.ends), np.maximum(self.starts, self.ends))
+        )
+        for lane in np.flatnonzero(self.road_of >= 0).tolist():
+            self.lane_index.insert(lane, tuple(boxes[lane].tolist()))
+
+    def successors_of(self, lane: int) -> np.ndarray:
+        """Get the lanes that follow the given lane.
+
+        Args:
+            lane (int): The index of the lane.
+
+        Returns:
+            np.ndarray: The indices of the following lanes.
+        """
+        return self.successors[
+            self.successor_offsets[lane] : self.successor_offsets[lane + 1]
+        ]
+
+    def positions_at(self, lanes: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """Find the points at the given distances along the given lanes.
+
+        Args:
+            lanes (np.ndarray): The indices of the lanes.
+            distances (np.ndarray): The distances from the starts of the lanes.
+
+        Returns:
+            np.ndarray: An (n, 2) array of the points.
+        """
+        lengths = self.lengths[lanes]
+        t = np.divide(
+            distances, lengths, out=np.zeros(len(lanes)), where=lengths > 0
+        )[:, None]
+        return self.starts[lanes] + (self.ends[lanes] - self.starts[lanes]) * t
+
+    def nearest_lane(self, point: Point, heading: Point | None = None) -> tuple | None:
+        """Find the lane of a road nearest to the given point.
+
+        Args:
+            point (Point): The point to search around.
+            heading (Point | None, optional): If given, only lanes running in this direction,
+                within 90 degrees, are found. Defaults to None.
+
+        Returns:
+            tuple | None: The index of the lane and the distance of the projection of the point
+                from the start of the lane, or None if no lane is found.
+        """
+
+        def distance_of(lane: int) -> float:
+            if heading is not None:
+                direction = self.ends[lane] - self.starts[lane]
+                if direction[0] * heading.x + direction[1] * heading.y <= 0:
+                    return inf
+            return hypot(*(self.project(lane, point) - (point.x, point.y)))
+
+        lane = self.lane_index.nearest(point, distance_of)
+        if lane is None:
+            return None
+        length = self.lengths[lane]
+        along = hypot(*(self.project(lane, point) - self.starts[lane]))
+        return lane, min(along, length)
+
+    def project(self, lane: int, point: Point) -> np.ndarray:
+        """Project the given point on the given lane.
+
+        Args:
+            lane (int): The index of the lane.
+            point (Point): The point to project.
+
+        Returns:
+            np.ndarray: The nearest point of the lane to the given point.
+        """
+        start = self.starts[lane]
+        direction = self.ends[lane] - start
+        length_squared = direction @ direction
+        if length_squared == 0:
+            return start
+        t = (
+            (point.x - start[0]) * direction[0] + (point.y - start[1]) * direction[1]
+        ) / length_squared
+        return start + direction * min(max(t, 0), 1)
@@ -5,6 +5,7 @@ from PyQt6.QtGui import QPainter, QPen, QColor, QPainterPath
 from src.items.car import Car
 from src.primitives.point import Point
 from src.primitives.circle import Circle
+from src.renderers.primitive_renderer import draw_circle, draw_segment
 
 
 class Minimap:
@@ -20,13 +21,13 @@ class Minimap:
         self.app_height = app_height
         self.car_position = car.position
 
-    def update(self, car: Car):
+    def update(self, position: Point):
         """Update the position of the car.
 
         Args:
-            car (Car): Car to update the position.
+            position (Point): The new position of the car.
         """
-        self.car_position = car.position
+        self.car_position = position
 
     def draw(self, painter: QPainter, view_point: Point) -> None:
         """Draw the minimap using the given painter.
@@ -52,8 +53,9 @@ class Minimap:
         minimap_path.addEllipse(0, 0, radius * 2, radius * 2)
         painter.save()
         painter.translate(position.x, position.y)
-        background.draw(
+        draw_circle(
             painter,
+            background,
             QColor(5, 113, 5),
             outline_thickness=-1,
             outline_color=QColor(5, 113, 5),
@@ -70,8 +72,9 @@ class Minimap:
         )
         painter.scale(self.scaler, self.scaler)
         for segment in self.graph.segments:
-            segment.draw(
+            draw_segment(
                 painter,
+                segment,
                 3 / self.scaler,
                 Qt.PenCapStyle.RoundCap,
                 [],
@@ -82,8 +85,9 @@ class Minimap:
             -scaled_view_point.x,
             -scaled_view_point.y,
         )
-        red_dot.draw(
+        draw_circle(
             painter,
+            red_dot,
             QColor(255, 0, 0),
         )
         painter.setClipPath(base_path)
@@ -0,0 +1,281 @@
+"""This module contains the Router class."""
+
+from heapq import heappush, heappop
+from itertools import count
+from math import hypot, inf
+from src.primitives.point import Point
+from src.maths.graph import Graph
+from src.maths.spatial_index import SpatialIndex
+from src.majors.world import World
+
+
+class Router:
+    """Router class finds the shortest routes over the roads of a world with A* and a Euclidean
+    heuristic.
+
+    The road network is read again and the kept routes between markings are dropped whenever
+    the version of the graph or of the markings of the world changes. Two-way roads can be
+    driven both ways and one-way roads only from the start to the end of their segments. A
+    route leaves its start marking in the direction the marking faces.
+
+    A route is a dict with the points of the route from the start to the target, the distance
+    of every point from the start along the route and the length of the route.
+    """
+
+    cell_size = 200
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+        self.version = None
+        self.edges = {}
+        self.routes = {}
+        self.road_index = SpatialIndex(self.cell_size)
+
+    def refresh(self) -> None:
+        """Read the road network again and drop the kept routes if the graph or the markings
+        of the world have changed since the last call."""
+        version = (self.world.graph.version, self.world.markings.version)
+        if version == self.version:
+            return
+        self.version = version
+        self.edges = {}
+        self.routes = {}
+        self.road_index.clear()
+        for road in self.world.roads:
+            start = Graph.point_key(road.segment.start)
+            end = Graph.point_key(road.segment.end)
+            length = road.segment.length()
+            self.road_index.insert(road, road.segment.bounding_box())
+            self.edges.setdefault(start, []).append((end, length))
+            self.edges.setdefault(end, [])
+            if not road.is_oneway:
+                self.edges[end].append((start, length))
+
+    def anchor(self, point: Point) -> dict | None:
+        """Find where the given point sits on the road network.
+
+        Args:
+            point (Point): The point to find on the roads.
+
+        Returns:
+            dict | None: The road nearest to the point, the projection of the point on the
+                segment of the road and the offset of the projection, or None if the world has
+                no roads.
+        """
+        road = self.road_index.nearest(
+            point, lambda road: road.segment.distance_to_point(point)
+        )
+        if road is None:
+            return None
+        projection = road.segment.project_point(point)
+        offset = min(max(projection["offset"], 0), 1)
+        return {
+            "road": road,
+            "point": road.segment.start
+            + (road.segment.end - road.segment.start).scale(offset),
+            "offset": offset,
+        }
+
+    def find_route(
+        self, start: Point, target: Point, heading: Point | None = None
+    ) -> dict | None:
+        """Find the shortest route between two points on the roads with A*.
+
+        Args:
+            start (Point): The point the route starts from.
+            target (Point): The point the route ends at.
+            heading (Point | None, optional): The direction the route has to leave the start
+                in, or None to leave in any direction. Defaults to None.
+
+        Returns:
+            dict | None: The route, or None if the target cannot be reached.
+        """
+        self.refresh()
+        source = self.anchor(start)
+        sink = self.anchor(target)
+        if source is None or sink is None:
+            return None
+        distances, previous = self.search(
+            self.source_edges(source, sink, heading),
+            self.sink_edges(sink),
+            sink["point"],
+        )
+        return self.trace(distances, previous, source["point"], sink["point"])
+
+    def route(self, start_marking: object, target_marking: object) -> dict | None:
+        """Get the route from the given start marking to the given target marking. Routes are
+        found once and kept until the graph or the markings change.
+
+        Args:
+            start_marking (object): The start marking to leave from.
+            target_marking (object): The target marking to reach.
+
+        Returns:
+            dict | None: The route, or None if the target cannot be reached.
+        """
+        self.refresh()
+        key = (id(start_marking), id(target_marking))
+        if key not in self.routes:
+            self.routes[key] = self.find_route(
+                start_marking.center_of_segment,
+                target_marking.center_of_segment,
+                start_marking.direction_of_segment,
+            )
+        return self.routes[key]
+
+    def route_table(self) -> dict:
+        """Find the routes from every start marking to every target marking of the world.
+
+        Returns:
+            dict: The routes keyed by pairs of start and target markings.
+        """
+        markings = self.world.markings
+        starts = [marking for marking in markings if marking.type == "start"]
+        targets = [marking for marking in markings if marking.type == "target"]
+        return {
+            (start, target): self.route(start, target)
+            for start in starts
+            for target in targets
+        }
+
+    @staticmethod
+    def source_edges(source: dict, sink: dict, heading: Point | None) -> list:
+        """Find the edges from the start of a route to the ends of its road, and to the target
+        if it is on the same road.
+
+        Args:
+            source (dict): The anchor of the start of the route.
+            sink (dict): The anchor of the target of the route.
+            heading (Point | None): The direction the route has to leave the start in, or None
+                to leave in any direction.
+
+        Returns:
+            list: The edges as tuples of the key of the reached node and the length.
+        """
+        road = source["road"]
+        length = road.segment.length()
+        direction = road.segment.end - road.segment.start
+        edges = []
+        for forward in (True, False):
+            if not forward and road.is_oneway:
+                continue
+            if heading is not None:
+                alignment = direction.x * heading.x + direction.y * heading.y
+                if (alignment if forward else -alignment) <= 0:
+                    continue
+            if forward:
+                edges.append(
+                    (Graph.point_key(road.segment.end), length * (1 - source["offset"]))
+                )
+            else:
+                edges.append(
+                    (Graph.point_key(road.segment.start), length * source["offset"])
+                )
+            gap = sink["offset"] - source["offset"]
+            if road is sink["road"] and (gap == 0 or (gap > 0) == forward):
+                edges.append((("target",), length * abs(gap)))
+        return edges
+
+    @staticmethod
+    def sink_edges(sink: dict) -> dict:
+        """Find the edges from the ends of the road of the target of a route to the target.
+
+        Args:
+            sink (dict): The anchor of the target of the route.
+
+        Returns:
+            dict: The lengths of the edges keyed by the keys of the ends of the road.
+        """
+        road = sink["road"]
+        length = road.segment.length()
+        edges = {Graph.point_key(road.segment.start): length * sink["offset"]}
+        if not road.is_oneway:
+            edges[Graph.point_key(road.segment.end)] = length * (1 - sink["offset"])
+        return edges
+
+    def search(self, first_edges: list, last_edges: dict, goal: Point) -> tuple:
+        """Search the road network with A* from the start to the target of a route.
+
+        Args:
+            first_edges (list): The edges from the start of the route.
+            last_edges (dict): The edges to the target of the route.
+            goal (Point): The point the route ends at.
+
+        Returns:
+            tuple: The distances of the reached nodes from the start and the node that every
+                reached node was reached from, both keyed by the keys of the nodes.
+        """
+        tie_breaker = count()
+        distances = {("start",): 0}
+        previous = {}
+        queue = [(0, next(tie_breaker), ("start",))]
+        closed = set()
+        while queue:
+            key = heappop(queue)[2]
+            if key == ("target",):
+                break
+            if key in closed:
+                continue
+            closed.add(key)
+            if key == ("start",):
+                neighbors = first_edges
+            else:
+                neighbors = list(self.edges.get(key, ()))
+                if key in last_edges:
+                    neighbors.append((("target",), last_edges[key]))
+            for neighbor, length in neighbors:
+                distance = distances[key] + length
+                if distance < distances.get(neighbor, inf):
+                    distances[neighbor] = distance
+                    previous[neighbor] = key
+                    heappush(
+                        queue,
+                        (
+                            distance + self.estimate(neighbor, goal),
+                            next(tie_breaker),
+                            neighbor,
+                        ),
+                    )
+        return distances, previous
+
+    @staticmethod
+    def estimate(key: tuple, goal: Point) -> float:
+        """Estimate the length of the route left from the given node with the straight distance
+        to the target.
+
+        Args:
+            key (tuple): The key of the node.
+            goal (Point): The point the route ends at.
+
+        Returns:
+            float: The estimated length.
+        """
+        if key == ("target",):
+            return 0
+        return hypot(key[0] - goal.x, key[1] - goal.y)
+
+    @staticmethod
+    def trace(distances: dict, previous: dict, source: Point, goal: Point) -> dict | None:
+        """Follow the nodes of a search back from the target to the start.
+
+        Args:
+            distances (dict): The distances of the reached nodes from the start.
+            previous (dict): The node that every reached node was reached from.
+            source (Point): The point the route starts from.
+            goal (Point): The point the route ends at.
+
+        Returns:
+            dict | None: The route, or None if the target was not reached.
+        """
+        if ("target",) not in distances:
+            return None
+        keys = [("target",)]
+        while keys[-1] != ("start",):
+            keys.append(previous[keys[-1]])
+        keys.reverse()
+        points = [source] + [Point(*key) for key in keys[1:-1]] + [goal]
+        return {
+            "points": points,
+            "distances": [distances[key] for key in keys],
+            "length": distances[("target",)],
+        }
@@ -0,0 +1,136 @@
+"""This module contains the Simulation class."""
+
+from typing import NamedTuple
+from math import degrees
+from threading import Lock
+from time import perf_counter
+from PyQt6.QtCore import QObject, QTimer
+from src.majors.fleet import Fleet
+
+
+class Snapshot(NamedTuple):
+    """Snapshot is an immutable copy of the state of a simulation after a tick."""
+
+    age: int
+    car_poses: tuple
+    sensor_rays: tuple
+    best_car: int | None
+    traffic_poses: tuple = ()
+
+
+class Simulation(QObject):
+    """Simulation class runs a fleet on its own thread and publishes snapshots of it.
+    Inherited from QObject.
+
+    Move it to a QThread and connect the started and finished signals of the thread to the start
+    and stop methods.
+    The painter only reads the latest snapshot, so drawing never waits for physics and
+    physics never waits for drawing. Only the cars of the traffic of the fleet inside view_box
+    are put into the snapshot.
+    """
+
+    tick_interval = 10
+    fast_forward = False
+    tick_budget = 8
+
+    def __init__(self, fleet: Fleet) -> None:
+        super().__init__()
+        self.fleet = fleet
+        self.view_box = None
+        self.running = False
+        self.controls = {
+            "forward": False,
+            "backward": False,
+            "left": False,
+            "right": False,
+        }
+        self.tick_counter_variable = 0
+        self.lock = Lock()
+        self.timer = None
+        self.snapshot = self.take_snapshot()
+
+    def start(self) -> None:
+        """Start the timer of the simulation. It must be called from the simulation thread."""
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.run)
+        self.timer.start(self.tick_interval)
+
+    def stop(self) -> None:
+        """Stop the timer of the simulation. It must be called from the simulation thread."""
+        if self.timer:
+            self.timer.stop()
+
+    def run(self) -> None:
+        """A method that runs on timer timeout. It runs as many ticks as fit into the tick
+        budget in fast forward mode and one tick otherwise, then publishes a snapshot."""
+        if not self.running:
+            return
+        with self.lock:
+            if self.fast_forward:
+                deadline = perf_counter() + self.tick_budget / 1000
+                self.tick()
+                while perf_counter() < deadline:
+                    self.tick()
+            else:
+                self.tick()
+            self.snapshot = self.take_snapshot()
+
+    def tick(self) -> None:
+        """Advance the simulation by one step."""
+        best_car = self.fleet.best_car
+        if best_car and best_car.control_type == "user":
+            if self.controls["forward"]:
+                best_car.accelerate_forward()
+            if self.controls["left"]:
+                best_car.turn_steering_wheel(degrees(-0.03))
+            if self.controls["backward"]:
+                best_car.accelerate_backward()
+            if self.controls["right"]:
+                best_car.turn_steering_wheel(degrees(0.03))
+        self.fleet.update()
+        self.tick_counter_variable += 1
+
+    def reset(self, fleet: Fleet) -> None:
+        """Replace the fleet of the simulation.
+
+        Args:
+            fleet (Fleet): The new fleet to simulate.
+        """
+        with self.lock:
+            self.fleet = fleet
+            self.snapshot = self.take_snapshot()
+
+    def take_tick_count(self) -> int:
+        """Return the number of ticks since the last call and reset the counter.
+
+        Returns:
+            int: The number of ticks.
+        """
+        with self.lock:
+            count = self.tick_counter_variable
+            self.tick_counter_variable = 0
+        return count
+
+    def take_snapshot(self) -> Snapshot:
+        """Take an immutable copy of the current state of the fleet and the traffic.
+
+        Returns:
+            Snapshot: The taken snapshot.
+        """
+        car_poses = tuple(car.pose() for car in self.fleet.cars)
+        sensor_rays = ()
+        best_car = None
+        if self.fleet.best_car:
+            best_car = self.fleet.cars.index(self.fleet.best_car)
+            if self.fleet.best_car.control_type != "dummy":
+                sensor_rays = tuple(
+                    sensor.ray()
+                    for sensor in self.fleet.best_car.sensors
+                    if sensor.start
+                )
+        traffic_poses = ()
+        if self.fleet.traffic:
+            traffic_poses = tuple(
+                car.pose() for car in self.fleet.traffic.cars(self.view_box)
+            )
+        return Snapshot(self.fleet.age, car_poses, sensor_rays, best_car, traffic_poses)
@@ -0,0 +1,375 @@
+"""This module contains the Traffic class."""
+
+from math import degrees, atan2
+import numpy as np
+from src.items.car import Car
+from src.primitives.point import Point
+from src.majors.lane_graph import LaneGraph
+
+
+class Traffic:
+    """Traffic class drives dummy cars along the lanes of a lane graph with the intelligent
+    driver model, where every car speeds up towards its desired speed and brakes for the car
+    in front of it.
+
+    The state of all cars is kept in arrays and advanced in one step for all of them. A car
+    looks for the car in front of it on its own lane and up to two lanes ahead, and also waits
+    for a car that is still at the start of any lane it could go on to. At the end of a lane a
+    car goes on to a random successor of the lane, and a car at a lane without any
+    successor starts again on a free place of a random lane, or waits at the end of its lane
+    until there is one. Cars do not give way to each other where lanes cross or merge inside
+    intersections. Car objects are only made for the cars that are drawn.
+
+    No car is put within clear_distance of the points in keep_clear, like the start markings
+    of other cars.
+    """
+
+    car_length = 50
+    car_width = 30
+    max_speed = 4
+    speed_spread = 0.25
+    acceleration = 0.1
+    deceleration = 0.2
+    minimum_gap = 15
+    time_headway = 20
+    clear_distance = 100
+
+    def __init__(self, lane_graph: LaneGraph, seed: int | None = None) -> None:
+        self.lane_graph = lane_graph
+        self.random = np.random.default_rng(seed)
+        self.lanes = np.zeros(0, dtype=np.int32)
+        self.next_lanes = np.zeros(0, dtype=np.int32)
+        self.distances = np.zeros(0)
+        self.speeds = np.zeros(0)
+        self.desired_speeds = np.zeros(0)
+        self.cars_of_agents = {}
+        self.keep_clear = []
+        offsets = lane_graph.successor_offsets
+        single = np.flatnonzero(np.diff(offsets) == 1)
+        self.only_successors = np.full(len(lane_graph), -1, dtype=np.int32)
+        self.only_successors[single] = lane_graph.successors[offsets[single]]
+
+    def __len__(self) -> int:
+        return len(self.lanes)
+
+    def spawn(self, count: int) -> None:
+        """Put the given number of cars on the lanes of the roads, apart from each other and
+        from the cars that are already there.
+
+        Args:
+            count (int): The number of cars to add.
+        """
+        slot_lanes, slot_distances = self.free_slots()
+        slots = self.random.choice(
+            len(slot_lanes), min(count, len(slot_lanes)), replace=False
+        )
+        lanes = slot_lanes[slots].astype(np.int32)
+        self.lanes = np.concatenate((self.lanes, lanes))
+        self.next_lanes = np.concatenate(
+            (self.next_lanes, self.choose_next_lanes(lanes))
+        )
+        self.distances = np.concatenate((self.distances, slot_distances[slots]))
+        self.speeds = np.concatenate((self.speeds, np.zeros(len(slots))))
+        self.desired_speeds = np.concatenate(
+            (
+                self.desired_speeds,
+                self.max_speed
+                * (1 - self.speed_spread * self.random.random(len(slots))),
+            )
+        )
+
+    def find_slots(self) -> tuple:
+        """Find the places on the lanes of the roads where a car can be put, one car length and
+        minimum_gap apart.
+
+        Returns:
+            tuple: The lane and the distance from the start of the lane of every place, and the
+                number of places on every lane.
+        """
+        spacing = self.car_length + self.minimum_gap
+        road_lanes = np.flatnonzero(self.lane_graph.road_of >= 0)
+        slot_counts = (self.lane_graph.lengths[road_lanes] // spacing).astype(np.int64)
+        slot_lanes = np.repeat(road_lanes, slot_counts)
+        slot_distances = (
+            np.arange(len(slot_lanes))
+            - np.repeat(np.cumsum(slot_counts) - slot_counts, slot_counts)
+            + 0.5
+        ) * spacing
+        lane_counts = np.zeros(len(self.lane_graph), dtype=np.int64)
+        lane_counts[road_lanes] = slot_counts
+        return slot_lanes, slot_distances, lane_counts
+
+    def free_slots(self) -> tuple:
+        """Find the places on the lanes of the roads where a car can be put without coming
+        closer than minimum_gap to a car that is already there.
+
+        Returns:
+            tuple: The lane and the distance from the start of the lane of every free place.
+        """
+        spacing = self.car_length + self.minimum_gap
+        slot_lanes, slot_distances, lane_counts = self.find_slots()
+        lane_firsts = np.cumsum(lane_counts) - lane_counts
+        free = np.ones(len(slot_lanes), dtype=bool)
+        lanes = self.lanes[lane_counts[self.lanes] > 0]
+        distances = self.distances[lane_counts[self.lanes] > 0]
+        nearest = np.floor(distances / spacing).astype(np.int64)
+        for shift in (-1, 0, 1):
+            places = nearest + shift
+            valid = (places >= 0) & (places < lane_counts[lanes])
+            slots = lane_firsts[lanes[valid]] + places[valid]
+            close = np.abs(slot_distances[slots] - distances[valid]) < spacing
+            free[slots[close]] = False
+        free &= self.clear_slots(slot_lanes, slot_distances)
+        return slot_lanes[free], slot_distances[free]
+
+    def clear_slots(self, slot_lanes: np.ndarray, slot_distances: np.ndarray) -> np.ndarray:
+        """Check which of the given places are farther than clear_distance from all points in
+        keep_clear.
+
+        Args:
+            slot_lanes (np.ndarray): The lanes of the places.
+            slot_distances (np.ndarray): The distances of the places from the starts of their
+                lanes.
+
+        Returns:
+            np.ndarray: True for every place that is clear otherwise False.
+        """
+        clear = np.ones(len(slot_lanes), dtype=bool)
+        positions = self.lane_graph.positions_at(slot_lanes, slot_distances)
+        for point in self.keep_clear:
+            clear &= (
+                np.hypot(positions[:, 0] - point.x, positions[:, 1] - point.y)
+                > self.clear_distance
+            )
+        return clear
+
+    def choose_next_lanes(self, lanes: np.ndarray) -> np.ndarray:
+        """Choose a random successor for every given lane.
+
+        Args:
+            lanes (np.ndarray): The indices of the lanes.
+
+        Returns:
+            np.ndarray: The indices of the chosen successors, or -1 for lanes without any.
+        """
+        offsets = self.lane_graph.successor_offsets
+        counts = offsets[lanes + 1] - offsets[lanes]
+        picks = offsets[lanes] + (self.random.random(len(lanes)) * counts).astype(
+            np.int32
+        )
+        next_lanes = np.full(len(lanes), -1, dtype=np.int32)
+        has_successor = counts > 0
+        next_lanes[has_successor] = self.lane_graph.successors[picks[has_successor]]
+        return next_lanes
+
+    def find_leaders(self) -> tuple:
+        """Find the gap to the car in front of every car and the speed of that car.
+
+        Returns:
+            tuple: The gaps and the speeds of the cars in front. The gap is inf for a car with
+                no car in front of it.
+        """
+        gaps = np.full(len(self.lanes), np.inf)
+        leader_speeds = np.zeros(len(self.lanes))
+        order = np.lexsort((self.distances, self.lanes))
+        sorted_lanes = self.lanes[order]
+        same_lane = sorted_lanes[1:] == sorted_lanes[:-1]
+        followers = order[:-1][same_lane]
+        leaders = order[1:][same_lane]
+        gaps[followers] = self.distances[leaders] - self.distances[followers]
+        leader_speeds[followers] = self.speeds[leaders]
+        first_distances = np.full(len(self.lane_graph), np.inf)
+        first_speeds = np.zeros(len(self.lane_graph))
+        occupied, firsts = np.unique(sorted_lanes, return_index=True)
+        first_distances[occupied] = self.distances[order[firsts]]
+        first_speeds[occupied] = self.speeds[order[firsts]]
+        last = np.ones(len(self.lanes), dtype=bool)
+        last[followers] = False
+        ahead = np.flatnonzero(last & (self.next_lanes >= 0))
+        gaps[ahead], leader_speeds[ahead] = self.look_ahead(
+            ahead, first_distances, first_speeds
+        )
+        return gaps - self.car_length, leader_speeds
+
+    def look_ahead(
+        self, agents: np.ndarray, first_distances: np.ndarray, first_speeds: np.ndarray
+    ) -> tuple:
+        """Find the car in front of the given cars, which are the last cars on their lanes, on
+        the lanes they go on to.
+
+        Args:
+            agents (np.ndarray): The indices of the cars.
+            first_distances (np.ndarray): The distance of the first car on every lane, or inf
+                for empty lanes.
+            first_speeds (np.ndarray): The speed of the first car on every lane.
+
+        Returns:
+            tuple: The gaps and the speeds of the cars in front.
+        """
+        lengths = self.lane_graph.lengths
+        remaining = lengths[self.lanes[agents]] - self.distances[agents]
+        next_lanes = self.next_lanes[agents]
+        gaps = remaining + first_distances[next_lanes]
+        speeds = first_speeds[next_lanes]
+        starting = np.where(first_distances < self.car_length, first_distances, np.inf)
+        blocked = self.first_of_successors(starting)[self.lanes[agents]]
+        closer = blocked < first_distances[next_lanes]
+        gaps[closer] = remaining[closer] + blocked[closer]
+        speeds[closer] = 0
+        further = np.isinf(gaps) & (self.only_successors[next_lanes] >= 0)
+        lanes_after = self.only_successors[next_lanes[further]]
+        gaps[further] = (
+            remaining[further]
+            + lengths[next_lanes[further]]
+            + first_distances[lanes_after]
+        )
+        speeds[further] = first_speeds[lanes_after]
+        return gaps, speeds
+
+    def first_of_successors(self, values: np.ndarray) -> np.ndarray:
+        """Find the smallest of the given values of the successors of every lane.
+
+        Args:
+            values (np.ndarray): A value for every lane.
+
+        Returns:
+            np.ndarray: The smallest value of the successors of every lane, or inf for lanes
+                without successors.
+        """
+        offsets = self.lane_graph.successor_offsets
+        smallest = np.full(len(offsets) - 1, np.inf)
+        if len(self.lane_graph.successors) > 0:
+            has_successor = np.diff(offsets) > 0
+            smallest[has_successor] = np.minimum.reduceat(
+                values[self.lane_graph.successors], offsets[:-1][has_successor]
+            )
+        return smallest
+
+    def step(self) -> None:
+        """Advance every car by one tick."""
+        if len(self.lanes) == 0:
+            return
+        self.speeds = np.maximum(self.speeds + self.find_accelerations(), 0)
+        self.distances += self.speeds
+        self.pass_lane_ends()
+
+    def find_accelerations(self) -> np.ndarray:
+        """Find the acceleration of every car with the intelligent driver model.
+
+        Returns:
+            np.ndarray: The accelerations.
+        """
+        gaps, leader_speeds = self.find_leaders()
+        speeds = self.speeds
+        desired_gaps = self.minimum_gap + np.maximum(
+            0,
+            speeds * self.time_headway
+            + speeds
+            * (speeds - leader_speeds)
+            / (2 * np.sqrt(self.acceleration * self.deceleration)),
+        )
+        return self.acceleration * (
+            1
+            - (speeds / self.desired_speeds) ** 4
+            - (desired_gaps / np.maximum(gaps, 1e-3)) ** 2
+        )
+
+    def pass_lane_ends(self) -> None:
+        """Move the cars that drove past the end of their lane on to their next lane, and start
+        the cars at the end of a lane without successors again."""
+        lengths = self.lane_graph.lengths
+        passed = np.flatnonzero(self.distances > lengths[self.lanes])
+        while len(passed) > 0:
+            stuck = passed[self.next_lanes[passed] < 0]
+            passed = passed[self.next_lanes[passed] >= 0]
+            if len(stuck) > 0:
+                self.respawn(stuck)
+            self.distances[passed] -= lengths[self.lanes[passed]]
+            self.lanes[passed] = self.next_lanes[passed]
+            self.next_lanes[passed] = self.choose_next_lanes(self.lanes[passed])
+            passed = passed[self.distances[passed] > lengths[self.lanes[passed]]]
+
+    def respawn(self, agents: np.ndarray) -> None:
+        """Start the given cars again from standstill on free places on random lanes of the
+        roads. Cars that find no free place wait at the end of their lane and try again when
+        they pass it in a later tick.
+
+        Args:
+            agents (np.ndarray): The indices of the cars.
+        """
+        slot_lanes, slot_distances = self.free_slots()
+        slots = self.random.choice(
+            len(slot_lanes), min(len(agents), len(slot_lanes)), replace=False
+        )
+        placed = agents[: len(slots)]
+        waiting = agents[len(slots) :]
+        lanes = slot_lanes[slots].astype(np.int32)
+        self.lanes[placed] = lanes
+        self.next_lanes[placed] = self.choose_next_lanes(lanes)
+        self.distances[placed] = slot_distances[slots]
+        self.distances[waiting] = self.lane_graph.lengths[self.lanes[waiting]]
+        self.speeds[agents] = 0
+
+    def cars(self, box: tuple | None = None) -> list:
+        """Get dummy cars for the cars of the traffic inside the given box. A car object is made
+        the first time it is needed and moved to the current pose of its car afterwards.
+
+        Args:
+            box (tuple | None, optional): The left, top, right and bottom of the box, or None
+                for all cars. Defaults to None.
+
+        Returns:
+            list: The dummy cars.
+        """
+        if len(self.lanes) == 0:
+            return []
+        positions = self.lane_graph.positions_at(self.lanes, self.distances)
+        if box is None:
+            agents = np.arange(len(self.lanes))
+        else:
+            agents = self.agents_inside(positions, box)
+        directions = (
+            self.lane_graph.ends[self.lanes[agents]]
+            - self.lane_graph.starts[self.lanes[agents]]
+        )
+        cars = []
+        poses = zip(agents.tolist(), positions[agents], directions)
+        for agent, (x, y), (dx, dy) in poses:
+            car = self.cars_of_agents.get(agent)
+            angle = degrees(atan2(dx, -dy))
+            if car is None:
+                car = Car(
+                    Point(x, y),
+                    angle,
+                    "dummy",
+                    self.car_width,
+                    self.car_length,
+                    (0, 0, 255),
+                )
+                self.cars_of_agents[agent] = car
+            else:
+                car.position.x = x
+                car.position.y = y
+                car.angle = angle
+            car.speed = self.speeds[agent]
+            cars.append(car)
+        return cars
+
+    def agents_inside(self, positions: np.ndarray, box: tuple) -> np.ndarray:
+        """Find the cars whose positions are inside the given box grown by the length of a car.
+
+        Args:
+            positions (np.ndarray): An (n, 2) array of the positions of all cars.
+            box (tuple): The left, top, right and bottom of the box.
+
+        Returns:
+            np.ndarray: The indices of the cars.
+        """
+        left, top, right, bottom = box
+        margin = self.car_length
+        return np.flatnonzero(
+            (positions[:, 0] >= left - margin)
+            & (positions[:, 0] <= right + margin)
+            & (positions[:, 1] >= top - margin)
+            & (positions[:, 1] <= bottom + margin)
+        )
@@ -0,0 +1,190 @@
+"""This module contains the Trainer class."""
+
+from copy import deepcopy
+from csv import writer
+from json import dump
+from math import degrees
+from random import choice, randrange
+from time import perf_counter
+from pathlib2 import Path
+from src.items.car import Car
+from src.primitives.point import Point
+from src.primitives.polygon import Polygon
+from src.brains.neural_network import NeuralNetwork
+from src.majors.world import World
+from src.majors.fleet import Fleet
+from src.majors.distance_field import DistanceField
+from src.majors.lane_graph import LaneGraph
+from src.majors.traffic import Traffic
+
+
+class Trainer:
+    """Trainer class evolves the brains of cars in a world without any window.
+
+    If a number of traffic cars is given, every generation drives among that many traffic cars,
+    spawned again on the lanes of the roads away from the start poses for each generation.
+
+    A ValueError is raised when a trainer is made for a world without any start marking or road
+    to start the cars on, or with route fitness for a world without any target marking on a road.
+    """
+
+    stats_fields = [
+        "generation",
+        "best_fitness",
+        "mean_fitness",
+        "survivors",
+        "ticks",
+        "seconds",
+    ]
+
+    def __init__(
+        self,
+        world: World,
+        population: int = 100,
+        max_ticks: int = 3000,
+        mutation_amount: float = 0.1,
+        brain: NeuralNetwork | None = None,
+        decision_interval: int = 1,
+        staggered_decisions: bool = False,
+        route_fitness: bool = False,
+        traffic_cars: int = 0,
+    ) -> None:
+        self.world = world
+        self.population = population
+        self.max_ticks = max_ticks
+        self.mutation_amount = mutation_amount
+        self.best_brain = brain
+        self.decision_interval = decision_interval
+        self.staggered_decisions = staggered_decisions
+        self.distance_field = None
+        if route_fitness:
+            self.distance_field = DistanceField(world)
+            self.distance_field.refresh()
+            if not self.distance_field.has_targets():
+                raise ValueError(
+                    "Route fitness needs a target marking on a road, and the world has none."
+                )
+        self.traffic_cars = traffic_cars
+        self.lane_graph = None
+        if traffic_cars:
+            self.lane_graph = LaneGraph(world)
+            self.lane_graph.refresh()
+        self.generation = 0
+        self.road_borders = []
+        for segment in self.world.road_network["outer_lines"]:
+            self.road_borders.append(Polygon([segment.start, segment.end]))
+        self.start_poses = self.find_start_poses()
+        if not self.start_poses:
+            raise ValueError("The world has no start marking and no road to start cars on.")
+
+    def find_start_poses(self) -> list:
+        """Find where cars start. Cars start at start markings, or at the middle of the first
+        road if the world has no start markings. With route fitness, cars only start at the
+        start markings that have a route to a target, if there are any.
+
+        Returns:
+            list: A list of tuples that include a start point and a start angle.
+        """
+        markings = [marking for marking in self.world.markings if marking.type == "start"]
+        if self.distance_field:
+            markings = self.distance_field.reachable_starts() or markings
+        start_poses = [marking.pose() for marking in markings]
+        if not start_poses and self.world.roads:
+            segment = self.world.roads[0].segment
+            start_poses.append(
+                (segment.midpoint(), degrees(segment.direction().angle()) - 90)
+            )
+        return start_poses
+
+    def generate_cars(self) -> list:
+        """Generate the cars of the next generation. The first car gets the best brain so far
+        and the others get mutated copies of it.
+
+        Returns:
+            list: List of cars.
+        """
+        cars = []
+        for i in range(self.population):
+            start_point, start_angle = choice(self.start_poses)
+            car = Car(Point(start_point.x, start_point.y), start_angle, "ai")
+            if self.best_brain:
+                car.brain = deepcopy(self.best_brain)
+                if i != 0:
+                    car.brain.mutate(self.mutation_amount)
+            cars.append(car)
+        return cars
+
+    def run_generation(self) -> dict:
+        """Drive one generation of cars until all of them are retired or the tick limit is
+        reached, and keep the brain of the best car.
+
+        Returns:
+            dict: The statistics of the generation.
+        """
+        start_time = perf_counter()
+        traffic = None
+        if self.traffic_cars:
+            traffic = Traffic(self.lane_graph, randrange(2**32))
+            traffic.keep_clear = [point for point, _ in self.start_poses]
+            traffic.spawn(self.traffic_cars)
+        fleet = Fleet(
+            self.generate_cars(), self.road_borders, self.distance_field, traffic
+        )
+        fleet.schedule_decisions(self.decision_interval, self.staggered_decisions)
+        while fleet.age < self.max_ticks:
+            fleet.update()
+            if fleet.is_finished():
+                break
+        self.best_brain = fleet.best_car.brain
+        self.generation += 1
+        fitnesses = [car.fitness for car in fleet.cars]
+        return {
+            "generation": self.generation,
+            "best_fitness": fleet.best_car.fitness,
+            "mean_fitness": sum(fitnesses) / len(fitnesses),
+            "survivors": len(fleet.active_cars),
+            "ticks": fleet.age,
+            "seconds": perf_counter() - start_time,
+        }
+
+    def save_checkpoint(self, path: Path) -> None:
+        """Save the best brain so far.
+
+        Args:
+            path (Path): The file to save into.
+        """
+        with open(path, "wt", encoding="UTF-8") as file:
+            dump(
+                {"generation": self.generation, "brain": self.best_brain},
+                file,
+                default=lambda o: o.__dict__,
+                indent=4,
+            )
+
+    def train(self, generations: int, output_directory: str) -> None:
+        """Evolve the given number of generations. After each generation the best brain is
+        saved to best_brain.json and the statistics are appended to stats.csv in the output
+        directory.
+
+        Args:
+            generations (int): The number of generations to evolve.
+            output_directory (str): The directory to write checkpoints and statistics into.
+        """
+        directory = Path(output_directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stats_path = Path(directory, "stats.csv")
+        if not stats_path.exists():
+            with open(stats_path, "wt", encoding="UTF-8", newline="") as file:
+                writer(file).writerow(self.stats_fields)
+        for _ in range(generations):
+            stats = self.run_generation()
+            with open(stats_path, "at", encoding="UTF-8", newline="") as file:
+                writer(file).writerow([stats[field] for field in self.stats_fields])
+            self.save_checkpoint(Path(directory, "best_brain.json"))
+            print(
+                f"generation {stats['generation']}: "
+                f"best {stats['best_fitness']:.2f}, "
+                f"mean {stats['mean_fitness']:.2f}, "
+                f"survivors {stats['survivors']}, "
+                f"{stats['ticks']} ticks in {stats['seconds']:.2f} s"
+            )
@@ -5,17 +5,40 @@ from math import floor, inf
 from json import dump, load
 from random import random
 from pathlib2 import Path
-from PyQt6.QtGui import QPainter, QColor
 from src.primitives.point import Point
 from src.primitives.segment import Segment
 from src.primitives.polygon import Polygon
+from src.primitives.point_array import PointArray
 from src.maths.graph import Graph
+from src.maths.spatial_index import SpatialIndex
 from src.primitives.envelope import Envelope
 from src.items.building import Building
 from src.items.tree import Tree
 from src.items.road import Road
 from src.items.intersection import Intersection
-from src.maths.utils import lerp, find_intersect
+from src.markings.cross_marking import CrossMarking
+from src.markings.park_marking import ParkMarking
+from src.markings.start_marking import StartMarking
+from src.markings.stop_marking import StopMarking
+from src.markings.target_marking import TargetMarking
+from src.markings.traffic_light_marking import TrafficLightMarking
+from src.markings.yield_marking import YieldMarking
+from src.markings.marking_list import MarkingList
+from src.maths.utils import lerp, find_intersect, to_data
+from src.maths import kernel
+
+WORLD_BACKUP_PATH = Path(
+    Path(__file__).parent.parent.parent, "data/backups/world_backup.json"
+)
+MARKING_TYPES = {
+    "cross": CrossMarking,
+    "park": ParkMarking,
+    "start": StartMarking,
+    "stop": StopMarking,
+    "target": TargetMarking,
+    "traffic_light": TrafficLightMarking,
+    "yield": YieldMarking,
+}
 
 
 class World:
@@ -33,16 +56,25 @@ class World:
         self.tree_size = 160
         self.roads = []
         self.intersections = []
+        self.roads_at_points = {}
+        self.intersections_at_points = {}
+        self.road_ends = {}
+        self.road_order = []
         self.road_borders = []
         self.buildings = []
         self.trees = []
         self.lane_guides = []
-        self.markings = []
+        self.markings = MarkingList()
         self.road_network = {}
+        self.outline_pieces = {}
         self.generate()
 
-    def save(self) -> None:
-        """Save the state of the application"""
+    def save(self, path: str | None = None) -> None:
+        """Save the state of the application
+
+        Args:
+            path (str | None, optional): The file to save into. Defaults to the world backup.
+        """
         data = {"graph": self.graph, "roads": [], "markings": self.markings}
         for road in self.roads:
             data["roads"].append(
@@ -60,48 +92,42 @@ class World:
                     "name": road.name,
                 }
             )
-        with open(
-            Path(Path(__file__).parent.parent.parent, "data/backups/world_backup.json"),
-            "wt",
-            encoding="UTF-8",
-        ) as file:
+        with open(path or WORLD_BACKUP_PATH, "wt", encoding="UTF-8") as file:
             dump(
                 data,
                 file,
-                default=lambda o: o.__dict__,
+                default=to_data,
                 sort_keys=True,
                 indent=4,
             )
 
-    def load(self) -> Self:
-        """A method that extracts information from data."""
-        with open(
-            Path(Path(__file__).parent.parent.parent, "data/backups/world_backup.json"),
-            "rt",
-            encoding="UTF-8",
-        ) as file:
+    def load(self, path: str | None = None) -> Self:
+        """A method that extracts information from data.
+
+        Args:
+            path (str | None, optional): The file to load from. Defaults to the world backup.
+        """
+        with open(path or WORLD_BACKUP_PATH, "rt", encoding="UTF-8") as file:
             data = load(file)
             for point in data["graph"]["points"]:
                 self.graph.add_point(Point(point["x"], point["y"]))
             for segment in data["graph"]["segments"]:
+                start = Point(segment["start"]["x"], segment["start"]["y"])
+                end = Point(segment["end"]["x"], segment["end"]["y"])
                 self.graph.add_segment(
                     Segment(
-                        Point(segment["start"]["x"], segment["start"]["y"]),
-                        Point(segment["end"]["x"], segment["end"]["y"]),
+                        self.graph.find_point(start) or start,
+                        self.graph.find_point(end) or end,
                     )
                 )
             for road in data["roads"]:
+                segment = Segment(
+                    Point(road["segment"]["start"]["x"], road["segment"]["start"]["y"]),
+                    Point(road["segment"]["end"]["x"], road["segment"]["end"]["y"]),
+                )
                 self.roads.append(
                     Road(
-                        Segment(
-                            Point(
-                                road["segment"]["start"]["x"],
-                                road["segment"]["start"]["y"],
-                            ),
-                            Point(
-                                road["segment"]["end"]["x"], road["segment"]["end"]["y"]
-                            ),
-                        ),
+                        self.graph.find_segment(segment) or segment,
                         road["number_of_lanes_in_left_side"],
                         road["number_of_lanes_in_right_side"],
                         road["name"],
@@ -113,6 +139,21 @@ class World:
                         road["is_end_connected"],
                     )
                 )
+            for marking in data["markings"]:
+                self.markings.append(
+                    MARKING_TYPES[marking["type"]](
+                        Point(
+                            marking["center_of_segment"]["x"],
+                            marking["center_of_segment"]["y"],
+                        ),
+                        Point(
+                            marking["direction_of_segment"]["x"],
+                            marking["direction_of_segment"]["y"],
+                        ),
+                        marking["width"],
+                        marking["height"],
+                    )
+                )
 
     def generate(self) -> None:
         """Generate the world objects like roads, trees, buildings, and others."""
@@ -123,25 +164,74 @@ class World:
         # self.trees = self.generate_trees()
 
     def generate_road_network(self) -> None:
-        envelopes = []
-        polygons = []
-        for road in self.roads:
-            envelopes.append(road.envelope)
-            polygons.append(road.envelope.polygon)
-        segments = Polygon.union(polygons)
-        self.road_network["envelopes"] = envelopes
+        """Generate the envelopes and the outer lines of the road network.
+
+        The outer lines of a road only depend on the roads whose envelopes come close to its
+        own, so they are kept for every road together with those neighbors and only found again
+        for the roads whose neighborhood has changed since the last call.
+        """
+        polygons = [road.envelope.polygon for road in self.roads]
+        index = SpatialIndex.of_boxes(
+            self.roads, [polygon.bounding_box for polygon in polygons]
+        )
+        neighborhoods = []
+        changed = []
+        for road, polygon in zip(self.roads, polygons):
+            neighbors = (road,)
+            if polygon.segments:
+                left, top, right, bottom = polygon.bounding_box
+                neighbors = tuple(index.query((left - 1, top - 1, right + 1, bottom + 1)))
+            neighborhoods.append(neighbors)
+            cached = self.outline_pieces.get(id(road))
+            if not (
+                cached
+                and cached[0] is road
+                and len(cached[1]) == len(neighbors)
+                and all(a is b for a, b in zip(cached[1], neighbors))
+            ):
+                changed.append(road)
+        pieces = {}
+        if changed:
+            order = {id(road): i for i, road in enumerate(self.roads)}
+            involved = {}
+            for road in changed:
+                for neighbor in neighborhoods[order[id(road)]]:
+                    involved[id(neighbor)] = neighbor
+            involved = sorted(involved.values(), key=lambda road: order[id(road)])
+            changed = {id(road) for road in changed}
+            for road, road_pieces in zip(
+                involved,
+                Polygon.union_pieces([road.envelope.polygon for road in involved]),
+            ):
+                if id(road) in changed:
+                    pieces[id(road)] = road_pieces
+        outline_pieces = {}
+        segments = []
+        for road, neighbors in zip(self.roads, neighborhoods):
+            if id(road) in pieces:
+                road_pieces = pieces[id(road)]
+            else:
+                road_pieces = self.outline_pieces[id(road)][2]
+            outline_pieces[id(road)] = (road, neighbors, road_pieces)
+            segments.extend(road_pieces)
+        self.outline_pieces = outline_pieces
+        self.road_network["envelopes"] = [road.envelope for road in self.roads]
         self.road_network["outer_lines"] = segments
 
     def generate_roads(
         self, number_of_left_lanes: int, number_of_right_lanes: int, is_oneway: bool
     ) -> None:
-        """Generate roads, road borders, and lane guides."""
+        """Generate roads, road borders, and lane guides. Roads whose segments are unchanged
+        are kept as they are and only the roads whose segments were moved are built again.
+        Graph segments without a road that touch a road are added together with add_roads,
+        and the ones it rejects are left in the graph without a road."""
         roads = []
-        segments = self.graph.segments.copy()
+        segments = {Graph.segment_key(segment): segment for segment in self.graph.segments}
         for road in self.roads:
-            if road.segment in segments:
-                roads.append(
-                    Road(
+            key = Graph.segment_key(road.segment)
+            if key in segments:
+                if road.is_outdated():
+                    road = Road(
                         road.segment,
                         road.number_of_lanes_in_left_side,
                         road.number_of_lanes_in_right_side,
@@ -154,31 +244,96 @@ class World:
                         road.is_start_connected,
                         road.is_end_connected,
                     )
-                )
-                segments.remove(road.segment)
-                continue
-        for segment in segments:
-            for road in self.roads:
-                if (
-                    road.segment.distance_to_point(segment.start) < road.width
-                    or road.segment.distance_to_point(segment.end) < road.width
-                ):
-                    self.add_road(
-                        segment, number_of_left_lanes, number_of_right_lanes, is_oneway
-                    )
+                roads.append(road)
+                del segments[key]
+        loose_segments = [
+            segment
+            for segment in segments.values()
+            if any(
+                road.segment.distance_to_point(segment.start) < road.width
+                or road.segment.distance_to_point(segment.end) < road.width
+                for road in self.roads
+            )
+        ]
         self.roads = roads
+        if loose_segments:
+            for segment in loose_segments:
+                self.graph.remove_segment(segment)
+            accepted = self.add_roads(
+                loose_segments, number_of_left_lanes, number_of_right_lanes, is_oneway
+            )
+            for segment in loose_segments:
+                if not any(segment is other for other in accepted):
+                    self.graph.add_segment(segment)
         self.generate_intersections()
 
     def generate_intersections(self) -> None:
-        """Find and generate intersections."""
-        self.intersections.clear()
-        for point in self.graph.points:
-            roads = []
-            for road in self.roads:
-                if road.segment.contains_point(point):
-                    roads.append(road)
-            if roads:
-                self.intersections.append(Intersection(point, roads))
+        """Find and generate intersections. An intersection whose location and roads are
+        unchanged is kept as it is.
+
+        The roads at every point and the intersections are kept in indexes that are only
+        updated at the ends of the roads that were added, removed or moved since the last call,
+        unless the roads were reordered.
+        """
+        roads = {id(road): road for road in self.roads}
+        touched = set()
+        for key, (road, ends) in list(self.road_ends.items()):
+            if roads.get(key) is road and ends == self.ends_of(road):
+                continue
+            del self.road_ends[key]
+            for end in ends:
+                self.roads_at_points[end].remove(road)
+                if not self.roads_at_points[end]:
+                    del self.roads_at_points[end]
+                touched.add(end)
+        kept = [key for key in self.road_order if key in self.road_ends]
+        if kept != [key for key in roads if key in self.road_ends]:
+            touched.update(self.roads_at_points)
+        self.road_order = list(roads)
+        for key, road in roads.items():
+            if key in self.road_ends:
+                continue
+            ends = self.ends_of(road)
+            self.road_ends[key] = (road, ends)
+            for end in ends:
+                self.roads_at_points.setdefault(end, []).append(road)
+                touched.add(end)
+        if touched:
+            order = {id(road): i for i, road in enumerate(self.roads)}
+            for end in touched:
+                if end in self.roads_at_points:
+                    self.roads_at_points[end].sort(key=lambda road: order[id(road)])
+        for end in touched:
+            roads = self.roads_at_points.get(end)
+            point = self.graph.find_point(Point(*end)) if roads else None
+            if point is None:
+                self.intersections_at_points.pop(end, None)
+                continue
+            intersection = self.intersections_at_points.get(end)
+            if not (
+                intersection
+                and intersection.location is point
+                and len(intersection.connected_roads) == len(roads)
+                and all(a is b for a, b in zip(intersection.connected_roads, roads))
+            ):
+                self.intersections_at_points[end] = Intersection(point, list(roads))
+        if touched:
+            self.intersections = list(self.intersections_at_points.values())
+
+    @staticmethod
+    def ends_of(road: Road) -> tuple:
+        """Find the keys of the points that the given road connects.
+
+        Args:
+            road (Road): The road to find the ends of.
+
+        Returns:
+            tuple: The keys of the start and the end of the segment of the road, or only one key
+                if both ends are the same.
+        """
+        start = Graph.point_key(road.segment.start)
+        end = Graph.point_key(road.segment.end)
+        return (start,) if start == end else (start, end)
 
     def generate_buildings(self) -> list:
         """Generate buildings.
@@ -186,20 +341,11 @@ class World:
         Returns:
             list: A list of generated buildings.
         """
-        envelopes = []
-        for segment in self.graph.segments:
-            envelopes.append(
-                Envelope(
-                    segment,
-                    self.road_lane_width
-                    + self.building_width
-                    + self.space_between_objects * 2,
-                    self.road_roundness,
-                )
-            )
-        polygons = []
-        for envelope in envelopes:
-            polygons.append(envelope.polygon)
+        polygons = Envelope.batch_polygons(
+            self.graph.segments,
+            self.road_lane_width + self.building_width + self.space_between_objects * 2,
+            self.road_roundness,
+        )
         guides = Polygon.union(polygons)
         i = 0
         while i < len(guides):
@@ -224,17 +370,13 @@ class World:
                 point_2 = point_1 + direction.scale(building_length)
                 supports.append(Segment(point_1, point_2))
                 i += 1
-        bases = []
-        for segment in supports:
-            bases.append(Envelope(segment, self.building_width).polygon)
+        bases = Envelope.batch_polygons(supports, self.building_width)
         i = 0
         while i < len(bases) - 1:
             j = i + 1
             while j < len(bases):
-                if (
-                    bases[i].intersect_with_polygon(bases[j])
-                    or bases[i].distance_to_polygon(bases[j])
-                    < self.space_between_objects
+                if bases[i].intersect_with_polygon(bases[j]) or bases[i].near_polygon(
+                    bases[j], self.space_between_objects
                 ):
                     bases.pop(j)
                     continue
@@ -265,43 +407,33 @@ class World:
                 points.append(point)
         trees = []
         if points:
-            points.sort(key=lambda point: point.x)
-            most_left_point = points[0]
-            most_right_point = points[-1]
-            points.sort(key=lambda point: point.y)
-            most_top_point = points[0]
-            most_bottom_point = points[-1]
+            left, top, right, bottom = PointArray.from_points(points).bounding_box()
             try_counter = 0
             while try_counter < 100:
-                point = Point(
-                    lerp(most_left_point.x, most_right_point.x, random()),
-                    lerp(most_top_point.y, most_bottom_point.y, random()),
+                candidates = []
+                for _ in range(100 - try_counter):
+                    candidates.append(
+                        (lerp(left, right, random()), lerp(top, bottom, random()))
+                    )
+                candidates = PointArray(candidates)
+                distances = Polygon.distances_from_polygons(
+                    illegal_polygons, candidates
                 )
-                keep = True
-                for polygon in illegal_polygons:
-                    if (
-                        polygon.contains_point(point)
-                        or polygon.distance_to_point(point) < self.tree_size / 2
-                    ):
-                        keep = False
-                        break
-                if keep:
-                    for tree in trees:
-                        if point.distance_to_point(tree.center) < self.tree_size:
-                            keep = False
-                            break
-                if keep:
-                    close_to_something = False
-                    for polygon in illegal_polygons:
-                        if polygon.distance_to_point(point) < self.tree_size * 2.2:
-                            close_to_something = True
-                            break
-                    keep = close_to_something
-                if keep:
-                    trees.append(Tree(point, self.tree_size))
-                    try_counter = 0
-                    continue
-                try_counter += 1
+                legal = ~(
+                    Polygon.polygons_contain_points(illegal_polygons, candidates)
+                    | (distances < self.tree_size / 2)
+                ).any(axis=0) & (distances < self.tree_size * 2.2).any(axis=0)
+                for point, keep in zip(candidates, legal):
+                    if keep:
+                        for tree in trees:
+                            if point.distance_to_point(tree.center) < self.tree_size:
+                                keep = False
+                                break
+                    if keep:
+                        trees.append(Tree(point, self.tree_size))
+                        try_counter = 0
+                        continue
+                    try_counter += 1
         return trees
 
     def generate_lane_guides(self) -> list:
@@ -310,10 +442,9 @@ class World:
         Returns:
             list: A list of generated lane guides.
         """
-        polygons = []
-        for segment in self.graph.segments:
-            envelope = Envelope(segment, self.road_lane_width / 2, self.road_roundness)
-            polygons.append(envelope.polygon)
+        polygons = Envelope.batch_polygons(
+            self.graph.segments, self.road_lane_width / 2, self.road_roundness
+        )
         return Polygon.union(polygons)
 
     def add_road(
@@ -347,22 +478,30 @@ class World:
                     self.left_hand_rule,
                 )
             )
-        for intersection in self.intersections:
-            if intersection.location in (segment.start, segment.end):
-                for road in intersection.connected_roads:
-                    if road.segment.angle() - segment.angle() < 30:
-                        return
-        for road in self.roads:
+        for end in (segment.start, segment.end):
+            if not self.graph.contains_point(end):
+                continue
+            for road in self.roads_at_points.get(Graph.point_key(end), ()):
+                if road.segment.angle() - segment.angle() < 30:
+                    return
+        road_segments = [road.segment for road in self.roads]
+        projected, offsets = kernel.project_points(
+            [
+                (road_segment.start.x, road_segment.start.y)
+                + (road_segment.end.x, road_segment.end.y)
+                for road_segment in road_segments
+            ],
+            [(segment.start.x, segment.start.y), (segment.end.x, segment.end.y)],
+        )
+        for i, road in enumerate(self.roads):
             distance_1 = inf
             distance_2 = inf
             if road.segment == segment:
                 continue
-            project = road.segment.project_point(segment.start)
-            if 0 <= project["offset"] <= 1:
-                distance_1 = segment.start.distance_to_point(project["point"])
-            project = road.segment.project_point(segment.end)
-            if 0 <= project["offset"] <= 1:
-                distance_2 = segment.end.distance_to_point(project["point"])
+            if 0 <= offsets[i][0] <= 1:
+                distance_1 = segment.start.distance_to_point(Point(*projected[i][0]))
+            if 0 <= offsets[i][1] <= 1:
+                distance_2 = segment.end.distance_to_point(Point(*projected[i][1]))
             distance = min(distance_1, distance_2)
             if distance == 0:
                 continue
@@ -464,7 +603,7 @@ class World:
                         number_of_lanes_in_right_side,
                         is_oneway,
                     )
-                    if graph_segment in self.graph.segments:
+                    if self.graph.contains_segment(graph_segment):
                         self.graph.remove_segment(graph_segment)
                     return
             self.graph.add_segment(segment)
@@ -483,47 +622,212 @@ class World:
             )
         self.generate_intersections()
 
-    def draw(
+    def add_roads(
         self,
-        painter: QPainter,
-        view_point: Point,
-        render_radius: float = 1000,
-    ) -> None:
-        """Draw the world using the given painter.
+        segments: list,
+        number_of_lanes_in_left_side: int,
+        number_of_lanes_in_right_side: int,
+        is_oneway: bool,
+    ) -> list:
+        """Add many roads at once. Every segment is checked with the same length, angle, spacing
+        and crossing rules as add_road, against the existing roads and the segments accepted
+        before it, which are found with a spatial index. The accepted segments and the roads
+        they cross are then split at all their crossings in one pass, and the intersections are
+        generated once at the end.
 
         Args:
-            painter (QPainter): The painter is used for drawing.
-            view_point (Point): The center of the viewport.
-            render_radius (float, optional): Objects that are outside of this radius relative to
-            view_point will not draw. Defaults to 1000.
+            segments (list): The segments of the roads to add, in order.
+            number_of_lanes_in_left_side (int): The number of lanes in the left side of the roads.
+            number_of_lanes_in_right_side (int): The number of lanes in the right side of the
+                roads.
+            is_oneway (bool): Whether the roads are oneway.
+
+        Returns:
+            list: The segments that were accepted, before they were split.
         """
-        # for road in self.roads:
-        #     road.draw(painter)
-        for envelope in self.road_network["envelopes"]:
-            envelope.draw(
-                painter,
-                color=QColor(51, 51, 51),
-                outline_width=15,
-                outline_color=QColor(51, 51, 51),
-            )
-        for segment in self.road_network["outer_lines"]:
-            segment.draw(painter, color=QColor(255, 255, 255), width=5)
-        for road in self.roads:
-            road.draw(painter)
-        for marking in self.markings:
-            if marking.type != "start":
-                marking.draw(painter)
-        items = []
-        for building in self.buildings:
-            if building.base.distance_to_point(view_point) < render_radius:
-                items.append(building)
-        for tree in self.trees:
-            if tree.base.distance_to_point(view_point) < render_radius:
-                items.append(tree)
-        items.sort(
-            reverse=True, key=lambda item: item.base.distance_to_point(view_point)
+        width = self.road_lane_width * (
+            number_of_lanes_in_left_side + number_of_lanes_in_right_side
         )
-        for item in items:
-            item.draw(painter, view_point)
-        # for intersection in self.intersections:
-        #     intersection.draw(painter)
+        records = [
+            {
+                "road": road,
+                "segment": road.segment,
+                "width": road.width,
+                "settings": (
+                    road.number_of_lanes_in_left_side,
+                    road.number_of_lanes_in_right_side,
+                    road.name,
+                    road.lane_width,
+                    road.priority,
+                    road.elevation,
+                    road.is_oneway,
+                    road.lefthand_rule,
+                ),
+                "cuts": [],
+            }
+            for road in self.roads
+        ]
+        margin = 20 + (max([width] + [road.width for road in self.roads]) + width) / 2
+        index = SpatialIndex(2 * margin)
+        for record in records:
+            index.insert(record, self.box_of(record["segment"], 0))
+        ends = {}
+        for key, roads in self.roads_at_points.items():
+            ends[key] = [road.segment for road in roads]
+        accepted = []
+        for segment in segments:
+            if segment.length() <= width + 50:
+                continue
+            if self.graph.contains_segment(segment) or self.graph.contains_segment(
+                Segment(segment.end, segment.start)
+            ):
+                continue
+            if any(
+                other.angle() - segment.angle() < 30
+                for end in (segment.start, segment.end)
+                for other in ends.get(Graph.point_key(end), ())
+            ):
+                continue
+            nearby = index.query(self.box_of(segment, margin))
+            if nearby and self.is_crowded(segment, width, nearby):
+                continue
+            crossings = self.find_crossings(segment, width, nearby)
+            if crossings is None:
+                continue
+            record = {
+                "road": None,
+                "segment": segment,
+                "width": width,
+                "settings": (
+                    number_of_lanes_in_left_side,
+                    number_of_lanes_in_right_side,
+                    "",
+                    self.road_lane_width,
+                    0,
+                    0,
+                    is_oneway,
+                    self.left_hand_rule,
+                ),
+                "cuts": [],
+            }
+            for other, offset, other_offset, point in crossings:
+                record["cuts"].append((offset, point))
+                other["cuts"].append((other_offset, point))
+            records.append(record)
+            index.insert(record, self.box_of(segment, 0))
+            for end in (segment.start, segment.end):
+                ends.setdefault(Graph.point_key(end), []).append(segment)
+            accepted.append(segment)
+        for record in records:
+            road = record["road"]
+            if road and not record["cuts"]:
+                continue
+            segment = record["segment"]
+            if road:
+                self.roads.remove(road)
+                if self.graph.contains_segment(segment):
+                    self.graph.remove_segment(segment)
+            start = self.graph.find_point(segment.start) or segment.start
+            end = self.graph.find_point(segment.end) or segment.end
+            self.graph.add_point(start)
+            self.graph.add_point(end)
+            pieces = []
+            for _, point in sorted(record["cuts"], key=lambda cut: cut[0]):
+                self.graph.add_point(point)
+                pieces.append(Segment(start, point))
+                start = point
+            pieces.append(Segment(start, end))
+            for piece in pieces:
+                self.graph.add_segment(piece)
+                self.roads.append(Road(piece, *record["settings"]))
+        self.generate_intersections()
+        return accepted
+
+    @staticmethod
+    def box_of(segment: Segment, margin: float) -> tuple:
+        """Find the bounding box of the given segment grown by the given margin.
+
+        Args:
+            segment (Segment): The segment to find the box of.
+            margin (float): The margin to add on every side.
+
+        Returns:
+            tuple: The left, top, right and bottom of the box.
+        """
+        left, top, right, bottom = segment.bounding_box()
+        return (left - margin, top - margin, right + margin, bottom + margin)
+
+    @staticmethod
+    def is_crowded(segment: Segment, width: float, records: list) -> bool:
+        """Check the spacing rule of add_road for a new road against the given roads.
+
+        Args:
+            segment (Segment): The segment of the new road.
+            width (float): The width of the new road.
+            records (list): The records of the roads to check against.
+
+        Returns:
+            bool: True if the new road comes too close to one of the roads otherwise False.
+        """
+        projected, offsets = kernel.project_points(
+            [
+                (record["segment"].start.x, record["segment"].start.y)
+                + (record["segment"].end.x, record["segment"].end.y)
+                for record in records
+            ],
+            [(segment.start.x, segment.start.y), (segment.end.x, segment.end.y)],
+        )
+        for i, record in enumerate(records):
+            other = record["segment"]
+            if other == segment:
+                continue
+            limit = 20 + (record["width"] / 2) + (width / 2)
+            distance_1 = inf
+            distance_2 = inf
+            if 0 <= offsets[i][0] <= 1:
+                distance_1 = segment.start.distance_to_point(Point(*projected[i][0]))
+            if 0 <= offsets[i][1] <= 1:
+                distance_2 = segment.end.distance_to_point(Point(*projected[i][1]))
+            distance = min(distance_1, distance_2)
+            if distance == 0:
+                continue
+            if distance < limit:
+                return True
+            end = segment.start if distance_1 < distance_2 else segment.end
+            distance = min(end.distance_to_point(other.start), end.distance_to_point(other.end))
+            if distance != 0 and distance < limit:
+                return True
+        return False
+
+    @staticmethod
+    def find_crossings(segment: Segment, width: float, records: list) -> list | None:
+        """Find where a new road crosses the given roads and check the crossing rule of add_road
+        for each crossing. The crossings must also keep the same distance from the other cuts
+        already made on the crossed roads.
+
+        Args:
+            segment (Segment): The segment of the new road.
+            width (float): The width of the new road.
+            records (list): The records of the roads to check against.
+
+        Returns:
+            list | None: A list of the crossed record, the offset on the new road, the offset on
+                the crossed road and the crossing point of every crossing, or None if one of
+                the crossings breaks the rule.
+        """
+        crossings = []
+        for record in records:
+            other = record["segment"]
+            intersect = find_intersect(segment.start, segment.end, other.start, other.end)
+            if not (intersect and 0 < intersect["offset"] < 1):
+                continue
+            point = Point(intersect["x"], intersect["y"])
+            for end in [other.start, other.end] + [cut for _, cut in record["cuts"]]:
+                if point.distance_to_point(end) < record["width"] + 50:
+                    return None
+            for end in [segment.start, segment.end] + [cut for *_, cut in crossings]:
+                if point.distance_to_point(end) < width + 50:
+                    return None
+            other_offset = other.project_point(point)["offset"]
+            crossings.append((record, intersect["offset"], other_offset, point))
+        return crossings
@@ -1,6 +1,6 @@
 """This module contains the Marking class."""
 
-from PyQt6.QtGui import QPainter
+from math import degrees
 from src.primitives.point import Point
 from src.primitives.segment import Segment
 from src.primitives.envelope import Envelope
@@ -36,10 +36,21 @@ class Marking:
                 Segment(Point(), Point()),
                 Segment(Point(), Point()),
             ]
+            self.polygon.invalidate()
 
-    def draw(self, painter: QPainter) -> None:
-        """Draw the graph editor using the given painter. This is an abstract method.
+    def angle(self) -> float:
+        """Get the angle that a car standing on the marking faces, in the angle convention of
+        cars.
 
-        Args:
-            painter (QPainter): The painter is used for drawing.
+        Returns:
+            float: The angle in degrees.
         """
+        return degrees(self.direction_of_segment.angle()) - 90
+
+    def pose(self) -> tuple:
+        """Get where a car standing on the marking is and which way it faces.
+
+        Returns:
+            tuple: A copy of the center of the marking and the angle in degrees.
+        """
+        return Point(self.center_of_segment.x, self.center_of_segment.y), self.angle()
@@ -0,0 +1,69 @@
+"""This module contains the MarkingList class."""
+
+from typing import Self
+from src.maths.utils import next_version
+
+
+class MarkingList(list):
+    """MarkingList class represents a list of markings that takes a new version number whenever
+    it is changed, so a change can be detected without comparing the markings.
+    """
+
+    def __init__(self, markings: list | None = None) -> None:
+        super().__init__(markings or [])
+        self.version = next_version()
+
+    def touch(self) -> None:
+        """Take a new version number after the list was changed."""
+        self.version = next_version()
+
+    def append(self, marking: object) -> None:
+        super().append(marking)
+        self.touch()
+
+    def extend(self, markings: list) -> None:
+        super().extend(markings)
+        self.touch()
+
+    def insert(self, index: int, marking: object) -> None:
+        super().insert(index, marking)
+        self.touch()
+
+    def remove(self, marking: object) -> None:
+        super().remove(marking)
+        self.touch()
+
+    def pop(self, index: int = -1) -> object:
+        marking = super().pop(index)
+        self.touch()
+        return marking
+
+    def clear(self) -> None:
+        super().clear()
+        self.touch()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.touch()
+
+    def __setitem__(self, index: int | slice, value: object) -> None:
+        super().__setitem__(index, value)
+        self.touch()
+
+    def __delitem__(self, index: int | slice) -> None:
+        super().__delitem__(index)
+        self.touch()
+
+    def __iadd__(self, markings: list) -> Self:
+        super().__iadd__(markings)
+        self.touch()
+        return self
+
+    def __imul__(self, times: int) -> Self:
+        super().__imul__(times)
+        self.touch()
+        return self
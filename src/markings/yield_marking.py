@@ -1,13 +1,11 @@
 """This module contains the YieldMarking class."""
 
-from math import degrees
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPainter, QColor
 from src.primitives.point import Point
 from src.markings.marking import Marking
 
 
-class YieldMarking(Marking):
+# Drawing lives in marking_renderer, so a marking only sets up its own state and type.
+class YieldMarking(Marking):  # pylint: disable=too-few-public-methods
     """YieldMarking class represents a yield marking. Inherited from Marking."""
 
     def __init__(
@@ -20,31 +18,3 @@ class YieldMarking(Marking):
         super().__init__(center_of_segment, direction_of_segment, width, height)
         self.borders = [self.polygon.segments[2]]
         self.type = "yield"
-
-    def draw(self, painter: QPainter) -> None:
-        """Draw the yield marking using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-        """
-        for border in self.borders:
-            border.draw(painter, 4, color=QColor(255, 255, 255))
-        painter.save()
-        painter.translate(
-            self.center_of_segment.x,
-            self.center_of_segment.y,
-        )
-        painter.rotate(degrees(self.direction_of_segment.angle()) - 90)
-        painter.scale(1, 3)
-        font = painter.font()
-        font.setPixelSize(20)
-        painter.setFont(font)
-        painter.drawText(
-            -round(self.width / 2),
-            -round(self.height / 2),
-            round(self.width),
-            round(self.height),
-            Qt.AlignmentFlag.AlignCenter,
-            "YIELD",
-        )
-        painter.restore()
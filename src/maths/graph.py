@@ -1,26 +1,50 @@
 """This module contains the Graph class."""
 
+from math import inf
 from typing import Self
-from PyQt6.QtGui import QPainter, QColor
 from src.primitives.segment import Segment
-from src.primitives.circle import Circle
 from src.primitives.point import Point
+from src.primitives.point_array import PointArray
+from src.maths.utils import next_version
+from src.maths.spatial_index import SpatialIndex
 
 
 class Graph:
-    """Graph class represents a graph."""
+    """Graph class represents a graph.
+
+    The points and segments are kept in lists, together with hash indexes keyed by coordinates,
+    the position of every point and segment in its list, and an adjacency list of the segments
+    at every point, so that membership, insertion, removal and neighbor queries do not scan the
+    whole graph. A removed point or segment is replaced in its list by the last one, so the
+    lists keep the order of addition only until something is removed. Points and
+    segments are also kept in spatial indexes for nearest and within-radius queries. Points of
+    the graph must be moved with move_point to keep the indexes in step.
+
+    Every change gives the graph a new version number, so a change can be detected by comparing
+    versions instead of comparing graphs.
+    """
+
+    cell_size = 200
 
     def __init__(
         self, points: list | None = None, segments: list | None = None
     ) -> None:
         self.points = []
+        self.segments = []
+        self._point_index = {}
+        self._segment_index = {}
+        self._point_positions = {}
+        self._segment_positions = {}
+        self._adjacency = {}
+        self._point_grid = SpatialIndex(self.cell_size)
+        self._segment_grid = SpatialIndex(self.cell_size)
+        self._version = next_version()
         if points:
             for point in points:
-                self.points.append(point)
-        self.segments = []
+                self._append_point(point)
         if segments:
             for segment in segments:
-                self.segments.append(segment)
+                self._append_segment(segment)
 
     def __eq__(self, other: Self) -> bool:
         if (len(self.points) != len(other.points)) or (
@@ -38,24 +62,108 @@ class Graph:
     def __ne__(self, other: Self) -> bool:
         return not self == other
 
+    @property
+    def version(self) -> int:
+        """The version number of the graph, which changes whenever the graph changes."""
+        return self._version
+
+    @staticmethod
+    def point_key(point: Point) -> tuple:
+        """Get the key that the given point is indexed with.
+
+        Args:
+            point (Point): The point to get the key of.
+
+        Returns:
+            tuple: The x and y of the point.
+        """
+        return (point.x, point.y)
+
+    @staticmethod
+    def segment_key(segment: Segment) -> tuple:
+        """Get the key that the given segment is indexed with. Segments are directed, so a
+        segment and its reverse have different keys.
+
+        Args:
+            segment (Segment): The segment to get the key of.
+
+        Returns:
+            tuple: The keys of the start and the end of the segment.
+        """
+        return (Graph.point_key(segment.start), Graph.point_key(segment.end))
+
+    @staticmethod
+    def _swap_remove(items: list, positions: dict, item: object) -> None:
+        index = positions.pop(id(item))
+        last = items.pop()
+        if last is not item:
+            items[index] = last
+            positions[id(last)] = index
+
+    def _append_point(self, point: Point) -> None:
+        self._point_positions[id(point)] = len(self.points)
+        self.points.append(point)
+        self._point_index.setdefault(self.point_key(point), []).append(point)
+        self._point_grid.insert(point, (point.x, point.y, point.x, point.y))
+        self._version = next_version()
+
+    def _unindex_point(self, point: Point) -> None:
+        key = self.point_key(point)
+        points = self._point_index[key]
+        index = next((i for i, indexed in enumerate(points) if indexed is point), 0)
+        del points[index]
+        if not points:
+            del self._point_index[key]
+
+    def _append_segment(self, segment: Segment) -> None:
+        self._segment_positions[id(segment)] = len(self.segments)
+        self.segments.append(segment)
+        self._segment_index.setdefault(self.segment_key(segment), segment)
+        self._segment_grid.insert(segment, segment.bounding_box())
+        self._link(segment)
+        self._version = next_version()
+
+    def _link(self, segment: Segment) -> None:
+        start, end = self.segment_key(segment)
+        self._adjacency.setdefault(start, []).append(segment)
+        if end != start:
+            self._adjacency.setdefault(end, []).append(segment)
+
+    def _unlink(self, segment: Segment) -> None:
+        for key in set(self.segment_key(segment)):
+            segments = self._adjacency[key]
+            for i, incident in enumerate(segments):
+                if incident is segment:
+                    del segments[i]
+                    break
+            if not segments:
+                del self._adjacency[key]
+
     def load(self, data: dict) -> None:
         """A method that extracts information from data.
 
         Args:
             data (dict): The given data.
         """
-        self.points = []
+        self.clear()
         for point in data["points"]:
-            self.points.append(Point(point["x"], point["y"]))
-        self.segments = []
+            self._append_point(Point(point["x"], point["y"]))
         for segment in data["segments"]:
-            self.segments.append(
+            self._append_segment(
                 Segment(
                     Point(segment["start"]["x"], segment["start"]["y"]),
                     Point(segment["end"]["x"], segment["end"]["y"]),
                 )
             )
 
+    def vertices(self) -> PointArray:
+        """Pack the points of the graph in a point array.
+
+        Returns:
+            PointArray: The point array of the points of the graph.
+        """
+        return PointArray.from_points(self.points)
+
     def add_point(self, point: Point) -> None:
         """Add the given point object to the current graph.
 
@@ -63,7 +171,7 @@ class Graph:
             point (Point): The point to add to the current graph.
         """
         if not self.contains_point(point):
-            self.points.append(point)
+            self._append_point(point)
 
     def contains_point(self, point: Point) -> bool:
         """Check if the given point is a point of the graph.
@@ -74,7 +182,19 @@ class Graph:
         Returns:
             bool: True if the point is a point of the graph otherwise False.
         """
-        return point in self.points
+        return self.point_key(point) in self._point_index
+
+    def find_point(self, point: Point) -> Point | None:
+        """Find the point object of the graph that is equal to the given point.
+
+        Args:
+            point (Point): The point to find.
+
+        Returns:
+            Point | None: The point of the graph or None if the graph does not contain it.
+        """
+        points = self._point_index.get(self.point_key(point))
+        return points[0] if points else None
 
     def add_segment(self, segment: Segment) -> None:
         """Add the given segment object to the current graph.
@@ -83,7 +203,7 @@ class Graph:
             segment (Segment): The segment to add to the current graph.
         """
         if not self.contains_segment(segment):
-            self.segments.append(segment)
+            self._append_segment(segment)
 
     def contains_segment(self, segment: Segment) -> bool:
         """Check if the given segment is a segment of the graph.
@@ -94,18 +214,42 @@ class Graph:
         Returns:
             bool: True if the segment is a segment of the graph otherwise False.
         """
-        return segment in self.segments
+        return self.segment_key(segment) in self._segment_index
+
+    def find_segment(self, segment: Segment) -> Segment | None:
+        """Find the segment object of the graph that is equal to the given segment.
+
+        Args:
+            segment (Segment): The segment to find.
+
+        Returns:
+            Segment | None: The segment of the graph or None if the graph does not contain it.
+        """
+        return self._segment_index.get(self.segment_key(segment))
 
     def remove_point(self, point: Point) -> None:
         """Remove the given point and all the segments that contain that point from the graph.
 
         Args:
             point (Point): The point to remove.
+
+        Raises:
+            ValueError: If the graph has no point equal to the given point.
         """
         segments = self.segments_contain_point(point)
         for segment in segments:
             self.remove_segment(segment)
-        self.points.remove(point)
+        removed = point
+        if id(point) not in self._point_positions:
+            removed = self.find_point(point)
+            if removed is None:
+                raise ValueError(f"The point ({point.x}, {point.y}) is not in the graph.")
+        self._swap_remove(self.points, self._point_positions, removed)
+        self._unindex_point(removed)
+        others = self._point_index.get(self.point_key(removed), ())
+        if removed in self._point_grid and not any(other is removed for other in others):
+            self._point_grid.remove(removed)
+        self._version = next_version()
 
     def remove_segment(self, segment: Segment) -> None:
         """Remove the given segment from the graph.
@@ -113,7 +257,43 @@ class Graph:
         Args:
             segment (Segment): The segment to remove.
         """
-        self.segments.remove(segment)
+        key = self.segment_key(segment)
+        stored = self._segment_index.pop(key)
+        self._swap_remove(self.segments, self._segment_positions, stored)
+        if stored in self._segment_grid:
+            self._segment_grid.remove(stored)
+        self._unlink(stored)
+        self._version = next_version()
+
+    def move_point(self, point: Point, x: float, y: float) -> None:
+        """Move the given point of the graph and the ends of its segments to the given position.
+
+        Args:
+            point (Point): The point to move.
+            x (float): The new x of the point.
+            y (float): The new y of the point.
+        """
+        key = self.point_key(point)
+        segments = self.segments_contain_point(point)
+        for segment in segments:
+            if self._segment_index.get(self.segment_key(segment)) is segment:
+                del self._segment_index[self.segment_key(segment)]
+            self._unlink(segment)
+        self._unindex_point(point)
+        for segment in segments:
+            for end in (segment.start, segment.end):
+                if self.point_key(end) == key:
+                    end.x = x
+                    end.y = y
+        point.x = x
+        point.y = y
+        self._point_index.setdefault(self.point_key(point), []).append(point)
+        self._point_grid.insert(point, (x, y, x, y))
+        for segment in segments:
+            self._segment_index.setdefault(self.segment_key(segment), segment)
+            self._segment_grid.insert(segment, segment.bounding_box())
+            self._link(segment)
+        self._version = next_version()
 
     def segments_contain_point(self, point: Point) -> list[Segment]:
         """Find all the segments that contain the given point.
@@ -124,28 +304,91 @@ class Graph:
         Returns:
             list[Segment]: A list of all segments that contain the given point
         """
-        segments = []
-        for segment in self.segments:
-            if segment.contains_point(point):
-                segments.append(segment)
-        return segments
+        return list(self._adjacency.get(self.point_key(point), ()))
 
-    def clear(self) -> None:
-        """Clear the graph from points and segments."""
-        self.points.clear()
-        self.segments.clear()
+    def neighbors(self, point: Point) -> list[Point]:
+        """Find the points that are connected to the given point by a segment.
+
+        Args:
+            point (Point): The point to find the neighbors of.
+
+        Returns:
+            list[Point]: The other ends of the segments that contain the given point.
+        """
+        neighbors = []
+        for segment in self._adjacency.get(self.point_key(point), ()):
+            if segment.start == point:
+                neighbors.append(segment.end)
+            else:
+                neighbors.append(segment.start)
+        return neighbors
 
-    def draw(self, painter: QPainter, zoom: float) -> None:
-        """Draw the graph using the given painter.
-        It also changes the drawing size based on the given zoom.
+    def nearest_point(self, point: Point, threshold: float = inf) -> Point | None:
+        """Find the point of the graph nearest to the given point, like utils.nearest_point.
 
         Args:
-            painter (QPainter): The painter is used for drawing.
-            zoom (float): The amount of zoom.
+            point (Point): The point to search around.
+            threshold (float, optional): Only points nearer than this are found. Defaults to inf.
+
+        Returns:
+            Point | None: The nearest point or None if no point is nearer than the threshold.
         """
-        for segment in self.segments:
-            segment.draw(painter, zoom * 3)
-        for point in self.points:
-            Circle(point.x, point.y, zoom * 10).draw(
-                painter, QColor(0, 0, 0), outline_thickness=zoom, transparency=0.4
-            )
+        return self._point_grid.nearest(point, point.distance_to_point, threshold)
+
+    def nearest_segment(self, point: Point, threshold: float = inf) -> Segment | None:
+        """Find the segment of the graph nearest to the given point, like
+        utils.nearest_segment.
+
+        Args:
+            point (Point): The point to search around.
+            threshold (float, optional): Only segments nearer than this are found. Defaults to
+                inf.
+
+        Returns:
+            Segment | None: The nearest segment or None if no segment is nearer than the
+                threshold.
+        """
+        return self._segment_grid.nearest(
+            point, lambda segment: segment.distance_to_point(point), threshold
+        )
+
+    def points_within(self, point: Point, radius: float) -> list[Point]:
+        """Find the points of the graph whose distance from the given point is at most the given
+        radius.
+
+        Args:
+            point (Point): The point to search around.
+            radius (float): The largest distance of the found points.
+
+        Returns:
+            list[Point]: The found points in the order they were added.
+        """
+        return self._point_grid.within(point, radius, point.distance_to_point)
+
+    def segments_within(self, point: Point, radius: float) -> list[Segment]:
+        """Find the segments of the graph whose distance from the given point is at most the
+        given radius.
+
+        Args:
+            point (Point): The point to search around.
+            radius (float): The largest distance of the found segments.
+
+        Returns:
+            list[Segment]: The found segments in the order they were added.
+        """
+        return self._segment_grid.within(
+            point, radius, lambda segment: segment.distance_to_point(point)
+        )
+
+    def clear(self) -> None:
+        """Clear the graph from points and segments."""
+        self.points.clear()
+        self.segments.clear()
+        self._point_index.clear()
+        self._segment_index.clear()
+        self._point_positions.clear()
+        self._segment_positions.clear()
+        self._adjacency.clear()
+        self._point_grid.clear()
+        self._segment_grid.clear()
+        self._version = next_version()
@@ -0,0 +1,378 @@
+"""This module contains the geometry kernel, the batch geometry operations that run in the hot
+paths of the simulation and the world generation.
+
+Every operation has two backends. The reference backend loops over the inputs with the plain
+Python geometry of the primitives, and the vectorized backend does the same work on numpy
+arrays. The backend is chosen with set_backend. Inputs of real calls can be recorded and both
+backends can be compared on them with verify.
+"""
+
+from math import inf
+import numpy as np
+from src.primitives.point import Point
+from src.primitives.segment import Segment
+from src.maths.utils import find_intersect
+
+BACKENDS = ("reference", "vectorized")
+STATE = {"backend": "vectorized", "records": None, "sample_every": 1, "calls": 0}
+
+
+def set_backend(backend: str) -> None:
+    """Choose the backend that runs the geometry operations.
+
+    Args:
+        backend (str): One of BACKENDS.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown geometry backend {backend}, use one of {BACKENDS}.")
+    STATE["backend"] = backend
+
+
+def get_backend() -> str:
+    """Get the backend that runs the geometry operations.
+
+    Returns:
+        str: One of BACKENDS.
+    """
+    return STATE["backend"]
+
+
+def start_recording(sample_every: int = 1) -> None:
+    """Start keeping copies of the inputs of the geometry operations.
+
+    Args:
+        sample_every (int, optional): Keep only one of every that many calls. Defaults to 1.
+    """
+    STATE["records"] = []
+    STATE["sample_every"] = sample_every
+    STATE["calls"] = 0
+
+
+def stop_recording() -> list:
+    """Stop keeping copies of the inputs of the geometry operations.
+
+    Returns:
+        list: The recorded calls as (operation name, arguments) tuples.
+    """
+    records = STATE["records"] or []
+    STATE["records"] = None
+    return records
+
+
+def verify(records: list, tolerance: float = 1e-9) -> dict:
+    """Run both backends on the recorded calls and compare the results.
+
+    Args:
+        records (list): The recorded calls from stop_recording.
+        tolerance (float, optional): The largest absolute difference that is not counted as
+            a divergence. Defaults to 1e-9.
+
+    Returns:
+        dict: For each operation, the number of checked calls, the number of calls that are
+            not bit-identical, the number of divergences beyond the tolerance and the largest
+            difference.
+    """
+    report = {}
+    for name, arguments in records:
+        reference = OPERATIONS[name]["reference"](*arguments)
+        vectorized = OPERATIONS[name]["vectorized"](*arguments)
+        difference = 0.0
+        identical = True
+        for expected, actual in zip(reference, vectorized):
+            expected = np.asarray(expected)
+            actual = np.asarray(actual)
+            if expected.shape != actual.shape:
+                difference = inf
+                identical = False
+                continue
+            if expected.dtype == bool:
+                if np.any(expected != actual):
+                    difference = inf
+                    identical = False
+                continue
+            if not np.array_equal(expected, actual, equal_nan=True):
+                identical = False
+                same_nan = np.isnan(expected) == np.isnan(actual)
+                if not same_nan.all():
+                    difference = inf
+                    continue
+                numbers = ~np.isnan(expected)
+                difference = max(
+                    difference,
+                    float(np.max(np.abs(expected[numbers] - actual[numbers]), initial=0)),
+                )
+        entry = report.setdefault(
+            name, {"calls": 0, "inexact": 0, "divergences": 0, "max_difference": 0.0}
+        )
+        entry["calls"] += 1
+        entry["inexact"] += not identical
+        entry["divergences"] += difference > tolerance
+        entry["max_difference"] = max(entry["max_difference"], difference)
+    return report
+
+
+def run(name: str, *arguments) -> tuple:
+    """Run a geometry operation with the chosen backend, and record its inputs if recording.
+
+    Args:
+        name (str): The name of the operation.
+
+    Returns:
+        tuple: The results of the operation.
+    """
+    records = STATE["records"]
+    if records is not None:
+        STATE["calls"] += 1
+        if STATE["calls"] % STATE["sample_every"] == 0:
+            records.append((name, tuple(np.array(argument) for argument in arguments)))
+    return OPERATIONS[name][STATE["backend"]](*arguments)
+
+
+def intersect_rays(rays: np.ndarray, segments: np.ndarray) -> tuple:
+    """Find where each ray first touches any of the segments, like Sensor.update does.
+
+    Args:
+        rays (np.ndarray): An R×4 array of start x, start y, end x and end y of the rays.
+        segments (np.ndarray): An S×4 array of start x, start y, end x and end y.
+
+    Returns:
+        tuple: The R offsets of the nearest touches along the rays and their R×2 points, both
+            NaN for rays that touch nothing.
+    """
+    return run("intersect_rays", rays, segments)
+
+
+def contains_points(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray, threshold: float
+) -> np.ndarray:
+    """Check for each polygon and each point if the point is inside the polygon, like
+    Polygon.contains_point does.
+
+    Args:
+        segments (np.ndarray): The S×4 segments of all polygons one after another.
+        starts (np.ndarray): The index of the first segment of each polygon.
+        points (np.ndarray): An M×2 array of points.
+        threshold (float): The threshold of Polygon.contains_point.
+
+    Returns:
+        np.ndarray: A P×M boolean array.
+    """
+    return run("contains_points", segments, starts, points, threshold)[0]
+
+
+def distances_to_points(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray
+) -> np.ndarray:
+    """Calculate the minimum distance from each polygon to each point, like
+    Polygon.distance_to_point does.
+
+    Args:
+        segments (np.ndarray): The S×4 segments of all polygons one after another.
+        starts (np.ndarray): The index of the first segment of each polygon.
+        points (np.ndarray): An M×2 array of points.
+
+    Returns:
+        np.ndarray: A P×M array of distances.
+    """
+    return run("distances_to_points", segments, starts, points)[0]
+
+
+def project_points(segments: np.ndarray, points: np.ndarray) -> tuple:
+    """Project each point on each segment, like Segment.project_point does.
+
+    Args:
+        segments (np.ndarray): An S×4 array of start x, start y, end x and end y.
+        points (np.ndarray): An M×2 array of points.
+
+    Returns:
+        tuple: The S×M×2 projected points and the S×M offsets along the segments.
+    """
+    return run("project_points", segments, points)
+
+
+def _intersect_rays_reference(rays: np.ndarray, segments: np.ndarray) -> tuple:
+    offsets = np.full(len(rays), np.nan)
+    points = np.full((len(rays), 2), np.nan)
+    borders = [
+        (Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in np.asarray(segments).tolist()
+    ]
+    for i, (x1, y1, x2, y2) in enumerate(np.asarray(rays).tolist()):
+        start = Point(x1, y1)
+        end = Point(x2, y2)
+        best_offset = inf
+        best_touch = None
+        for border_start, border_end in borders:
+            touch = find_intersect(start, end, border_start, border_end)
+            if touch and touch["offset"] <= best_offset:
+                best_offset = touch["offset"]
+                best_touch = (touch["x"], touch["y"])
+        if best_touch:
+            offsets[i] = best_offset
+            points[i] = best_touch
+    return offsets, points
+
+
+def _intersect_rays_vectorized(rays: np.ndarray, segments: np.ndarray) -> tuple:
+    rays = np.asarray(rays, dtype=np.float64).reshape(-1, 4)
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    offsets = np.full(len(rays), np.nan)
+    points = np.full((len(rays), 2), np.nan)
+    if len(rays) == 0 or len(segments) == 0:
+        return offsets, points
+    a1x, a1y, a2x, a2y = (rays[:, i, np.newaxis] for i in range(4))
+    b1x, b1y, b2x, b2y = (segments[np.newaxis, :, i] for i in range(4))
+    t_top = (b2x - b1x) * (a1y - b1y) - (b2y - b1y) * (a1x - b1x)
+    u_top = (b1y - a1y) * (a1x - a2x) - (b1x - a1x) * (a1y - a2y)
+    bottom = (b2y - b1y) * (a2x - a1x) - (b2x - b1x) * (a2y - a1y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = t_top / bottom
+        u = u_top / bottom
+    touching = (bottom != 0) & (0 <= t) & (t <= 1) & (0 <= u) & (u <= 1)
+    nearest = np.where(touching, t, inf).min(axis=1)
+    hit = np.isfinite(nearest)
+    offsets[hit] = nearest[hit]
+    starts = rays[hit, 0:2]
+    ends = rays[hit, 2:4]
+    points[hit] = starts + (ends - starts) * nearest[hit, np.newaxis]
+    return offsets, points
+
+
+def _contains_points_reference(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray, threshold: float
+) -> tuple:
+    segments = np.asarray(segments).tolist()
+    bounds = list(np.asarray(starts).tolist()) + [len(segments)]
+    points = np.asarray(points).tolist()
+    result = np.zeros((len(bounds) - 1, len(points)), dtype=bool)
+    for i in range(len(bounds) - 1):
+        for j, (px, py) in enumerate(points):
+            intersections = 0
+            for x1, y1, x2, y2 in segments[bounds[i] : bounds[i + 1]]:
+                if (py < y1) != (py < y2):
+                    if px - threshold < (x2 - x1) * (py - y1) / (y2 - y1) + x1:
+                        intersections += 1
+            result[i, j] = intersections % 2 == 1
+    return (result,)
+
+
+def _contains_points_vectorized(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray, threshold: float
+) -> tuple:
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = np.zeros((len(starts), len(points)), dtype=bool)
+    if len(segments) == 0 or len(points) == 0:
+        return (result,)
+    x1, y1, x2, y2 = (segments[:, i, np.newaxis] for i in range(4))
+    px = points[np.newaxis, :, 0]
+    py = points[np.newaxis, :, 1]
+    crossing = (py < y1) != (py < y2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing &= px - threshold < (x2 - x1) * (py - y1) / (y2 - y1) + x1
+    counts = np.add.reduceat(crossing.astype(np.int64), starts, axis=0)
+    result[:] = counts % 2 == 1
+    return (result,)
+
+
+def _distances_to_points_reference(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray
+) -> tuple:
+    segments = [
+        Segment(Point(x1, y1), Point(x2, y2))
+        for x1, y1, x2, y2 in np.asarray(segments).tolist()
+    ]
+    bounds = list(np.asarray(starts).tolist()) + [len(segments)]
+    points = [Point(x, y) for x, y in np.asarray(points).tolist()]
+    result = np.full((len(bounds) - 1, len(points)), inf)
+    for i in range(len(bounds) - 1):
+        for j, point in enumerate(points):
+            for segment in segments[bounds[i] : bounds[i + 1]]:
+                result[i, j] = min(result[i, j], segment.distance_to_point(point))
+    return (result,)
+
+
+def _distances_to_points_vectorized(
+    segments: np.ndarray, starts: np.ndarray, points: np.ndarray
+) -> tuple:
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = np.full((len(starts), len(points)), inf)
+    if len(segments) == 0 or len(points) == 0:
+        return (result,)
+    x1, y1, x2, y2 = (segments[:, i, np.newaxis] for i in range(4))
+    px = points[np.newaxis, :, 0]
+    py = points[np.newaxis, :, 1]
+    bx = x2 - x1
+    by = y2 - y1
+    magnitude = np.sqrt(bx**2 + by**2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaler = 1 / magnitude
+        normal_x = bx * scaler
+        normal_y = by * scaler
+        projection = (px - x1) * normal_x + (py - y1) * normal_y
+        offset = projection / magnitude
+    inside = (0 < offset) & (offset < 1) & (magnitude != 0)
+    squared_distances = np.where(
+        inside,
+        (px - (x1 + normal_x * projection)) ** 2
+        + (py - (y1 + normal_y * projection)) ** 2,
+        np.minimum((x1 - px) ** 2 + (y1 - py) ** 2, (x2 - px) ** 2 + (y2 - py) ** 2),
+    )
+    result[:] = np.sqrt(np.minimum.reduceat(squared_distances, starts, axis=0))
+    return (result,)
+
+
+def _project_points_reference(segments: np.ndarray, points: np.ndarray) -> tuple:
+    segments = np.asarray(segments).tolist()
+    points = [Point(x, y) for x, y in np.asarray(points).tolist()]
+    projected = np.zeros((len(segments), len(points), 2))
+    offsets = np.zeros((len(segments), len(points)))
+    for i, (x1, y1, x2, y2) in enumerate(segments):
+        segment = Segment(Point(x1, y1), Point(x2, y2))
+        for j, point in enumerate(points):
+            project = segment.project_point(point)
+            projected[i, j] = (project["point"].x, project["point"].y)
+            offsets[i, j] = project["offset"]
+    return projected, offsets
+
+
+def _project_points_vectorized(segments: np.ndarray, points: np.ndarray) -> tuple:
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x1, y1, x2, y2 = (segments[:, i, np.newaxis] for i in range(4))
+    px = points[np.newaxis, :, 0]
+    py = points[np.newaxis, :, 1]
+    bx = x2 - x1
+    by = y2 - y1
+    magnitude = np.sqrt(bx**2 + by**2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaler = 1 / magnitude
+        normal_x = bx * scaler
+        normal_y = by * scaler
+        projection = (px - x1) * normal_x + (py - y1) * normal_y
+        offsets = projection / magnitude
+    degenerate = np.broadcast_to(magnitude == 0, offsets.shape)
+    projected = np.stack(
+        (x1 + normal_x * projection, y1 + normal_y * projection), axis=-1
+    )
+    projected[degenerate] = 0
+    offsets = np.where(degenerate, 0, offsets)
+    return projected, offsets
+
+
+OPERATIONS = {
+    "intersect_rays": {
+        "reference": _intersect_rays_reference,
+        "vectorized": _intersect_rays_vectorized,
+    },
+    "contains_points": {
+        "reference": _contains_points_reference,
+        "vectorized": _contains_points_vectorized,
+    },
+    "distances_to_points": {
+        "reference": _distances_to_points_reference,
+        "vectorized": _distances_to_points_vectorized,
+    },
+    "project_points": {
+        "reference": _project_points_reference,
+        "vectorized": _project_points_vectorized,
+    },
+}
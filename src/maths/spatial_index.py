@@ -0,0 +1,285 @@
+"""This module contains the SpatialIndex class."""
+
+from math import floor, inf
+from itertools import count
+from typing import Callable
+from src.primitives.point import Point
+
+
+class SpatialIndex:
+    """SpatialIndex class represents a uniform grid over the plane that finds the items whose
+    bounding boxes overlap a given box without checking every item.
+
+    Items are kept by identity, so an item can be in the index only once. Boxes are tuples of
+    left, top, right and bottom. Items are returned in the order they were first inserted.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = {}
+        self.counter = count()
+        self.extent = None
+
+    @classmethod
+    def of_boxes(cls, items: list, boxes: list) -> "SpatialIndex":
+        """Make an index of the given items with cells as large as the longest side of the given
+        boxes. Items with empty boxes, whose left is greater than their right, are left out.
+
+        Args:
+            items (list): The items to add.
+            boxes (list): The bounding box of every item.
+
+        Returns:
+            SpatialIndex: The made index.
+        """
+        sizes = [
+            max(right - left, bottom - top)
+            for left, top, right, bottom in boxes
+            if left <= right
+        ]
+        index = cls(max(sizes, default=1) or 1)
+        for item, box in zip(items, boxes):
+            if box[0] <= box[2]:
+                index.insert(item, box)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self.entries
+
+    def cells_of(self, box: tuple, extent: tuple | None = None) -> list:
+        """Find the keys of all cells that the given box overlaps.
+
+        Args:
+            box (tuple): The box to find the cells of.
+            extent (tuple | None, optional): The first column, first row, last column and last
+                row to keep the cells within. Defaults to no limit.
+
+        Returns:
+            list: A list of (column, row) keys of the cells.
+        """
+        left, top, right, bottom = box
+        first_column = floor(left / self.cell_size)
+        last_column = floor(right / self.cell_size)
+        first_row = floor(top / self.cell_size)
+        last_row = floor(bottom / self.cell_size)
+        if extent is not None:
+            first_column = max(first_column, extent[0])
+            first_row = max(first_row, extent[1])
+            last_column = min(last_column, extent[2])
+            last_row = min(last_row, extent[3])
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def insert(self, item: object, box: tuple) -> None:
+        """Add the given item with the given bounding box to the index. An item that is already
+        in the index is moved to the new box and keeps its place in the order.
+
+        Args:
+            item (object): The item to add.
+            box (tuple): The bounding box of the item.
+        """
+        key = id(item)
+        if item in self:
+            order = self.entries[key][0]
+            self.remove(item)
+        else:
+            order = next(self.counter)
+        self.entries[key] = (order, item, box)
+        cells = self.cells_of(box)
+        for cell in cells:
+            self.cells.setdefault(cell, {})[key] = item
+        first_column, first_row = cells[0]
+        last_column, last_row = cells[-1]
+        if self.extent is None:
+            self.extent = (first_column, first_row, last_column, last_row)
+        else:
+            self.extent = (
+                min(self.extent[0], first_column),
+                min(self.extent[1], first_row),
+                max(self.extent[2], last_column),
+                max(self.extent[3], last_row),
+            )
+
+    def remove(self, item: object) -> None:
+        """Remove the given item from the index.
+
+        Args:
+            item (object): The item to remove.
+        """
+        key = id(item)
+        _, _, box = self.entries.pop(key)
+        for cell in self.cells_of(box):
+            items = self.cells[cell]
+            del items[key]
+            if not items:
+                del self.cells[cell]
+
+    def clear(self) -> None:
+        """Remove all items from the index."""
+        self.cells.clear()
+        self.entries.clear()
+        self.extent = None
+
+    def box_of(self, item: object) -> tuple:
+        """Get the bounding box that the given item is kept with.
+
+        Args:
+            item (object): An item of the index.
+
+        Returns:
+            tuple: The bounding box of the item.
+        """
+        return self.entries[id(item)][2]
+
+    def query(self, box: tuple) -> list:
+        """Find all items whose bounding boxes overlap the given box. Only the cells of the box
+        within the cells that were ever used are searched, so a huge box costs no more than the
+        index itself.
+
+        Args:
+            box (tuple): The box to search in.
+
+        Returns:
+            list: The found items in the order they were inserted.
+        """
+        if self.extent is None:
+            return []
+        left, top, right, bottom = box
+        checked = set()
+        found = []
+        for cell in self.cells_of(box, self.extent):
+            for key in self.cells.get(cell, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                order, item, item_box = self.entries[key]
+                if (
+                    item_box[0] <= right
+                    and left <= item_box[2]
+                    and item_box[1] <= bottom
+                    and top <= item_box[3]
+                ):
+                    found.append((order, item))
+        found.sort(key=lambda entry: entry[0])
+        return [item for _, item in found]
+
+    def ring_of(self, column: int, row: int, ring: int) -> list:
+        """Find the keys of the cells on the border of the square of cells around the given
+        cell, leaving out the cells outside the cells that were ever used.
+
+        Args:
+            column (int): The column of the center cell.
+            row (int): The row of the center cell.
+            ring (int): The distance of the border from the center cell, counted in cells.
+
+        Returns:
+            list: A list of (column, row) keys of the cells.
+        """
+        first_column, first_row, last_column, last_row = self.extent
+        cells = []
+        for current in range(
+            max(column - ring, first_column), min(column + ring, last_column) + 1
+        ):
+            if abs(current - column) == ring:
+                rows = range(max(row - ring, first_row), min(row + ring, last_row) + 1)
+            else:
+                rows = [
+                    other
+                    for other in (row - ring, row + ring)
+                    if first_row <= other <= last_row
+                ]
+            cells.extend((current, other) for other in rows)
+        return cells
+
+    def nearest(
+        self, point: Point, distance_of: Callable, threshold: float = inf
+    ) -> object | None:
+        """Find the item nearest to the given point. The cells are searched in growing squares
+        around the point until no unchecked item can be nearer than the best one found.
+
+        Args:
+            point (Point): The point to search around.
+            distance_of (Callable): A function that gives the distance from the point to an item.
+            threshold (float, optional): Only items nearer than this are found. Defaults to inf.
+
+        Returns:
+            object | None: The nearest item, the first inserted one if some are equally near, or
+                None if no item is nearer than the threshold.
+        """
+        if not self.entries:
+            return None
+        column = floor(point.x / self.cell_size)
+        row = floor(point.y / self.cell_size)
+        best_distance = inf
+        best_order = inf
+        best_item = None
+        checked = set()
+        for ring in range(self.rings_around(column, row) + 1):
+            for order, item in self.unchecked_items(
+                self.ring_of(column, row, ring), checked
+            ):
+                distance = distance_of(item)
+                if distance < threshold and (distance, order) < (
+                    best_distance,
+                    best_order,
+                ):
+                    best_distance, best_order, best_item = distance, order, item
+            reach = ring * self.cell_size
+            if reach >= threshold or best_distance < reach:
+                break
+        return best_item
+
+    def rings_around(self, column: int, row: int) -> int:
+        """Find how many rings of cells around the given cell reach all cells that were ever
+        used.
+
+        Args:
+            column (int): The column of the center cell.
+            row (int): The row of the center cell.
+
+        Returns:
+            int: The distance of the farthest used cell from the center cell, counted in cells.
+        """
+        first_column, first_row, last_column, last_row = self.extent
+        return max(
+            column - first_column, last_column - column, row - first_row, last_row - row
+        )
+
+    def unchecked_items(self, cells: list, checked: set) -> list:
+        """Find the items in the given cells that are not checked yet and mark them checked.
+
+        Args:
+            cells (list): The (column, row) keys of the cells.
+            checked (set): The keys of the checked items. The found items are added to it.
+
+        Returns:
+            list: The order and the item of every found item.
+        """
+        found = []
+        for cell in cells:
+            for key in self.cells.get(cell, ()):
+                if key not in checked:
+                    checked.add(key)
+                    found.append(self.entries[key][:2])
+        return found
+
+    def within(self, point: Point, radius: float, distance_of: Callable) -> list:
+        """Find all items whose distance from the given point is at most the given radius.
+
+        Args:
+            point (Point): The point to search around.
+            radius (float): The largest distance of the found items.
+            distance_of (Callable): A function that gives the distance from the point to an item.
+
+        Returns:
+            list: The found items in the order they were inserted.
+        """
+        box = (point.x - radius, point.y - radius, point.x + radius, point.y + radius)
+        return [item for item in self.query(box) if distance_of(item) <= radius]
@@ -1,11 +1,22 @@
 """This module contains some utility functions."""
 
 from math import inf
-from random import random
-from PyQt6.QtGui import QColor
+from itertools import count
 from src.primitives.point import Point
 from src.primitives.segment import Segment
 
+VERSIONS = count(1)
+
+
+def next_version() -> int:
+    """Take a new version number. Version numbers are shared by all versioned objects, so two
+    different states never get the same number.
+
+    Returns:
+        int: A version number that is greater than all the version numbers taken before.
+    """
+    return next(VERSIONS)
+
 
 def nearest_point(
     reference_point: Point, points: list, threshold: float = inf
@@ -118,20 +129,6 @@ def find_intersect(a1: Point, a2: Point, b1: Point, b2: Point) -> dict | None:
     return None
 
 
-def get_random_color(start_hue: float, end_hue: float) -> QColor:
-    """Find a random color in the given range of hues.
-
-    Args:
-        start_hue (float): Start of the hue range.
-        end_hue (float): End of the hue range.
-
-    Returns:
-        QColor: The random color
-    """
-    hue = start_hue + random() * (end_hue - start_hue)
-    return QColor.fromHsv(hue, 1, 1, 1)
-
-
 def change_range(
     value: float,
     input_minimum: float,
@@ -156,54 +153,6 @@ def change_range(
     ) + output_minimum
 
 
-def red_green_color(value: float) -> QColor:
-    """Calculate an RGBA color based on a value. black if the value is 0, red if the value is -1,
-    and green if the value is 1 otherwise in between.
-
-    Args:
-        value (float): The value to calculate the RGBA color.
-
-    Returns:
-        QColor: The calculated color
-    """
-    a = abs(value)
-    b = 0
-    if value == 0:
-        r = 0
-        g = 0
-    elif value > 0:
-        r = 0
-        g = 255
-    else:
-        r = 255
-        g = 0
-    return QColor(r, g, b, a)
-
-
-def green_red_color(value: float) -> QColor:
-    """Calculate an RGBA color based on a value. black if the value is 0, green if the value is -1,
-    and red if the value is 1 otherwise in between.
-
-    Args:
-        value (float): The value to calculate the RGBA color.
-
-    Returns:
-        QColor: The calculated color
-    """
-    a = abs(value)
-    b = 0
-    if value == 0:
-        r = 0
-        g = 0
-    elif value > 0:
-        r = 255
-        g = 0
-    else:
-        r = 0
-        g = 255
-    return QColor(r, g, b, a)
-
-
 def sign(x: float) -> int:
     """Find the sign of a value. 1 if the value is greater than 0 and positive,
     -1 if the value is less than 0 and negative, and 0 if the value is 0.
@@ -219,3 +168,21 @@ def sign(x: float) -> int:
     if x < 0:
         return -1
     return 0
+
+
+def to_data(obj: object) -> dict:
+    """Convert an object to a dictionary of its public attributes to be saved as JSON.
+
+    Args:
+        obj (object): The object to convert.
+
+    Returns:
+        dict: The public attributes of the object.
+    """
+    if hasattr(obj, "__dict__"):
+        return {
+            name: value
+            for name, value in vars(obj).items()
+            if not name.startswith("_")
+        }
+    return {name: getattr(obj, name) for name in obj.__slots__}
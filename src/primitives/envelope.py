@@ -1,13 +1,53 @@
 """This module contains the Envelope class."""
 
 from typing import Self
-from math import pi
-from PyQt6.QtGui import QPainter
+from math import pi, atan2
+from functools import lru_cache
+import numpy as np
 from src.primitives.point import Point
 from src.primitives.segment import Segment
 from src.primitives.polygon import Polygon
 
 
+ENVELOPE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ENVELOPE_CACHE_SIZE)
+def envelope_coordinates(
+    start: tuple, end: tuple, width: float, roundness: int, offset: tuple
+) -> tuple:
+    """Calculate the corners of an envelope. Results are kept in a bounded LRU cache, so
+    rebuilding envelopes around unchanged segments skips the trigonometry.
+
+    Args:
+        start (tuple): The x and y of the start of the segment.
+        end (tuple): The x and y of the end of the segment.
+        width (float): The width of the envelope.
+        roundness (int): The number of steps of the rounded ends.
+        offset (tuple): The x and y to move the segment by.
+
+    Returns:
+        tuple: The x and y of the corners of the envelope.
+    """
+    point_1 = Point(*start) + Point(*offset)
+    point_2 = Point(*end) + Point(*offset)
+    radius = width / 2
+    alpha = (point_1 - point_2).angle()
+    alpha_cw = alpha + pi / 2
+    alpha_ccw = alpha - pi / 2
+    points = []
+    step = pi / max(1, roundness)
+    i = alpha_ccw
+    while i <= alpha_cw:
+        points.append(point_1.translate(i, radius))
+        i += step
+    i = alpha_ccw
+    while i <= alpha_cw:
+        points.append(point_2.translate(pi + i, radius))
+        i += step
+    return tuple((point.x, point.y) for point in points)
+
+
 class Envelope:
     """Envelope class represents an envelope."""
 
@@ -18,23 +58,108 @@ class Envelope:
         roundness: int = 1,
         offset: Point = Point(),
     ) -> None:
-        point_1 = segment.start + offset
-        point_2 = segment.end + offset
-        radius = width / 2
-        alpha = (point_1 - point_2).angle()
+        coordinates = envelope_coordinates(
+            (segment.start.x, segment.start.y),
+            (segment.end.x, segment.end.y),
+            width,
+            roundness,
+            (offset.x, offset.y),
+        )
+        self.polygon = Polygon([Point(x, y) for x, y in coordinates])
+
+    @staticmethod
+    def batch(
+        segments: np.ndarray,
+        widths: np.ndarray | float,
+        roundness: int = 1,
+        offset: Point = Point(),
+    ) -> tuple:
+        """Calculate the corners of many envelopes at once. The corners are the same as the
+        ones of envelopes that are built one by one: the arc angles are accumulated step by
+        step just like the loop of envelope_coordinates does, and the direction of every
+        segment comes from math.atan2, because numpy may round it differently.
+
+        Args:
+            segments (np.ndarray): An N×4 array of start x, start y, end x and end y.
+            widths (np.ndarray | float): The width of every envelope, or one width for all.
+            roundness (int, optional): The number of steps of the rounded ends. Defaults to 1.
+            offset (Point, optional): The offset to move all segments by. Defaults to Point().
+
+        Returns:
+            tuple: The V×2 array of the corners of all envelopes one after another, and the
+                N+1 indices where the corners of each envelope start and the last one ends.
+        """
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        x1 = segments[:, 0:1] + offset.x
+        y1 = segments[:, 1:2] + offset.y
+        x2 = segments[:, 2:3] + offset.x
+        y2 = segments[:, 3:4] + offset.y
+        radius = np.broadcast_to(np.asarray(widths, dtype=np.float64), (len(segments),))
+        radius = radius.reshape(-1, 1) / 2
+        alpha = np.array(
+            [atan2(y, x) for x, y in zip((x1 - x2).ravel(), (y1 - y2).ravel())]
+        ).reshape(-1, 1)
         alpha_cw = alpha + pi / 2
         alpha_ccw = alpha - pi / 2
-        points = []
         step = pi / max(1, roundness)
-        i = alpha_ccw
-        while i <= alpha_cw:
-            points.append(point_1.translate(i, radius))
-            i += step
-        i = alpha_ccw
-        while i <= alpha_cw:
-            points.append(point_2.translate(pi + i, radius))
-            i += step
-        self.polygon = Polygon(points)
+        increments = np.full((len(segments), max(1, roundness) + 2), step)
+        increments[:, 0:1] = alpha_ccw
+        angles = np.cumsum(increments, axis=1)
+        valid = angles <= alpha_cw
+        opposite_angles = pi + angles
+        xs = np.concatenate(
+            (x1 + np.cos(angles) * radius, x2 + np.cos(opposite_angles) * radius), axis=1
+        )
+        ys = np.concatenate(
+            (y1 + np.sin(angles) * radius, y2 + np.sin(opposite_angles) * radius), axis=1
+        )
+        valid = np.concatenate((valid, valid), axis=1)
+        corners = np.stack((xs[valid], ys[valid]), axis=1)
+        starts = np.concatenate(([0], np.cumsum(valid.sum(axis=1))))
+        return corners, starts
+
+    @staticmethod
+    def batch_polygons(
+        segments: list,
+        width: float,
+        roundness: int = 1,
+        offset: Point = Point(),
+    ) -> list:
+        """Build the envelope polygons of many segments at once with batch.
+
+        Args:
+            segments (list): The segments to build envelopes around.
+            width (float): The width of the envelopes.
+            roundness (int, optional): The number of steps of the rounded ends. Defaults to 1.
+            offset (Point, optional): The offset to move all segments by. Defaults to Point().
+
+        Returns:
+            list: A list of polygons, one for each segment.
+        """
+        corners, starts = Envelope.batch(
+            [
+                (segment.start.x, segment.start.y, segment.end.x, segment.end.y)
+                for segment in segments
+            ],
+            width,
+            roundness,
+            offset,
+        )
+        corners = corners.tolist()
+        return [
+            Polygon([Point(x, y) for x, y in corners[starts[i] : starts[i + 1]]])
+            for i in range(len(segments))
+        ]
+
+    @staticmethod
+    def cache_info() -> tuple:
+        """Get the hits, misses, maximum size and current size of the envelope cache.
+
+        Returns:
+            tuple: The statistics of the cache.
+        """
+        # pylint cannot see through lru_cache and takes this for a call of the wrapped function.
+        return envelope_coordinates.cache_info()  # pylint: disable=no-value-for-parameter
 
     def __str__(self) -> str:
         return f"An Envelope with {self.polygon.__str__()}"
@@ -48,11 +173,3 @@ class Envelope:
         envelope = Envelope(Segment(Point(), Point()))
         envelope.polygon = Polygon([]).load(data.polygon)
         return envelope
-
-    def draw(self, painter: QPainter, *args, **kwargs):
-        """Draw the envelope using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-        """
-        self.polygon.draw(painter, *args, **kwargs)
@@ -2,13 +2,13 @@
 
 from math import sqrt, sin, cos, atan, atan2, pi
 from typing import Self
-from PyQt6.QtCore import QPointF
-from PyQt6.QtGui import QPainter, QPen, QColor
 
 
 class Point:
     """Point class represents a point."""
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float = 0, y: float = 0) -> None:
         self.x = x
         self.y = y
@@ -144,22 +144,3 @@ class Point:
         distance = self.distance_to_point(view_point)
         scaler = atan(distance / 300) / (pi / 2)
         return self + direction.scale(height * scaler)
-
-    def draw(
-        self,
-        painter: QPainter,
-        thickness: int = 1,
-        color: QColor = QColor(0, 0, 0),
-    ) -> None:
-        """Draw the point using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-            thickness (int, optional): the size of the point. Defaults to 1.
-            color (QColor, optional): the color to paint the point. Defaults to QColor(0, 0, 0).
-        """
-        point = QPointF(self.x, self.y)
-        pen = QPen(color)
-        pen.setWidth(thickness)
-        painter.setPen(pen)
-        painter.drawPoint(point)
@@ -0,0 +1,116 @@
+"""This module contains the PointArray class."""
+
+from typing import Self, Iterator
+import numpy as np
+from src.primitives.point import Point
+
+
+class PointArray:
+    """PointArray class represents a list of points that are stored in one contiguous N×2 array
+    of floats, so that transforms on all the points run at once.
+
+    It is a packed copy of a list of points, not the storage of polygons or graphs, which keep
+    their points as Point objects.
+    """
+
+    def __init__(self, coordinates=None) -> None:
+        if coordinates is None:
+            coordinates = np.empty((0, 2))
+        self.coordinates = np.ascontiguousarray(coordinates, dtype=np.float64).reshape(
+            -1, 2
+        )
+
+    def __len__(self) -> int:
+        return len(self.coordinates)
+
+    def __getitem__(self, index: int) -> Point:
+        x, y = self.coordinates[index]
+        return Point(float(x), float(y))
+
+    def __iter__(self) -> Iterator[Point]:
+        for x, y in self.coordinates.tolist():
+            yield Point(x, y)
+
+    def __add__(self, other: Point) -> Self:
+        return PointArray(self.coordinates + (other.x, other.y))
+
+    def __sub__(self, other: Point) -> Self:
+        return PointArray(self.coordinates - (other.x, other.y))
+
+    @staticmethod
+    def from_points(points: list) -> "PointArray":
+        """Create a point array from a list of points.
+
+        Args:
+            points (list): The points to store.
+
+        Returns:
+            PointArray: The point array that holds the coordinates of the given points.
+        """
+        return PointArray([(point.x, point.y) for point in points])
+
+    def to_points(self) -> list:
+        """Create a list of points from the point array.
+
+        Returns:
+            list: A list of new points with the coordinates of the point array.
+        """
+        return list(self)
+
+    @property
+    def xs(self) -> np.ndarray:
+        """The x coordinates of the points."""
+        return self.coordinates[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """The y coordinates of the points."""
+        return self.coordinates[:, 1]
+
+    def scale(self, scaler: float) -> Self:
+        """Scale all points with the amount of the given scaler.
+
+        Args:
+            scaler (float): The amount of scaler to scale the points.
+
+        Returns:
+            Self: A point array that scaled from this point array with the given scaler.
+        """
+        return PointArray(self.coordinates * scaler)
+
+    def translate(self, angle: float, offset: float) -> Self:
+        """Move all points with the given angle and offset.
+
+        Args:
+            angle (float): The angle from the x-axis (measured in radians) to translate.
+            offset (float): The offset to translate.
+
+        Returns:
+            Self: A point array that translated from this point array.
+        """
+        return PointArray(
+            self.coordinates + (np.cos(angle) * offset, np.sin(angle) * offset)
+        )
+
+    def distances_to_point(self, point: Point) -> np.ndarray:
+        """Calculate the distances from all points to the given point.
+
+        Args:
+            point (Point): The point to calculate the distances to.
+
+        Returns:
+            np.ndarray: The distance of every point to the given point.
+        """
+        return np.hypot(self.xs - point.x, self.ys - point.y)
+
+    def bounding_box(self) -> tuple:
+        """Find the smallest axis-aligned box that contains all points.
+
+        Returns:
+            tuple: The left, top, right and bottom of the box.
+        """
+        if len(self.coordinates) == 0:
+            return (0.0, 0.0, 0.0, 0.0)
+        left, top = self.coordinates.min(axis=0)
+        right, bottom = self.coordinates.max(axis=0)
+        return (float(left), float(top), float(right), float(bottom))
@@ -1,10 +1,13 @@
 """This module contains the Polygon class."""
 
 from typing import Self
-from PyQt6.QtCore import Qt, QPointF
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF
+from math import hypot, inf, atan2, pi
+import numpy as np
 from src.primitives.segment import Segment
 from src.primitives.point import Point
+from src.primitives.point_array import PointArray
+from src.maths.spatial_index import SpatialIndex
+from src.maths import kernel
 from src.maths.utils import find_intersect
 
 
@@ -13,6 +16,10 @@ class Polygon:
 
     def __init__(self, points: list) -> None:
         self.points = points
+        self._bounding_box = None
+        self._segment_array = None
+        self._corners = None
+        self._is_convex = None
         self.segments = []
         for i, _ in enumerate(self.points):
             self.segments.append(
@@ -29,6 +36,178 @@ class Polygon:
         string += "}"
         return string
 
+    def vertices(self) -> PointArray:
+        """Pack the points of the polygon in a point array. The array is a copy for transforming
+        all points at once and is not kept by the polygon.
+
+        Returns:
+            PointArray: The point array of the points of the polygon.
+        """
+        return PointArray.from_points(self.points)
+
+    @property
+    def bounding_box(self) -> tuple:
+        """The left, top, right and bottom of the smallest axis-aligned box that contains the
+        segments of the polygon. The box is calculated on first use and kept until the polygon
+        changes."""
+        if self._bounding_box is None:
+            xs = []
+            ys = []
+            for segment in self.segments:
+                xs.append(segment.start.x)
+                xs.append(segment.end.x)
+                ys.append(segment.start.y)
+                ys.append(segment.end.y)
+            if xs:
+                self._bounding_box = (min(xs), min(ys), max(xs), max(ys))
+            else:
+                self._bounding_box = (inf, inf, -inf, -inf)
+        return self._bounding_box
+
+    def invalidate(self) -> None:
+        """Drop everything that is cached from the points and segments of the polygon. Call it
+        after changing the points or segments of the polygon."""
+        self._bounding_box = None
+        self._segment_array = None
+        self._corners = None
+        self._is_convex = None
+
+    @property
+    def corners(self) -> list:
+        """The start points of the segments of the polygon as (x, y) tuples. They are
+        calculated on first use and kept until the polygon changes."""
+        if self._corners is None:
+            self._corners = [
+                (segment.start.x, segment.start.y) for segment in self.segments
+            ]
+        return self._corners
+
+    @property
+    def is_convex(self) -> bool:
+        """Whether the polygon is convex. A polygon with two points, which is a segment, is
+        convex too. The flag is calculated on first use and kept until the polygon changes."""
+        if self._is_convex is None:
+            self._is_convex = self.check_convexity()
+        return self._is_convex
+
+    def check_convexity(self, tolerance: float = 1e-9) -> bool:
+        """Check if the segments of the polygon turn in one direction and go around exactly
+        once.
+
+        Args:
+            tolerance (float, optional): The relative amount of turning that is counted as
+                going straight. Defaults to 1e-9.
+
+        Returns:
+            bool: True if the polygon is convex otherwise False.
+        """
+        corners = self.corners
+        count = len(corners)
+        if count < 2:
+            return False
+        if count == 2:
+            return True
+        direction = 0
+        turning = 0
+        for i in range(count):
+            x1, y1 = corners[i]
+            x2, y2 = corners[(i + 1) % count]
+            x3, y3 = corners[(i + 2) % count]
+            cross = (x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)
+            dot = (x2 - x1) * (x3 - x2) + (y2 - y1) * (y3 - y2)
+            if abs(cross) > tolerance * (hypot(x2 - x1, y2 - y1) * hypot(x3 - x2, y3 - y2)):
+                if not direction:
+                    direction = 1 if cross > 0 else -1
+                elif (cross > 0) != (direction > 0):
+                    return False
+                turning += atan2(cross, dot)
+        return abs(abs(turning) - 2 * pi) < 1e-6
+
+    def separating_axes(self) -> list:
+        """Find the axes to project on for the separating axis test, which are the normals of
+        the segments. A polygon with two points also needs the direction of its segment.
+
+        Returns:
+            list: A list of (x, y) axes.
+        """
+        corners = self.corners
+        count = len(corners)
+        axes = []
+        for i in range(1 if count == 2 else count):
+            x1, y1 = corners[i]
+            x2, y2 = corners[(i + 1) % count]
+            axes.append((y1 - y2, x2 - x1))
+            if count == 2:
+                axes.append((x2 - x1, y2 - y1))
+        return axes
+
+    def separated_from(self, other: Self) -> bool:
+        """Check if a line separates this convex polygon from the given convex polygon. Unlike
+        the crossing test of intersect_with_polygon, a polygon that lies completely inside the
+        other one is not separated.
+
+        Args:
+            other (Self): The convex polygon to check.
+
+        Returns:
+            bool: True if the polygons are apart otherwise False.
+        """
+        for axis_x, axis_y in self.separating_axes() + other.separating_axes():
+            projections_1 = [x * axis_x + y * axis_y for x, y in self.corners]
+            projections_2 = [x * axis_x + y * axis_y for x, y in other.corners]
+            if max(projections_1) < min(projections_2) or max(projections_2) < min(
+                projections_1
+            ):
+                return True
+        return False
+
+    @property
+    def segment_array(self) -> np.ndarray:
+        """The segments of the polygon packed in an S×4 array of start x, start y, end x and
+        end y. The array is built on first use and kept until the polygon changes."""
+        if self._segment_array is None:
+            self._segment_array = np.array(
+                [
+                    (segment.start.x, segment.start.y, segment.end.x, segment.end.y)
+                    for segment in self.segments
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 4)
+        return self._segment_array
+
+    def box_distance_to_point(self, point: Point) -> float:
+        """Calculate the distance from the bounding box of this polygon to the given point. It is
+        never more than the distance from the polygon to the point.
+
+        Args:
+            point (Point): The point to calculate the distance.
+
+        Returns:
+            float: The distance from the given point to the bounding box, zero if it is inside.
+        """
+        left, top, right, bottom = self.bounding_box
+        return hypot(
+            max(left - point.x, 0, point.x - right),
+            max(top - point.y, 0, point.y - bottom),
+        )
+
+    def box_distance_to_polygon(self, other: Self) -> float:
+        """Calculate the distance between the bounding boxes of this polygon and the given
+        polygon. It is never more than the distance between the polygons.
+
+        Args:
+            other (Self): The polygon to calculate the distance.
+
+        Returns:
+            float: The distance between the bounding boxes, zero if they overlap.
+        """
+        left_1, top_1, right_1, bottom_1 = self.bounding_box
+        left_2, top_2, right_2, bottom_2 = other.bounding_box
+        return hypot(
+            max(left_1 - right_2, 0, left_2 - right_1),
+            max(top_1 - bottom_2, 0, top_2 - bottom_1),
+        )
+
     def load(self, data: dict) -> Self:
         """A method that extracts information from data.
 
@@ -45,57 +224,127 @@ class Polygon:
         """Find all segments in a list of polygons. If a segment appears in two or more
         polygons, only one of them is kept.
 
+        Segments are broken at their crossings first, then the pieces that fall inside another
+        polygon are dropped. The given polygons are not changed.
+
         Args:
             polygons (list): The list of polygons to search for unique segments
 
         Returns:
             list: A list of all unique segments
         """
-        for i in range(len(polygons) - 1):
-            for j in range(i, len(polygons)):
-                polygons[i].break_segments(polygons[j])
+        return [
+            segment for pieces in Polygon.union_pieces(polygons) for segment in pieces
+        ]
+
+    @staticmethod
+    def union_pieces(polygons: list) -> list:
+        """Find the pieces of the outline of the union of the given polygons, grouped by the
+        polygon they come from.
+
+        The pieces of a polygon only depend on the polygons whose bounding boxes come within 1
+        of its own, so the union of a polygon and those neighbors gives the same pieces for it
+        as the union of all the polygons.
+
+        Args:
+            polygons (list): The polygons to find the union of.
+
+        Returns:
+            list: A list of lists of segments, one for each polygon.
+        """
+        broken_segments = Polygon.break_segments(polygons)
+        index = SpatialIndex.of_boxes(
+            polygons, [polygon.bounding_box for polygon in polygons]
+        )
         kept_segments = []
-        for i, polygon_i in enumerate(polygons):
-            for segment in polygon_i.segments:
+        for polygon, segments in zip(polygons, broken_segments):
+            pieces = []
+            for segment in segments:
+                midpoint = segment.midpoint()
                 keep = True
-                for j, polygon_j in enumerate(polygons):
-                    if i != j:
-                        if polygon_j.contains_segment(segment):
-                            keep = False
-                            break
+                for other in index.query(
+                    (midpoint.x - 1, midpoint.y - 1, midpoint.x + 1, midpoint.y + 1)
+                ):
+                    if other is not polygon and other.contains_point(midpoint):
+                        keep = False
+                        break
                 if keep:
-                    kept_segments.append(segment)
+                    pieces.append(segment)
+            kept_segments.append(pieces)
         return kept_segments
 
-    def break_segments(self, other: Self) -> None:
-        """this method breaks down segments of this polygon and the other given polygon
-        from intersection points.
-
-        Args:
-            other (Self): The other polygon to break down segments.
-        """
-        segments_1 = self.segments
-        segments_2 = other.segments
-        for i, _ in enumerate(segments_1):
-            for j, _ in enumerate(segments_2):
-                intersection = find_intersect(
-                    segments_1[i].start,
-                    segments_1[i].end,
-                    segments_2[j].start,
-                    segments_2[j].end,
-                )
-                if (
-                    intersection
-                    and intersection["offset"] != 0
-                    and intersection["offset"] != 1
-                ):
-                    point = Point(intersection["x"], intersection["y"])
-                    temporary = segments_1[i].end
-                    segments_1[i].end = point
-                    segments_1.insert(i + 1, Segment(point, temporary))
-                    temporary = segments_2[j].end
-                    segments_2[j].end = point
-                    segments_2.insert(j + 1, Segment(point, temporary))
+    @staticmethod
+    def break_segments(polygons: list) -> list:
+        """Break down the segments of the given polygons at the points where they cross the
+        segments of the other polygons.
+
+        Crossing candidates are the pairs of segments of different polygons whose bounding
+        boxes overlap, found with a spatial index, and each candidate is then checked with
+        find_intersect. A segment that is not crossed is returned as it is, and a crossed
+        segment is replaced by new pieces in order from its start to its end.
+
+        Args:
+            polygons (list): The polygons to break down the segments of.
+
+        Returns:
+            list: A list of lists of segments, one for each polygon, in the order of the
+                segments of the polygon.
+        """
+        entries = []
+        for i, polygon in enumerate(polygons):
+            for j, segment in enumerate(polygon.segments):
+                entries.append((segment.bounding_box(), i, j))
+        sizes = [
+            max(right - left, bottom - top) for (left, top, right, bottom), _, _ in entries
+        ]
+        index = SpatialIndex(max(sum(sizes) / max(len(sizes), 1), 1))
+        for entry in entries:
+            index.insert(entry, entry[0])
+        breaks = {}
+        for box, i, j in entries:
+            for _, other_i, other_j in index.query(box):
+                if other_i > i:
+                    Polygon.break_pair(polygons, (i, j), (other_i, other_j), breaks)
+        broken_segments = []
+        for i, polygon in enumerate(polygons):
+            segments = []
+            for j, segment in enumerate(polygon.segments):
+                if (i, j) not in breaks:
+                    segments.append(segment)
+                    continue
+                start = segment.start
+                for _, point in sorted(breaks[(i, j)], key=lambda item: item[0]):
+                    if point not in (start, segment.end):
+                        segments.append(Segment(start, point))
+                        start = point
+                segments.append(Segment(start, segment.end))
+            broken_segments.append(segments)
+        return broken_segments
+
+    @staticmethod
+    def break_pair(polygons: list, first: tuple, second: tuple, breaks: dict) -> None:
+        """Record where the given two segments cross each other.
+
+        Args:
+            polygons (list): The polygons that the segments belong to.
+            first (tuple): The index of the polygon and of the segment of the first segment.
+            second (tuple): The index of the polygon and of the segment of the second segment.
+            breaks (dict): The offsets and points where segments are crossed, keyed by the
+                indices of the segments. The crossings are added to it.
+        """
+        segment_1 = polygons[first[0]].segments[first[1]]
+        segment_2 = polygons[second[0]].segments[second[1]]
+        intersection = find_intersect(
+            segment_1.start, segment_1.end, segment_2.start, segment_2.end
+        )
+        if intersection and intersection["offset"] != 0 and intersection["offset"] != 1:
+            point = Point(intersection["x"], intersection["y"])
+            breaks.setdefault(first, []).append((intersection["offset"], point))
+            offset = find_intersect(
+                segment_2.start, segment_2.end, segment_1.start, segment_1.end
+            )
+            if offset and 0 < offset["offset"] < 1:
+                breaks.setdefault(second, []).append((offset["offset"], point))
 
     def contains_segment(self, segment: Segment) -> bool:
         """Check if the given segment is inside the polygon.
@@ -119,6 +368,9 @@ class Polygon:
         """
         px = point.x
         py = point.y
+        left, top, right, bottom = self.bounding_box
+        if py < top or py > bottom or px < left or px - threshold > right:
+            return False
         intersections = 0
         for segment in self.segments:
             x1 = segment.start.x
@@ -146,6 +398,99 @@ class Polygon:
             distances.append(segment.distance_to_point(point))
         return min(distances)
 
+    def contains_points(
+        self, points: PointArray | list, threshold: float = 0.01
+    ) -> np.ndarray:
+        """Check for each of the given points if it is inside the polygon. The result is the
+        same as calling contains_point for every point.
+
+        Args:
+            points (PointArray | list): The points to check.
+            threshold (float, optional): The same threshold as contains_point. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: A boolean array with one value for each point.
+        """
+        return Polygon.polygons_contain_points([self], points, threshold)[0]
+
+    def distances_to_points(self, points: PointArray | list) -> np.ndarray:
+        """Calculate the minimum distance from this polygon to each of the given points. The
+        result matches calling distance_to_point for every point up to rounding in the last
+        digit.
+
+        Args:
+            points (PointArray | list): The points to calculate the distances.
+
+        Returns:
+            np.ndarray: An array with one distance for each point.
+        """
+        return Polygon.distances_from_polygons([self], points)[0]
+
+    @staticmethod
+    def pack_segments(polygons: list) -> tuple:
+        """Pack the segments of the given polygons in one array. Polygons without segments are
+        left out.
+
+        Args:
+            polygons (list): The polygons to pack.
+
+        Returns:
+            tuple: The S×4 array of all segments, the index of the first segment of each packed
+                polygon in it, and the indices of the packed polygons in the given list.
+        """
+        packed = [i for i, polygon in enumerate(polygons) if polygon.segments]
+        arrays = [polygons[i].segment_array for i in packed]
+        starts = np.cumsum([0] + [len(array) for array in arrays[:-1]])
+        return np.concatenate(arrays or [np.empty((0, 4))]), starts, packed
+
+    @staticmethod
+    def polygons_contain_points(
+        polygons: list, points: PointArray | list, threshold: float = 0.01
+    ) -> np.ndarray:
+        """Check for each of the given polygons and each of the given points if the point is
+        inside the polygon.
+
+        Args:
+            polygons (list): The polygons to check.
+            points (PointArray | list): The points to check.
+            threshold (float, optional): The same threshold as contains_point. Defaults to 0.01.
+
+        Returns:
+            np.ndarray: A P×M boolean array for P polygons and M points.
+        """
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+        result = np.zeros((len(polygons), len(points)), dtype=bool)
+        segments, starts, packed = Polygon.pack_segments(polygons)
+        if len(segments) == 0 or len(points) == 0:
+            return result
+        result[packed] = kernel.contains_points(
+            segments, starts, points.coordinates, threshold
+        )
+        return result
+
+    @staticmethod
+    def distances_from_polygons(polygons: list, points: PointArray | list) -> np.ndarray:
+        """Calculate the minimum distance from each of the given polygons to each of the given
+        points.
+
+        Args:
+            polygons (list): The polygons to calculate the distances from.
+            points (PointArray | list): The points to calculate the distances to.
+
+        Returns:
+            np.ndarray: A P×M array for P polygons and M points. Polygons without segments
+                have infinite distances.
+        """
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+        result = np.full((len(polygons), len(points)), inf)
+        segments, starts, packed = Polygon.pack_segments(polygons)
+        if len(segments) == 0 or len(points) == 0:
+            return result
+        result[packed] = kernel.distances_to_points(segments, starts, points.coordinates)
+        return result
+
     def distance_to_polygon(self, other: Self) -> float:
         """Calculate the minimum distance from this polygon to the given polygon.
 
@@ -160,15 +505,56 @@ class Polygon:
             distances.append(other.distance_to_point(point))
         return min(distances)
 
+    def near_point(self, point: Point, distance: float) -> bool:
+        """Check if the given point is closer than the given distance to this polygon. Points
+        that are far from the bounding box are rejected without measuring the segments.
+
+        Args:
+            point (Point): The point to check.
+            distance (float): The distance to compare with.
+
+        Returns:
+            bool: True if the distance from the polygon to the point is less than the given
+                distance otherwise False.
+        """
+        if self.box_distance_to_point(point) >= distance:
+            return False
+        return self.distance_to_point(point) < distance
+
+    def near_polygon(self, other: Self, distance: float) -> bool:
+        """Check if the given polygon is closer than the given distance to this polygon, as
+        measured by distance_to_polygon. Polygons with far bounding boxes are rejected without
+        measuring the segments.
+
+        Args:
+            other (Self): The polygon to check.
+            distance (float): The distance to compare with.
+
+        Returns:
+            bool: True if the distance between the polygons is less than the given distance
+                otherwise False.
+        """
+        if self.box_distance_to_polygon(other) >= distance:
+            return False
+        return self.distance_to_polygon(other) < distance
+
     def intersect_with_polygon(self, other: Self) -> bool:
         """Check if the given polygon has an intersection with this polygon.
 
+        Two convex polygons are checked with the separating axis test, which also finds a
+        polygon that lies completely inside the other one. Other polygons are checked for
+        crossing segments.
+
         Args:
             other (Self): The polygon to Check for an intersection.
 
         Returns:
             bool: True if there is at least one intersection between two polygons otherwise False.
         """
+        if self.box_distance_to_polygon(other) > 0:
+            return False
+        if self.is_convex and other.is_convex:
+            return not self.separated_from(other)
         for segment_1 in self.segments:
             for segment_2 in other.segments:
                 if find_intersect(
@@ -176,47 +562,3 @@ class Polygon:
                 ):
                     return True
         return False
-
-    def draw(
-        self,
-        painter: QPainter,
-        color: QColor = QColor(0, 0, 0),
-        style: Qt.BrushStyle = Qt.BrushStyle.SolidPattern,
-        join_style: Qt.PenJoinStyle = Qt.PenJoinStyle.MiterJoin,
-        cap_style: Qt.PenCapStyle = Qt.PenCapStyle.RoundCap,
-        dash_style: list | None = None,
-        outline_width: float = -1,
-        outline_color: QColor = QColor(0, 0, 0),
-        outline_style: Qt.PenStyle = Qt.PenStyle.SolidLine,
-    ) -> None:
-        """Draw the polygon using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-            color (QColor, optional): The color to paint the point. Defaults to QColor(0, 0, 0).
-            style (Qt.BrushStyle, optional): The style of fill inside of the polygon.
-            Defaults to Qt.BrushStyle.SolidPattern.
-            join_style (Qt.PenJoinStyle, optional): The style of joining the segments of the
-            polygon. Defaults to Qt.PenJoinStyle.MiterJoin.
-            cap_style (Qt.PenCapStyle, optional): The style of the cap of each segment of the
-            polygon. Defaults to Qt.PenCapStyle.RoundCap.
-            dash_style (list | None, optional): The style of the dash pattern. Defaults to None.
-            outline_width (float, optional): The width of the outer lines of the polygon to paint.
-            Defaults to -1.
-            outline_color (QColor, optional): The color of the outer lines of the polygon to paint.
-            Defaults to QColor(0, 0, 0).
-            outline_style (Qt.PenStyle, optional): The style of the outer lines of the polygon to
-            paint. Defaults to Qt.PenStyle.SolidLine.
-        """
-        points = []
-        for point in self.points:
-            points.append(QPointF(point.x, point.y))
-        polygon = QPolygonF(points)
-        pen = QPen(outline_color, outline_width, outline_style)
-        pen.setCapStyle(cap_style)
-        pen.setJoinStyle(join_style)
-        if dash_style:
-            pen.setDashPattern(dash_style)
-        painter.setPen(pen)
-        painter.setBrush(QBrush(color, style))
-        painter.drawPolygon(polygon)
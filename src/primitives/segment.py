@@ -2,8 +2,6 @@
 
 from math import atan, inf
 from typing import Self
-from PyQt6.QtCore import QLineF, Qt
-from PyQt6.QtGui import QPainter, QPen, QColor
 from src.primitives.point import Point
 
 
@@ -53,6 +51,19 @@ class Segment:
         """
         return self.start.midpoint(self.end)
 
+    def bounding_box(self) -> tuple:
+        """Find the smallest axis-aligned box that contains the segment.
+
+        Returns:
+            tuple: The left, top, right and bottom of the box.
+        """
+        return (
+            min(self.start.x, self.end.x),
+            min(self.start.y, self.end.y),
+            max(self.start.x, self.end.x),
+            max(self.start.y, self.end.y),
+        )
+
     def distance_to_point(self, point: Point) -> float:
         """Calculate the minimum distance from this segment to the given point.
 
@@ -136,33 +147,3 @@ class Segment:
             return Segment(
                 self.start.midpoint(other.end), self.end.midpoint(other.start)
             )
-
-    def draw(
-        self,
-        painter: QPainter,
-        width: float = 0,
-        cap_style: Qt.PenCapStyle = Qt.PenCapStyle.RoundCap,
-        dash_style: list | None = None,
-        color: QColor = QColor(0, 0, 0),
-        style: Qt.PenStyle = Qt.PenStyle.SolidLine,
-    ) -> None:
-        """Draw the segment using the given painter.
-
-        Args:
-            painter (QPainter): The painter is used for drawing.
-            width (float, optional): The width of the line to paint. Defaults to 0.
-            cap_style (Qt.PenCapStyle, optional): The style of caps of the segment to paint.
-            Defaults to Qt.PenCapStyle.RoundCap.
-            dash_style (list | None, optional): The style of the dash pattern.
-            None or empty list to draw a solid segment. Defaults to None.
-            color (QColor, optional): The color to paint the point. Defaults to QColor(0, 0, 0).
-            style (Qt.PenStyle, optional): The style of the segment itself to paint.
-            Defaults to Qt.PenStyle.SolidLine.
-        """
-        line = QLineF(self.start.x, self.start.y, self.end.x, self.end.y)
-        pen = QPen(color, width, style)
-        pen.setCapStyle(cap_style)
-        if dash_style:
-            pen.setDashPattern(dash_style)
-        painter.setPen(pen)
-        painter.drawLine(line)
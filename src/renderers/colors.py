@@ -0,0 +1,66 @@
+"""This module contains some color utility functions."""
+
+from random import random
+from PyQt6.QtGui import QColor
+
+
+def get_random_color(start_hue: float, end_hue: float) -> QColor:
+    """Find a random color in the given range of hues.
+
+    Args:
+        start_hue (float): Start of the hue range.
+        end_hue (float): End of the hue range.
+
+    Returns:
+        QColor: The random color
+    """
+    hue = start_hue + random() * (end_hue - start_hue)
+    return QColor.fromHsv(hue, 1, 1, 1)
+
+
+def red_green_color(value: float) -> QColor:
+    """Calculate an RGBA color based on a value. black if the value is 0, red if the value is -1,
+    and green if the value is 1 otherwise in between.
+
+    Args:
+        value (float): The value to calculate the RGBA color.
+
+    Returns:
+        QColor: The calculated color
+    """
+    a = abs(value)
+    b = 0
+    if value == 0:
+        r = 0
+        g = 0
+    elif value > 0:
+        r = 0
+        g = 255
+    else:
+        r = 255
+        g = 0
+    return QColor(r, g, b, a)
+
+
+def green_red_color(value: float) -> QColor:
+    """Calculate an RGBA color based on a value. black if the value is 0, green if the value is -1,
+    and red if the value is 1 otherwise in between.
+
+    Args:
+        value (float): The value to calculate the RGBA color.
+
+    Returns:
+        QColor: The calculated color
+    """
+    a = abs(value)
+    b = 0
+    if value == 0:
+        r = 0
+        g = 0
+    elif value > 0:
+        r = 255
+        g = 0
+    else:
+        r = 0
+        g = 255
+    return QColor(r, g, b, a)
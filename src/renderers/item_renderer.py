@@ -0,0 +1,191 @@
+"""This module contains functions that draw items like cars, roads, and buildings using a
+QPainter."""
+
+from pathlib2 import Path
+from PyQt6.QtCore import Qt, QRect, QLineF
+from PyQt6.QtGui import QPainter, QPixmap, QRegion, QBitmap, QPen, QColor
+from src.items.car import Car, CarPose
+from src.items.sensor import Sensor, SensorRay
+from src.items.road import Road
+from src.items.intersection import Intersection
+from src.items.building import Building
+from src.items.tree import Tree
+from src.primitives.point import Point
+from src.primitives.circle import Circle
+from src.maths.utils import lerp, lerp_2d
+from src.renderers.primitive_renderer import draw_segment, draw_polygon, draw_circle
+
+CAR_IMAGES = {}
+
+
+def load_car_image(width: float) -> tuple:
+    """Load the image of cars scaled to the given width. Images are loaded once and shared
+    between all cars.
+
+    Args:
+        width (float): The width of the car.
+
+    Returns:
+        tuple: A tuple includes the image and the alpha mask of it.
+    """
+    if width not in CAR_IMAGES:
+        image = QPixmap(
+            str(Path(Path(__file__).parent.parent.parent, "asset/images/car.png"))
+        ).scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+        CAR_IMAGES[width] = (image, image.toImage().createAlphaMask())
+    return CAR_IMAGES[width]
+
+
+def draw_car(painter: QPainter, car: Car, transparency: float = 1) -> None:
+    """Draw the given car using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        car (Car): The car to draw.
+        transparency (float, optional): The percentage of transparency.
+        0 means invisible and 1 means fully solid. Defaults to 1.
+    """
+    draw_car_pose(painter, car.pose(), transparency)
+
+
+def draw_car_pose(painter: QPainter, pose: CarPose, transparency: float = 1) -> None:
+    """Draw a car in the given pose using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        pose (CarPose): The pose of the car to draw.
+        transparency (float, optional): The percentage of transparency.
+        0 means invisible and 1 means fully solid. Defaults to 1.
+    """
+    image, mask = load_car_image(pose.width)
+    rect = QRect(-pose.width // 2, -pose.height // 2, pose.width, pose.height)
+    painter.save()
+    painter.translate(pose.x, pose.y)
+    painter.rotate(pose.angle)
+    painter.setOpacity(transparency)
+    painter.drawPixmap(rect, image)
+    if not pose.damaged:
+        painter.setOpacity(1)
+        painter.translate(-pose.width / 2, -pose.height / 2)
+        painter.setClipRegion(QRegion(QBitmap.fromImage(mask)))
+        painter.setCompositionMode(painter.CompositionMode.CompositionMode_Multiply)
+        painter.translate(pose.width / 2, pose.height / 2)
+        painter.fillRect(rect, QColor(255, 0, 0))
+    painter.restore()
+
+
+def draw_sensor(painter: QPainter, sensor: Sensor) -> None:
+    """Draw the given sensor using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        sensor (Sensor): The sensor to draw.
+    """
+    draw_sensor_ray(painter, sensor.ray())
+
+
+def draw_sensor_ray(painter: QPainter, ray: SensorRay) -> None:
+    """Draw a sensor ray using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        ray (SensorRay): The ray to draw.
+    """
+    painter.setPen(QPen(QColor(0, 0, 0), 2, Qt.PenStyle.SolidLine))
+    painter.drawLine(QLineF(ray.intersect.x, ray.intersect.y, ray.end.x, ray.end.y))
+    painter.setPen(QPen(QColor(255, 255, 0), 2, Qt.PenStyle.SolidLine))
+    painter.drawLine(QLineF(ray.start.x, ray.start.y, ray.intersect.x, ray.intersect.y))
+
+
+def draw_road(painter: QPainter, road: Road) -> None:
+    """Draw the middle lines of the given road using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        road (Road): The road to draw.
+    """
+    if road.middle_line:
+        draw_segment(painter, road.middle_line, color=QColor(255, 255, 255), width=5)
+    for segment in road.middle_dashed_lines:
+        draw_segment(
+            painter,
+            segment,
+            color=QColor(255, 255, 255),
+            width=5,
+            dash_style=[5, 5],
+        )
+
+
+def draw_intersection(painter: QPainter, intersection: Intersection) -> None:
+    """Draw the given intersection area using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        intersection (Intersection): The intersection to draw.
+    """
+    draw_circle(
+        painter,
+        Circle(intersection.location.x, intersection.location.y, 120),
+        style=Qt.BrushStyle.NoBrush,
+        outline_thickness=5,
+        outline_color=QColor(0, 255, 0),
+    )
+
+
+def draw_building(painter: QPainter, building: Building, view_point: Point) -> None:
+    """Draw the given building using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        building (Building): The building to draw.
+        view_point (Point): The center of the viewport.
+    """
+    sides, ceiling, roofs = building.prepare_to_draw(view_point)
+    draw_polygon(
+        painter,
+        building.base,
+        color=QColor(255, 255, 255),
+        outline_color=QColor(0, 0, 0, 20),
+        outline_width=20,
+    )
+    for side in sides:
+        draw_polygon(
+            painter,
+            side,
+            color=QColor(255, 255, 255),
+            outline_color=QColor(170, 170, 170),
+        )
+    draw_polygon(
+        painter,
+        ceiling,
+        color=QColor(255, 255, 255),
+        outline_color=QColor(255, 255, 255),
+        outline_width=6,
+    )
+    for roof in roofs:
+        draw_polygon(
+            painter,
+            roof,
+            color=QColor(210, 60, 60),
+            outline_color=QColor(190, 50, 50),
+            outline_width=8,
+            join_style=Qt.PenJoinStyle.RoundJoin,
+        )
+
+
+def draw_tree(painter: QPainter, tree: Tree, view_point: Point) -> None:
+    """Draw the given tree using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        tree (Tree): The tree to draw.
+        view_point (Point): The center of the viewport.
+    """
+    top = tree.center.get_3d_point(view_point, tree.height)
+    for level in range(tree.level_count):
+        level_height = level / (tree.level_count - 1)
+        point = lerp_2d(tree.center, top, level_height)
+        color = QColor(30, round(lerp(50, 200, level_height)), 70)
+        size = lerp(tree.size, 40, level_height)
+        level_polygon = tree.generate_level(point, size)
+        draw_polygon(painter, level_polygon, color, outline_color=QColor(0, 0, 0))
@@ -0,0 +1,238 @@
+"""This module contains functions that draw markings using a QPainter."""
+
+from pathlib2 import Path
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPainter, QPixmap, QColor
+from src.markings.marking import Marking
+from src.primitives.segment import Segment
+from src.primitives.circle import Circle
+from src.maths.utils import lerp_2d
+from src.renderers.primitive_renderer import draw_segment, draw_circle
+
+START_MARKING_IMAGES = {}
+
+
+def load_start_marking_image(width: float) -> QPixmap:
+    """Load the image of start markings scaled to the given width. Images are loaded once and
+    shared between all start markings.
+
+    Args:
+        width (float): The width of the start marking.
+
+    Returns:
+        QPixmap: The loaded image.
+    """
+    width = round(width)
+    if width not in START_MARKING_IMAGES:
+        START_MARKING_IMAGES[width] = QPixmap(
+            str(Path(Path(__file__).parent.parent.parent, "asset/images/car.png"))
+        ).scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+    return START_MARKING_IMAGES[width]
+
+
+def draw_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given marking using the given painter based on the type of it.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The marking to draw.
+    """
+    drawers = {
+        "cross": draw_cross_marking,
+        "park": draw_park_marking,
+        "start": draw_start_marking,
+        "stop": draw_stop_marking,
+        "target": draw_target_marking,
+        "traffic_light": draw_traffic_light_marking,
+        "yield": draw_yield_marking,
+    }
+    marking_type = getattr(marking, "type", None)
+    if marking_type in drawers:
+        drawers[marking_type](painter, marking)
+
+
+def _draw_borders(painter: QPainter, marking: Marking) -> None:
+    """Draw the borders of the given marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The marking to draw the borders of.
+    """
+    for border in marking.borders:
+        draw_segment(painter, border, 4, color=QColor(255, 255, 255))
+
+
+def _draw_text(
+    painter: QPainter, marking: Marking, text: str, pixel_size: int, stretch: float
+) -> None:
+    """Draw a text in the direction of the given marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The marking to draw the text on.
+        text (str): The text to draw.
+        pixel_size (int): The size of the font in pixels.
+        stretch (float): The vertical stretch of the text.
+    """
+    painter.save()
+    painter.translate(
+        marking.center_of_segment.x,
+        marking.center_of_segment.y,
+    )
+    painter.rotate(marking.angle())
+    painter.scale(1, stretch)
+    font = painter.font()
+    font.setPixelSize(pixel_size)
+    painter.setFont(font)
+    painter.drawText(
+        -round(marking.width / 2),
+        -round(marking.height / 2),
+        round(marking.width),
+        round(marking.height),
+        Qt.AlignmentFlag.AlignCenter,
+        text,
+    )
+    painter.restore()
+
+
+def draw_cross_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given cross marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The cross marking to draw.
+    """
+    perpendicular = marking.direction_of_segment.mirror_about_y_axis()
+    line = Segment(
+        marking.center_of_segment + perpendicular.scale(marking.width / 2),
+        marking.center_of_segment + perpendicular.scale(-marking.width / 2),
+    )
+    draw_segment(
+        painter,
+        line,
+        marking.height,
+        color=QColor(255, 255, 255),
+        dash_style=[2 / 11, 2 / 11],
+        cap_style=Qt.PenCapStyle.FlatCap,
+    )
+
+
+def draw_park_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given park marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The park marking to draw.
+    """
+    _draw_borders(painter, marking)
+    painter.save()
+    painter.translate(
+        marking.center_of_segment.x,
+        marking.center_of_segment.y,
+    )
+    painter.rotate(marking.angle())
+    font = painter.font()
+    font.setPixelSize(48)
+    painter.setFont(font)
+    painter.drawText(
+        -round(marking.width / 2),
+        -round(marking.width / 2),
+        round(marking.width),
+        round(marking.height),
+        Qt.AlignmentFlag.AlignCenter,
+        "P",
+    )
+    painter.restore()
+
+
+def draw_start_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given start marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The start marking to draw.
+    """
+    rect = QRect(-15, -25, 30, 50)
+    painter.save()
+    painter.translate(marking.center_of_segment.x, marking.center_of_segment.y)
+    painter.rotate(marking.angle())
+    painter.drawPixmap(rect, load_start_marking_image(marking.width))
+    painter.restore()
+
+
+def draw_stop_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given stop marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The stop marking to draw.
+    """
+    _draw_borders(painter, marking)
+    _draw_text(painter, marking, "STOP", 20, 3)
+
+
+def draw_target_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given target marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The target marking to draw.
+    """
+    if len(marking.polygon.segments) == 4:
+        for segment in (marking.polygon.segments[0], marking.polygon.segments[2]):
+            draw_segment(
+                painter,
+                segment,
+                5,
+                color=QColor(255, 0, 0),
+                cap_style=Qt.PenCapStyle.FlatCap,
+            )
+        for segment in (marking.polygon.segments[0], marking.polygon.segments[2]):
+            draw_segment(
+                painter,
+                segment,
+                5,
+                color=QColor(255, 255, 0),
+                dash_style=[1, 1],
+                cap_style=Qt.PenCapStyle.FlatCap,
+            )
+
+
+def draw_traffic_light_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given traffic light marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The traffic light marking to draw.
+    """
+    _draw_borders(painter, marking)
+    perpendicular = marking.direction_of_segment.mirror_about_y_axis()
+    line = Segment(
+        marking.center_of_segment + perpendicular.scale(marking.width / 2),
+        marking.center_of_segment + perpendicular.scale(-marking.width / 2),
+    )
+    green = lerp_2d(line.start, line.end, 0.2)
+    yellow = lerp_2d(line.start, line.end, 0.5)
+    red = lerp_2d(line.start, line.end, 0.8)
+    radius = marking.height * 0.4
+    draw_segment(painter, Segment(red, green), marking.height)
+    draw_circle(painter, Circle(green.x, green.y, radius), QColor(0, 100, 0))
+    draw_circle(painter, Circle(yellow.x, yellow.y, radius), QColor(100, 100, 0))
+    draw_circle(painter, Circle(red.x, red.y, radius), QColor(100, 0, 0))
+    if marking.state == "green":
+        draw_circle(painter, Circle(green.x, green.y, radius), QColor(0, 255, 0))
+    elif marking.state == "yellow":
+        draw_circle(painter, Circle(yellow.x, yellow.y, radius), QColor(255, 255, 0))
+    elif marking.state == "red":
+        draw_circle(painter, Circle(red.x, red.y, radius), QColor(255, 0, 0))
+
+
+def draw_yield_marking(painter: QPainter, marking: Marking) -> None:
+    """Draw the given yield marking using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        marking (Marking): The yield marking to draw.
+    """
+    _draw_borders(painter, marking)
+    _draw_text(painter, marking, "YIELD", 20, 3)
@@ -0,0 +1,176 @@
+"""This module contains functions that draw primitives and graphs using a QPainter."""
+
+from PyQt6.QtCore import Qt, QPointF, QLineF
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF
+from src.primitives.point import Point
+from src.primitives.segment import Segment
+from src.primitives.polygon import Polygon
+from src.primitives.circle import Circle
+from src.primitives.envelope import Envelope
+from src.maths.graph import Graph
+
+
+def draw_point(
+    painter: QPainter,
+    point: Point,
+    thickness: int = 1,
+    color: QColor = QColor(0, 0, 0),
+) -> None:
+    """Draw the given point using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        point (Point): The point to draw.
+        thickness (int, optional): the size of the point. Defaults to 1.
+        color (QColor, optional): the color to paint the point. Defaults to QColor(0, 0, 0).
+    """
+    pen = QPen(color)
+    pen.setWidth(thickness)
+    painter.setPen(pen)
+    painter.drawPoint(QPointF(point.x, point.y))
+
+
+def draw_segment(
+    painter: QPainter,
+    segment: Segment,
+    width: float = 0,
+    cap_style: Qt.PenCapStyle = Qt.PenCapStyle.RoundCap,
+    dash_style: list | None = None,
+    color: QColor = QColor(0, 0, 0),
+    style: Qt.PenStyle = Qt.PenStyle.SolidLine,
+) -> None:
+    """Draw the given segment using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        segment (Segment): The segment to draw.
+        width (float, optional): The width of the line to paint. Defaults to 0.
+        cap_style (Qt.PenCapStyle, optional): The style of caps of the segment to paint.
+        Defaults to Qt.PenCapStyle.RoundCap.
+        dash_style (list | None, optional): The style of the dash pattern.
+        None or empty list to draw a solid segment. Defaults to None.
+        color (QColor, optional): The color to paint the point. Defaults to QColor(0, 0, 0).
+        style (Qt.PenStyle, optional): The style of the segment itself to paint.
+        Defaults to Qt.PenStyle.SolidLine.
+    """
+    line = QLineF(segment.start.x, segment.start.y, segment.end.x, segment.end.y)
+    pen = QPen(color, width, style)
+    pen.setCapStyle(cap_style)
+    if dash_style:
+        pen.setDashPattern(dash_style)
+    painter.setPen(pen)
+    painter.drawLine(line)
+
+
+def draw_polygon(
+    painter: QPainter,
+    polygon: Polygon,
+    color: QColor = QColor(0, 0, 0),
+    style: Qt.BrushStyle = Qt.BrushStyle.SolidPattern,
+    join_style: Qt.PenJoinStyle = Qt.PenJoinStyle.MiterJoin,
+    cap_style: Qt.PenCapStyle = Qt.PenCapStyle.RoundCap,
+    dash_style: list | None = None,
+    outline_width: float = -1,
+    outline_color: QColor = QColor(0, 0, 0),
+    outline_style: Qt.PenStyle = Qt.PenStyle.SolidLine,
+) -> None:
+    """Draw the given polygon using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        polygon (Polygon): The polygon to draw.
+        color (QColor, optional): The color to paint the point. Defaults to QColor(0, 0, 0).
+        style (Qt.BrushStyle, optional): The style of fill inside of the polygon.
+        Defaults to Qt.BrushStyle.SolidPattern.
+        join_style (Qt.PenJoinStyle, optional): The style of joining the segments of the
+        polygon. Defaults to Qt.PenJoinStyle.MiterJoin.
+        cap_style (Qt.PenCapStyle, optional): The style of the cap of each segment of the
+        polygon. Defaults to Qt.PenCapStyle.RoundCap.
+        dash_style (list | None, optional): The style of the dash pattern. Defaults to None.
+        outline_width (float, optional): The width of the outer lines of the polygon to paint.
+        Defaults to -1.
+        outline_color (QColor, optional): The color of the outer lines of the polygon to paint.
+        Defaults to QColor(0, 0, 0).
+        outline_style (Qt.PenStyle, optional): The style of the outer lines of the polygon to
+        paint. Defaults to Qt.PenStyle.SolidLine.
+    """
+    points = []
+    for point in polygon.points:
+        points.append(QPointF(point.x, point.y))
+    pen = QPen(outline_color, outline_width, outline_style)
+    pen.setCapStyle(cap_style)
+    pen.setJoinStyle(join_style)
+    if dash_style:
+        pen.setDashPattern(dash_style)
+    painter.setPen(pen)
+    painter.setBrush(QBrush(color, style))
+    painter.drawPolygon(QPolygonF(points))
+
+
+def draw_circle(
+    painter: QPainter,
+    circle: Circle,
+    color: QColor | None = None,
+    style: Qt.BrushStyle = Qt.BrushStyle.SolidPattern,
+    transparency: float = 1,
+    outline_thickness: int = 1,
+    outline_color: QColor = QColor(0, 0, 0),
+    outline_style: Qt.PenStyle = Qt.PenStyle.SolidLine,
+) -> None:
+    """Draw the given circle using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        circle (Circle): The circle to draw.
+        color (QColor | None, optional): The color to paint the circle. Defaults to None.
+        style (Qt.BrushStyle, optional): The style of the circle to paint.
+        Defaults to Qt.BrushStyle.SolidPattern.
+        transparency (float, optional): The transparency of the circle to draw. Defaults to 1.
+        outline_thickness (int, optional): The thickness of the outline of the circle.
+        Defaults to 1.
+        outline_color (QColor, optional): The color of the outline of the circle.
+        Defaults to QColor(0, 0, 0).
+        outline_style (Qt.PenStyle, optional): The outline style to paint the circle.
+        Defaults to Qt.PenStyle.SolidLine.
+    """
+    painter.save()
+    painter.setOpacity(transparency)
+    painter.setPen(QPen(outline_color, outline_thickness, outline_style))
+    if color:
+        painter.setBrush(QBrush(color, style))
+    painter.drawEllipse(
+        QPointF(circle.center.x, circle.center.y), circle.radius, circle.radius
+    )
+    painter.restore()
+
+
+def draw_envelope(painter: QPainter, envelope: Envelope, *args, **kwargs) -> None:
+    """Draw the given envelope using the given painter. Other arguments are passed to
+    draw_polygon.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        envelope (Envelope): The envelope to draw.
+    """
+    draw_polygon(painter, envelope.polygon, *args, **kwargs)
+
+
+def draw_graph(painter: QPainter, graph: Graph, zoom: float) -> None:
+    """Draw the given graph using the given painter.
+    It also changes the drawing size based on the given zoom.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        graph (Graph): The graph to draw.
+        zoom (float): The amount of zoom.
+    """
+    for segment in graph.segments:
+        draw_segment(painter, segment, zoom * 3)
+    for point in graph.points:
+        draw_circle(
+            painter,
+            Circle(point.x, point.y, zoom * 10),
+            QColor(0, 0, 0),
+            outline_thickness=zoom,
+            transparency=0.4,
+        )
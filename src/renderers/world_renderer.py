@@ -0,0 +1,54 @@
+"""This module contains a function that draws a world using a QPainter."""
+
+from PyQt6.QtGui import QPainter, QColor
+from src.majors.world import World
+from src.items.building import Building
+from src.primitives.point import Point
+from src.renderers.primitive_renderer import draw_segment, draw_envelope
+from src.renderers.item_renderer import draw_road, draw_building, draw_tree
+from src.renderers.marking_renderer import draw_marking
+
+
+def draw_world(
+    painter: QPainter,
+    world: World,
+    view_point: Point,
+    render_radius: float = 1000,
+) -> None:
+    """Draw the given world using the given painter.
+
+    Args:
+        painter (QPainter): The painter is used for drawing.
+        world (World): The world to draw.
+        view_point (Point): The center of the viewport.
+        render_radius (float, optional): Objects that are outside of this radius relative to
+        view_point will not draw. Defaults to 1000.
+    """
+    for envelope in world.road_network["envelopes"]:
+        draw_envelope(
+            painter,
+            envelope,
+            color=QColor(51, 51, 51),
+            outline_width=15,
+            outline_color=QColor(51, 51, 51),
+        )
+    for segment in world.road_network["outer_lines"]:
+        draw_segment(painter, segment, color=QColor(255, 255, 255), width=5)
+    for road in world.roads:
+        draw_road(painter, road)
+    for marking in world.markings:
+        if marking.type != "start":
+            draw_marking(painter, marking)
+    items = []
+    for building in world.buildings:
+        if building.base.distance_to_point(view_point) < render_radius:
+            items.append(building)
+    for tree in world.trees:
+        if tree.base.distance_to_point(view_point) < render_radius:
+            items.append(tree)
+    items.sort(reverse=True, key=lambda item: item.base.distance_to_point(view_point))
+    for item in items:
+        if isinstance(item, Building):
+            draw_building(painter, item, view_point)
+        else:
+            draw_tree(painter, item, view_point)
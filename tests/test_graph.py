@@ -0,0 +1,25 @@
+"""Tests of the Graph class."""
+
+from src.maths.graph import Graph
+from src.primitives.point import Point
+from src.primitives.segment import Segment
+
+
+def test_removal_keeps_the_lists_and_indexes_in_step():
+    """Removing points and segments from the middle of the lists leaves every other point and
+    segment findable."""
+    points = [Point(i, i % 3) for i in range(10)]
+    graph = Graph(points, [Segment(points[i], points[i + 1]) for i in range(9)])
+    graph.remove_point(points[4])
+    graph.remove_segment(Segment(points[0], points[1]))
+    graph.remove_point(Point(7, 1))
+    assert len(graph.points) == 8
+    assert {(point.x, point.y) for point in graph.points} == {
+        (i, i % 3) for i in range(10) if i not in (4, 7)
+    }
+    assert len(graph.segments) == 4
+    for point in graph.points:
+        assert graph.find_point(point) is point
+    for segment in graph.segments:
+        assert graph.find_segment(segment) is segment
+    assert graph.neighbors(points[9]) == [points[8]]
@@ -0,0 +1,30 @@
+"""Tests of the Trainer class."""
+
+import pytest
+from src.primitives.point import Point
+from src.primitives.segment import Segment
+from src.majors.world import World
+from src.majors.trainer import Trainer
+
+
+def test_world_without_start_is_rejected():
+    """A world without start markings and roads gives the cars nowhere to start."""
+    world = World()
+    world.generate()
+    with pytest.raises(ValueError, match="no start marking and no road"):
+        Trainer(world)
+
+
+def test_route_fitness_without_target_is_rejected():
+    """Route fitness measures nothing in a world whose roads have no target marking."""
+    world = World()
+    world.add_roads(
+        [Segment(Point(0, 0), Point(1000, 0)), Segment(Point(500, -500), Point(500, 500))],
+        1,
+        1,
+        False,
+    )
+    world.generate()
+    assert Trainer(world).start_poses
+    with pytest.raises(ValueError, match="needs a target marking"):
+        Trainer(world, route_fitness=True)
@@ -0,0 +1,97 @@
+"""This module trains cars without opening a window. Run it with --help to see the options."""
+
+from argparse import ArgumentParser
+from json import load
+from random import seed
+from src.brains.neural_network import NeuralNetwork
+from src.majors.world import World
+from src.majors.trainer import Trainer
+from src.maths import kernel
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Train self-driving cars without a window.")
+    parser.add_argument(
+        "--world", default=None, help="The world file. Defaults to the world backup."
+    )
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--population", type=int, default=100)
+    parser.add_argument("--ticks", type=int, default=3000, help="Ticks per generation.")
+    parser.add_argument("--mutation", type=float, default=0.1)
+    parser.add_argument(
+        "--brain", default=None, help="A checkpoint to continue training from."
+    )
+    parser.add_argument(
+        "--decision-interval",
+        type=int,
+        default=1,
+        help="Ticks between two sensor sweeps and brain runs of a car.",
+    )
+    parser.add_argument(
+        "--stagger-decisions",
+        action="store_true",
+        help="Spread the decisions of the cars over the ticks of the decision interval.",
+    )
+    parser.add_argument(
+        "--route-fitness",
+        action="store_true",
+        help="Score cars by how much nearer to a target marking they get along the roads.",
+    )
+    parser.add_argument(
+        "--traffic",
+        type=int,
+        default=0,
+        help="Traffic cars driving on the lanes of the roads for the cars to avoid.",
+    )
+    parser.add_argument("--output", default="data/training")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--geometry",
+        choices=kernel.BACKENDS,
+        default=kernel.get_backend(),
+        help="The backend of the geometry kernel.",
+    )
+    parser.add_argument(
+        "--verify-geometry",
+        action="store_true",
+        help="Record sampled geometry calls and compare both backends on them at the end.",
+    )
+    arguments = parser.parse_args()
+    if arguments.decision_interval < 1:
+        parser.error("--decision-interval must be at least 1.")
+    if arguments.traffic < 0:
+        parser.error("--traffic must not be negative.")
+    seed(arguments.seed)
+    kernel.set_backend(arguments.geometry)
+    if arguments.verify_geometry:
+        kernel.start_recording(sample_every=100)
+    world = World()
+    world.load(arguments.world)
+    world.generate()
+    brain = None
+    if arguments.brain:
+        with open(arguments.brain, "rt", encoding="UTF-8") as file:
+            brain = NeuralNetwork([])
+            brain.load(load(file)["brain"])
+    try:
+        trainer = Trainer(
+            world,
+            arguments.population,
+            arguments.ticks,
+            arguments.mutation,
+            brain,
+            arguments.decision_interval,
+            arguments.stagger_decisions,
+            arguments.route_fitness,
+            arguments.traffic,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    trainer.train(arguments.generations, arguments.output)
+    if arguments.verify_geometry:
+        for name, entry in kernel.verify(kernel.stop_recording()).items():
+            print(
+                f"{name}: {entry['calls']} calls, {entry['inexact']} not bit-identical, "
+                f"{entry['divergences']} divergent, "
+                f"largest difference {entry['max_difference']:.3g}"
+            )